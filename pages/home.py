@@ -8,18 +8,23 @@
 """
 
 import streamlit as st
-import yfinance as yf
 from src.utils.utils import set_page_state
+from src.utils.market_data import get_market_data_provider
+from src.utils.screener_refresher import ScreenerRefresher
 
 CHUNK_SIZE = 5
 
 
-@st.cache_data(ttl="5s", show_spinner="Loading Stock Screener")
+@st.cache_resource
+def get_screener_refresher():
+    """One background refresher per process; every session reads its latest snapshot."""
+    return ScreenerRefresher(get_market_data_provider()).start()
+
+
 def get_data():
-    """Fetches fresh gainers and losers data from Yahoo Finance."""
-    best_gainers = yf.screen("day_gainers", sortField='percentchange', sortAsc=True)
-    worst_losers = yf.screen("day_losers", sortField='percentchange', sortAsc=True)
-    return best_gainers, worst_losers
+    """Returns the latest gainers, losers and global index quotes from the shared refresher."""
+    with st.spinner("Loading Stock Screener"):
+        return get_screener_refresher().wait_for_snapshot(timeout=15)
 
 
 def get_next_index(key, max_length):
@@ -30,8 +35,7 @@ def get_next_index(key, max_length):
     return index
 
 
-def display_trending_items(screen_data, columns, start_index):
-    quotes = screen_data["quotes"]
+def display_trending_items(quotes, columns, start_index):
     for i, quote in enumerate(quotes[start_index:start_index + CHUNK_SIZE]):
         with columns[i]:
             try:
@@ -50,16 +54,19 @@ def display_trending_items(screen_data, columns, start_index):
 
 @st.fragment(run_every="10s")
 def trending_display():
-    gainers, losers = get_data()
+    snapshot = get_data()
+
     st.subheader("Global Indices")
+    index_start = get_next_index("index_index", len(snapshot.indices))
+    display_trending_items(snapshot.indices, st.columns(CHUNK_SIZE), index_start)
 
     st.subheader("Top performing stocks today")
-    gainer_index = get_next_index("gainer_index", len(gainers["quotes"]))
-    display_trending_items(gainers, st.columns(CHUNK_SIZE), gainer_index)
+    gainer_index = get_next_index("gainer_index", len(snapshot.gainers))
+    display_trending_items(snapshot.gainers, st.columns(CHUNK_SIZE), gainer_index)
 
     st.subheader("Top underperforming stocks today")
-    loser_index = get_next_index("loser_index", len(losers["quotes"]))
-    display_trending_items(losers, st.columns(CHUNK_SIZE), loser_index)
+    loser_index = get_next_index("loser_index", len(snapshot.losers))
+    display_trending_items(snapshot.losers, st.columns(CHUNK_SIZE), loser_index)
 
 
 # Home page description
@@ -11,13 +11,27 @@ import datetime
 import numpy as np
 import streamlit as st
 from zoneinfo import ZoneInfo
-from src.utils.utils import set_page_state, yahoo_data
+from src.utils.utils import set_page_state
+from src.utils.market_data import get_market_data_provider
+from src.utils.single_flight import get_single_flight
+from src.utils.bar_store import BarStore
+from src.utils.instrument_loader import InstrumentDataLoader
 from streamlit_javascript import st_javascript
 from src.components.custom_metric import option_metric
 from src.components.historial_chart import historical_chart
-from src.components.heatmap_graph import plot_heatmap
+from src.components.heatmap_graph import plot_heatmap, quantized_range, HeatmapGridCache, SPOT_QUANTUM, \
+    VOL_QUANTUM
+from src.components.volatility_surface import plot_volatility_surface
 from src.core.black_scholes_model import BlackScholesModel
-from src.core.monte_carlo_simulation import MonteCarloSimulation
+from src.core.option_chain import fetch_option_chain, price_option_chain, build_volatility_surface
+from src.core.option_portfolio import OptionPortfolio, PositionLeg, LEG_TYPES, strategy_legs
+from src.components.scenario_graph import plot_pnl_profile, plot_pnl_heatmap
+from src.components.fan_chart import plot_fan_chart
+from src.core.monte_carlo_simulation import MonteCarloSimulation, create_process_pool
+from src.core.monte_carlo_option_pricer import MonteCarloOptionPricer, BARRIER_TYPES, CHUNK_CELLS
+
+MC_SEED = 0
+MC_MAX_WORKERS = 4
 
 # Load Components
 set_page_state("pages/instrument.py")
@@ -25,13 +39,37 @@ instrument_code = st.session_state.get("code", "NONE")
 st.query_params.code = instrument_code
 
 
-@st.cache_data(show_spinner="Fetching instrument data...")
-def get_instrument_data(symbol: str):
-    ticker = yahoo_data(symbol)
-    return {
-        "info": ticker.info,
-        "history": ticker.history(period="max")
-    }
+@st.cache_resource
+def get_instrument_loader():
+    """Process-wide loader that fetches instrument info and history concurrently."""
+    return InstrumentDataLoader(get_market_data_provider(), BarStore(), get_single_flight())
+
+
+@st.cache_resource(max_entries=1)
+def get_simulation_pool():
+    """Process-wide pool for large Monte Carlo runs, created once and shared by every session."""
+    return create_process_pool(MC_MAX_WORKERS)
+
+
+@st.cache_resource
+def get_heatmap_cache():
+    """Process-wide cache of priced heatmap grids, shared by every session."""
+    return HeatmapGridCache()
+
+
+@st.cache_data(show_spinner="Fetching option chain...", max_entries=64)
+def get_option_chain(symbol: str, snapshot: str):
+    """Every listed expiry of a symbol, fetched upstream at most once per symbol and snapshot."""
+    return fetch_option_chain(get_market_data_provider(), symbol)
+
+
+@st.cache_data(show_spinner="Pricing option chain...", max_entries=64)
+def get_option_chain_surface(symbol: str, snapshot: str, current_price: float, interest_rate: float,
+                             volatility: float):
+    """Price the cached option chain and build its volatility surface; changing the model inputs only reprices."""
+    priced_chain = price_option_chain(get_option_chain(symbol, snapshot), current_price, interest_rate, volatility,
+                                      snapshot)
+    return priced_chain, build_volatility_surface(priced_chain, current_price)
 
 
 @st.cache_data(show_spinner="Loading market data...")
@@ -111,7 +149,107 @@ def display_summary_statistics(stock_data):
         st.metric("52-Week Low", f"${low_52_w:.2f}")
 
 
-def show_bs_model():
+def calculate_historical_volatility(stock_data, window=252):
+    """Annualised standard deviation of daily log returns over the last `window` sessions."""
+    log_returns = np.log(stock_data["Close"].tail(window + 1)).diff().dropna()
+    return float(log_returns.std() * np.sqrt(252))
+
+
+def show_option_chain(stock_data):
+    current_price = float(stock_data.iloc[-1]["Close"])
+    historical_volatility = calculate_historical_volatility(stock_data)
+
+    input_column_1, input_column_2 = st.columns(2)
+    interest_rate = input_column_1.number_input(label="Interest rate", value=0.05, key="chain_interest_rate")
+    volatility = input_column_2.number_input(label="Model Volatility", value=round(historical_volatility, 4),
+                                             key="chain_volatility")
+
+    # Quotes are re-fetched at most every 15 minutes per symbol
+    snapshot = datetime.datetime.now().replace(second=0, microsecond=0)
+    snapshot = snapshot.replace(minute=snapshot.minute - snapshot.minute % 15).isoformat()
+    priced_chain, surface = get_option_chain_surface(instrument_code, snapshot, current_price, interest_rate,
+                                                     volatility)
+
+    if priced_chain.empty:
+        st.warning(f"No listed options found for {instrument_code}.")
+        return
+
+    st.plotly_chart(plot_volatility_surface(surface), use_container_width=True)
+    st.dataframe(priced_chain, use_container_width=True, hide_index=True)
+
+
+def show_strategy_scenarios(stock_data):
+    current_price = float(stock_data.iloc[-1]["Close"])
+
+    input_column_1, input_column_2, input_column_3, input_column_4 = st.columns(4)
+    strategy = input_column_1.selectbox("Strategy", ["Bull Call Spread", "Bear Put Spread", "Long Straddle",
+                                                     "Iron Condor", "Covered Call"], key="strategy_name")
+    time_to_maturity = input_column_2.number_input("Time to maturity", value=0.25, key="strategy_maturity")
+    volatility = input_column_3.number_input("Volatility", value=round(calculate_historical_volatility(stock_data), 4),
+                                             key="strategy_volatility")
+    interest_rate = input_column_4.number_input("Interest rate", value=0.05, key="strategy_interest_rate")
+
+    default_legs = [{"Type": leg.leg_type, "Quantity": leg.quantity, "Strike": leg.strike,
+                     "Time to maturity": leg.time_to_maturity, "Volatility": leg.volatility}
+                    for leg in strategy_legs(strategy, current_price, time_to_maturity, volatility)]
+    edited_legs = st.data_editor(default_legs, num_rows="dynamic", use_container_width=True,
+                                 column_config={"Type": st.column_config.SelectboxColumn(options=LEG_TYPES,
+                                                                                         required=True)},
+                                 key=f"strategy_legs_{strategy}_{time_to_maturity}_{volatility}")
+
+    legs, skipped = [], []
+    for number, row in enumerate(edited_legs, start=1):
+        option_inputs = (row.get("Strike"), row.get("Time to maturity"), row.get("Volatility"))
+        if row.get("Type") not in LEG_TYPES or not row.get("Quantity") or \
+                (row["Type"] != "stock" and not all(value and value > 0 for value in option_inputs)):
+            skipped.append(str(number))
+            continue
+        legs.append(PositionLeg(row["Type"], row["Quantity"], row.get("Strike") or 0.0,
+                                row.get("Time to maturity") or 0.0, row.get("Volatility") or 0.0))
+    if skipped:
+        st.warning(f"Skipped incomplete leg row(s) {', '.join(skipped)}: choose a type, a non-zero quantity "
+                   f"and, for options, a positive strike, maturity and volatility.")
+    if not legs:
+        st.warning("Add at least one leg to evaluate the position.")
+        return
+
+    with st.expander("⚙️ Scenario Settings", expanded=False):
+        c1, c2, c3 = st.columns(3)
+        spot_shock = c1.slider("Spot Shock (±%)", 1, 50, value=20) / 100
+        vol_shock = c2.slider("Volatility Shock (±)", 0.0, 0.5, value=0.1, step=0.01)
+        horizon_days = c3.slider("Time Decay (days)", 0, max(int(time_to_maturity * 365), 1),
+                                 value=min(30, int(time_to_maturity * 365)))
+
+    spot_shocks = np.linspace(-spot_shock, spot_shock, 101)
+    vol_shocks = np.linspace(-vol_shock, vol_shock, 21)
+    days_elapsed = np.unique(np.linspace(0, horizon_days, 4).round())
+
+    portfolio = OptionPortfolio(legs, current_price, interest_rate)
+    scenarios = portfolio.evaluate_scenarios(spot_shocks, vol_shocks, days_elapsed / 365)
+    spot_axis = current_price * (1 + spot_shocks)
+
+    # Vol shocks are symmetric, so the middle slice is the unshocked volatility
+    col1, col2 = st.columns(2, gap="medium")
+    col1.plotly_chart(plot_pnl_profile(spot_axis, scenarios["pnl"][:, len(vol_shocks) // 2, :], days_elapsed),
+                      use_container_width=True, config={'displayModeBar': False})
+    col2.plotly_chart(plot_pnl_heatmap(spot_axis, vol_shocks, scenarios["pnl"][:, :, -1]),
+                      use_container_width=True, config={'displayModeBar': False})
+
+    today = {key: scenarios[key][len(spot_shocks) // 2, len(vol_shocks) // 2, 0] for key in scenarios}
+    metric_columns = st.columns(5)
+    for column, key in zip(metric_columns, ["value", "delta", "gamma", "vega", "theta"]):
+        column.metric(f"Position {key.capitalize()}", f"{today[key]:.2f}")
+
+
+def show_bs_model(stock_data):
+    mode = st.radio("Mode", ["Single Option", "Option Chain", "Strategy Scenarios"], horizontal=True, key="bs_mode")
+    if mode == "Option Chain":
+        show_option_chain(stock_data)
+        return
+    if mode == "Strategy Scenarios":
+        show_strategy_scenarios(stock_data)
+        return
+
     col1, col2 = st.columns(2, gap="medium")
     with col1:
         st.markdown("#### Option Pricing Parameters")
@@ -126,8 +264,8 @@ def show_bs_model():
         time_to_maturity = st.number_input(label="Time to maturity", value=1, key="bs_time_to_maturity")
 
     bs_model = BlackScholesModel(time_to_maturity, strike, current_price, volatility, interest_rate)
-    call_price, put_price = bs_model.calculate_prices()
-    greeks = bs_model.calculate_greeks()
+    greeks = bs_model.calculate_all()
+    call_price, put_price = greeks["call_price"], greeks["put_price"]
 
     with col2:
         st.markdown(f"#### Computed Prices: Gamma={greeks["gamma"]:.2f}, Vega={greeks["vega"]:.2f}")
@@ -147,11 +285,12 @@ def show_bs_model():
         vol_max = c1.slider('Max Volatility', 0.01, 1.0, value=volatility * 1.5, step=0.01)
         spot_min = c2.number_input('Min Spot Price', 0.01, value=current_price * 0.8, step=0.01)
         spot_max = c2.number_input('Max Spot Price', 0.01, value=current_price * 1.2, step=0.01)
-        spot_range = np.linspace(spot_min, spot_max, 10)
-        vol_range = np.linspace(vol_min, vol_max, 10)
+        resolution = st.slider('Grid Resolution', 10, 200, value=10, step=10)
+        spot_range = quantized_range(spot_min, spot_max, resolution, SPOT_QUANTUM)
+        vol_range = quantized_range(vol_min, vol_max, resolution, VOL_QUANTUM)
 
-    fig_call, fig_put = plot_heatmap(bs_model, spot_range, vol_range, strike)
     heat_col1, heat_col2 = st.columns(2, gap="medium")
+    fig_call, fig_put = plot_heatmap(bs_model, spot_range, vol_range, strike, grid_cache=get_heatmap_cache())
     heat_col1.plotly_chart(fig_call, use_container_width=True, config={'displayModeBar': False})
     heat_col2.plotly_chart(fig_put, use_container_width=True, config={'displayModeBar': False})
 
@@ -160,28 +299,111 @@ def plot_historical_chart(stock_data):
     st.plotly_chart(historical_chart(stock_data), use_container_width=True)
 
 
-def show_monte_carlo_page():
+@st.cache_data(show_spinner="Pricing option paths...", max_entries=32)
+def price_path_dependent_option(option_style, option_type, strike, current_price, time_to_maturity, volatility,
+                                interest_rate, barrier, barrier_type, num_paths, num_steps):
+    pricer = MonteCarloOptionPricer(time_to_maturity, strike, current_price, volatility, interest_rate,
+                                    num_paths=num_paths, num_steps=num_steps, seed=0)
+    return pricer.price(option_style, option_type, barrier, barrier_type)
+
+
+def show_path_dependent_pricing(stock_data):
+    current_price = float(stock_data.iloc[-1]["Close"])
+
+    c1, c2, c3, c4 = st.columns(4)
+    option_style = c1.selectbox("Option Style", ["asian", "barrier", "lookback"], format_func=str.capitalize,
+                                key="mc_option_style")
+    option_type = c1.selectbox("Option Type", ["call", "put"], format_func=str.capitalize, key="mc_option_type")
+    strike = c2.number_input("Strike", value=round(current_price, 2), key="mc_strike")
+    time_to_maturity = c2.number_input("Time to maturity", value=1.0, key="mc_time_to_maturity")
+    volatility = c3.number_input("Volatility", value=round(calculate_historical_volatility(stock_data), 4),
+                                 key="mc_volatility")
+    interest_rate = c3.number_input("Interest rate", value=0.05, key="mc_interest_rate")
+    num_paths = c4.number_input("Paths", min_value=1_000, max_value=200_000, value=50_000, step=10_000,
+                                key="mc_paths")
+    num_steps = c4.number_input("Monitoring Steps", min_value=1, max_value=504, value=252, key="mc_steps")
+
+    barrier, barrier_type = None, "up-and-out"
+    if option_style == "barrier":
+        b1, b2 = st.columns(2)
+        barrier_type = b1.selectbox("Barrier Type", BARRIER_TYPES, key="mc_barrier_type")
+        default_barrier = current_price * (1.2 if barrier_type.startswith("up") else 0.8)
+        barrier = b2.number_input("Barrier", value=round(default_barrier, 2), key="mc_barrier")
+
+    result = price_path_dependent_option(option_style, option_type, strike, current_price, time_to_maturity,
+                                         volatility, interest_rate, barrier, barrier_type, num_paths, num_steps)
+    variance_reduction = (result["plain_standard_error"] / result["standard_error"]) ** 2 \
+        if result["standard_error"] > 0 else float("nan")
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Option Price", f"${result['price']:.4f}", f"± {result['standard_error']:.4f} (1 s.e.)",
+              delta_color="off")
+    m2.metric("Without Control Variate", f"${result['plain_price']:.4f}",
+              f"± {result['plain_standard_error']:.4f} (1 s.e.)", delta_color="off")
+    m3.metric("Variance Reduction", f"{variance_reduction:.1f}x")
+
+
+@st.cache_data(show_spinner="Simulating price paths...", max_entries=32)
+def simulate_fan_chart(symbol, last_date, _stock_data, look_forward, number_of_simulations, path_model, look_back,
+                       antithetic, sample_paths):
+    """
+    Fan chart of a seeded simulation, cached per symbol, last bar and settings (the history
+    itself is not hashed; `last_date` stands in for it).
+    """
+    mc_sim = MonteCarloSimulation(_stock_data, look_forward, number_of_simulations, seed=MC_SEED,
+                                  path_model=path_model, look_back=look_back, antithetic=antithetic)
+
+    # Only percentile bands and a few sample paths are sent to the browser, whatever the simulation count;
+    # large runs are split into blocks of a fixed number of path values, folded into streaming statistics
+    block_size = max(CHUNK_CELLS // look_forward, 1)
+    if number_of_simulations > block_size:
+        mc_sim.simulate_parallel(workers=MC_MAX_WORKERS, block_size=block_size, streaming=True,
+                                 num_samples=sample_paths, executor=get_simulation_pool())
+    else:
+        mc_sim.simulate()
+    return mc_sim.get_fan_chart(num_samples=sample_paths)
+
+
+def show_monte_carlo_page(stock_data):
     st.subheader("📈 Monte Carlo Simulation ")
+    mode = st.radio("Mode", ["Price Paths", "Path-Dependent Options"], horizontal=True, key="mc_mode")
+    if mode == "Path-Dependent Options":
+        show_path_dependent_pricing(stock_data)
+        return
+
     with st.expander("⚙️ Settings", expanded=False):
-        number_of_simulations = st.number_input('Number of Simulations', min_value=1, value=30, step=10, max_value=300)
-        look_back = st.number_input('Look Back Period', min_value=1, value=30, step=5, max_value=100)
-        look_forward = st.number_input('Look Forward Period', min_value=1, value=30, step=30, max_value=365*3)
+        c1, c2 = st.columns(2)
+        number_of_simulations = c1.number_input('Number of Simulations', min_value=1, value=1_000, step=1_000,
+                                                max_value=1_000_000)
+        look_back = c1.number_input('Look Back Period', min_value=2, value=30, step=5, max_value=100)
+        look_forward = c1.number_input('Look Forward Period', min_value=1, value=30, step=30, max_value=365*3)
+        path_model = c2.selectbox('Path Model', ["bootstrap", "gbm"],
+                                  format_func={"bootstrap": "Bootstrapped Returns",
+                                               "gbm": "Geometric Brownian Motion"}.get)
+        antithetic = c2.checkbox('Antithetic Variates', value=False)
+        sample_paths = c2.slider('Sample Paths', 0, 50, value=10)
 
-    mc_sim = MonteCarloSimulation(get_instrument_data(instrument_code)["history"], look_forward, number_of_simulations)
-    mc_sim.simulate()
-    st.line_chart(mc_sim.get_simulation_results(), use_container_width=True)
+    fan_chart = simulate_fan_chart(instrument_code, str(stock_data.index[-1]), stock_data, look_forward,
+                                   number_of_simulations, path_model, look_back, antithetic, sample_paths)
+    st.plotly_chart(plot_fan_chart(fan_chart), use_container_width=True)
 
 
 def show_info():
-    instrument_data = get_instrument_data(instrument_code)
-    if instrument_data is None:
+    # Info and history are fetched concurrently, once per run; each section renders as soon as its part
+    # arrives and the tabs reuse the same history
+    futures = get_instrument_loader().submit(instrument_code)
+    with st.spinner("Fetching instrument data..."):
+        stock_info = futures["info"].result()
+    if not stock_info:
         st.warning(f"Instrument {instrument_code} not found.")
         return
-
-    stock_info = instrument_data["info"]
-    stock_data = instrument_data["history"]
-
     display_instrument(stock_info)
+
+    with st.spinner("Fetching instrument history..."):
+        stock_data = futures["history"].result()
+    if stock_data.empty:
+        st.warning(f"No price history found for {instrument_code}.")
+        return
     display_summary_statistics(stock_data)
 
     # Use distinct tab names
@@ -192,10 +414,10 @@ def show_info():
             plot_historical_chart(stock_data)
 
     with bs_model_tab:
-        show_bs_model()
+        show_bs_model(stock_data)
 
     with monte_carlo_tab:
-        show_monte_carlo_page()
+        show_monte_carlo_page(stock_data)
 
 
 if __name__ == "__main__":
@@ -7,45 +7,20 @@ Author: Joshua David Golafshan
 Description: Streamlit app to list and filter all available financial instruments.
 """
 
-import orjson
-import pandas as pd
 import streamlit as st
 from src.utils.utils import set_page_state
+from src.utils.ticker_resources import get_directory_version, load_clean_ticker_data, get_search_index, \
+    get_sort_orders, sort_rows
 
 
-@st.cache_data(show_spinner="Loading ticker data")
-def load_clean_ticker_data():
-    """Load and clean ticker data from JSON file."""
-    with open("static/tickers.json") as f:
-        data = orjson.loads(f.read())
-    df = pd.DataFrame(data)
-    df.rename(columns={
-        'ticker': 'Ticker',
-        'company_name': 'Company Name',
-        'exchange_name': 'Exchange Name',
-        'exchange_code': 'Exchange Symbol',
-    }, inplace=True)
-    return df
-
-
-def filter_data(df, search_query="", exchange_name_filter="", exchange_symbol_filter=""):
-    """Filter dataframe based on user inputs."""
-    if search_query := search_query.strip().lower():
-        matches = (
-                df["Ticker"].str.lower().str.contains(search_query, na=False) |
-                df["Company Name"].str.lower().str.contains(search_query, na=False) |
-                df["Exchange Name"].str.lower().str.contains(search_query, na=False) |
-                df["Exchange Symbol"].str.lower().str.contains(search_query, na=False)
-        )
-        df = df[matches]
-
-    if exchange_name_filter and exchange_name_filter != "Select an Exchange Name":
-        df = df[df["Exchange Name"] == exchange_name_filter]
-
-    if exchange_symbol_filter and exchange_symbol_filter != "Select an Exchange Symbol":
-        df = df[df["Exchange Symbol"] == exchange_symbol_filter]
+def filter_data(index, search_query="", exchange_name_filter="", exchange_symbol_filter=""):
+    """Row positions matching the user inputs, using the prebuilt search index."""
+    if exchange_name_filter == "Select an Exchange Name":
+        exchange_name_filter = ""
+    if exchange_symbol_filter == "Select an Exchange Symbol":
+        exchange_symbol_filter = ""
 
-    return df
+    return index.search(search_query, exchange_name_filter or None, exchange_symbol_filter or None)
 
 
 def main():
@@ -59,39 +34,69 @@ def main():
         "filter_exchange_name": "Select an Exchange Name",
         "filter_exchange_symbol": "Select an Exchange Symbol",
         "filter_asset_type": "Select an Asset Type",
+        "instruments_page_number": 1
     }
     for key, val in default_filters.items():
         st.session_state.setdefault(key, val)
 
+    version = get_directory_version()
+    raw_df = load_clean_ticker_data(version)
+    index = get_search_index(version)
+
     dataframe_column, filter_column = st.columns((9, 2))
+    search_input_container, sort_container, direction_container, page_size_container = \
+        dataframe_column.columns((3, 2, 1, 1))
 
     # Main table display
     with dataframe_column:
-        col1, col2 = st.columns([0.25, 0.75])
-        col1.text_input(label="Search (Ticker, Company, Exchange)", value=st.session_state.get("filter_search", ""),
-                        key="filter_search", placeholder="Search Instruments")
-
-        raw_df = load_clean_ticker_data()
-        filtered_df = filter_data(
-            raw_df,
+        search_input_container.text_input(label="Search (Ticker, Company, Exchange)",
+                                          value=st.session_state.get("filter_search", ""),
+                                          key="filter_search", placeholder="Search Instruments")
+        sort_column = sort_container.selectbox("Sort By", options=list(raw_df.columns), index=0)
+        descending = direction_container.selectbox("Order", options=["Ascending", "Descending"]) == "Descending"
+        batch_size = page_size_container.selectbox("Page Size", options=[25, 50, 100], index=1)
+
+        rows = filter_data(
+            index,
             st.session_state.get("filter_search", ""),
             st.session_state.get("filter_exchange_name", ""),
             st.session_state.get("filter_exchange_symbol", "")
         )
+        sub_entries = len(rows)
+
+        # Pagination Setup: any change to the filters, sort or page size starts again from page 1
+        view = (st.session_state["filter_search"], st.session_state["filter_exchange_name"],
+                st.session_state["filter_exchange_symbol"], sort_column, descending, batch_size)
+        if st.session_state.get("instruments_view") != view:
+            st.session_state["instruments_view"] = view
+            st.session_state["instruments_page_number"] = 1
+        total_pages = max((sub_entries - 1) // batch_size + 1, 1)
+        if st.session_state["instruments_page_number"] > total_pages:
+            st.session_state["instruments_page_number"] = total_pages
+
         pagination = st.container()
 
+        bottom_menu = st.columns((7, 4, 2))
+        with bottom_menu[2]:
+            current_page = st.number_input("Page Number", min_value=1, max_value=total_pages, step=1,
+                                           key="instruments_page_number")
+
+        with bottom_menu[0]:
+            start_idx = (current_page - 1) * batch_size
+            end_idx = min(start_idx + batch_size, sub_entries)
+            st.markdown(f"Showing **{min(start_idx + 1, sub_entries)}** to **{end_idx}** of **{sub_entries}** "
+                        f"entries ({len(raw_df)} in total)")
+
     # Filter sidebar
     with filter_column:
         st.subheader("Filter Options")
-        exchange_names = sorted(raw_df["Exchange Name"].dropna().unique().tolist())
-        exchange_symbols = sorted(raw_df["Exchange Symbol"].dropna().unique().tolist())
         asset_types = ["Select an Asset Type", "Not Implemented"]
 
         with st.form(key="filter_form", border=False):
-            st.selectbox(label="Filter by Exchange Name", options=(["Select an Exchange Name"] + exchange_names),
+            st.selectbox(label="Filter by Exchange Name", options=(["Select an Exchange Name"] + index.exchange_names),
                          key="filter_exchange_name")
-            st.selectbox(label="Filter by Exchange Symbol", options=["Select an Exchange Symbol"] + exchange_symbols,
-                         key="filter_exchange_symbol")
+            st.selectbox(label="Filter by Exchange Symbol",
+                         options=["Select an Exchange Symbol"] + index.exchange_symbols, key="filter_exchange_symbol")
             st.selectbox("Filter by Asset Type", placeholder="Select an Asset Type", options=asset_types,
                          key="filter_asset_type")
 
@@ -106,14 +111,14 @@ def main():
             with apply:
                 st.form_submit_button("Apply Filters")
 
-    st.markdown(f"Showing **{len(filtered_df)}** out of **{len(raw_df)}** entries")
-
     # --- Display Data ---
-    if filtered_df.empty:
+    if not sub_entries:
         pagination.warning("No rows found matching filtering criteria.")
 
     else:
-        pagination.dataframe(filtered_df, use_container_width=True, hide_index=True)
+        # Only the visible page is sliced out and serialized to the browser
+        page_rows = sort_rows(rows, get_sort_orders(version)[sort_column], len(raw_df), descending)[start_idx:end_idx]
+        pagination.dataframe(raw_df.iloc[page_rows], use_container_width=True, hide_index=True)
 
 
 if __name__ == "__main__":
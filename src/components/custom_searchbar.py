@@ -8,9 +8,56 @@
 
 import streamlit as st
 from src.utils.utils import search_logic
+from src.utils.ticker_resources import get_autocomplete, get_directory_version, get_search_popularity
+
+
+def get_suggestions(query: str, limit: int = 6):
+    """Ranked directory suggestions for a query; empty if no ticker directory is available."""
+    try:
+        autocomplete = get_autocomplete(get_directory_version())
+    except FileNotFoundError:
+        return []
+    return autocomplete.suggest(query, limit=limit, popularity=get_search_popularity(st.session_state.get("db_client")))
+
+
+def resolve_search(query: str, suggestions_key: str):
+    """
+    Goes straight to the instrument if the query is a known symbol (or matches nothing in
+    the directory, e.g. an index like ^GSPC); otherwise keeps the suggestions so the user
+    can pick one instead of sending a typo upstream.
+
+    Suggestions are a "did you mean" step after submitting, not as-you-type autocomplete:
+    st.text_input only reports its value on submit (or Enter/blur outside a form), so there
+    is no keystroke event to refresh them from.
+    """
+    suggestions = get_suggestions(query)
+    exact = next((suggestion["ticker"] for suggestion in suggestions
+                  if suggestion["ticker"].upper() == query.strip().upper()), None)
+    if exact or not suggestions:
+        st.session_state.pop(suggestions_key, None)
+        search_logic(exact or query.strip())
+    else:
+        st.session_state[suggestions_key] = {"query": query, "suggestions": suggestions}
+
+
+def show_suggestions(suggestions_key: str):
+    pending = st.session_state.get(suggestions_key)
+    if not pending:
+        return
+
+    st.caption(f"No exact match for **{pending['query']}**. Did you mean:")
+    for i, suggestion in enumerate(pending["suggestions"]):
+        label = f"{suggestion['ticker']} · {suggestion['company_name']} ({suggestion['exchange']})"
+        if st.button(label, key=f"{suggestions_key}_{i}", use_container_width=True):
+            st.session_state.pop(suggestions_key, None)
+            search_logic(suggestion["ticker"])
+    if st.button(f"Search for \"{pending['query']}\" anyway", key=f"{suggestions_key}_raw", type="tertiary"):
+        st.session_state.pop(suggestions_key, None)
+        search_logic(pending["query"].strip())
 
 
 def custom_search_bar(form_key, input_key, col_widths=None):
+    suggestions_key = f"{input_key}_suggestions"
     with st.form(form_key, border=False, clear_on_submit=True):
         cols = st.columns(col_widths, gap="small")
 
@@ -25,4 +72,6 @@ def custom_search_bar(form_key, input_key, col_widths=None):
             submitted = st.form_submit_button('🔍')
 
         if search_query and submitted:
-            search_logic(search_query)
+            resolve_search(search_query, suggestions_key)
+
+    show_suggestions(suggestions_key)
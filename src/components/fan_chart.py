@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+"""
+
+import plotly.graph_objects as go
+
+
+def plot_fan_chart(fan_chart):
+    """
+    Generates a Monte Carlo fan chart (percentile bands + representative paths) using Plotly.
+
+    :param fan_chart: DataFrame from MonteCarloSimulation.get_fan_chart(); "P<n>" columns are
+                      percentile bands (lowest to highest), "Path <n>" columns are sample paths.
+
+    :return: Plotly figure
+    """
+    bands = [column for column in fan_chart.columns if column.startswith("P") and column[1:].isdigit()]
+    bands.sort(key=lambda column: int(column[1:]))
+    paths = [column for column in fan_chart.columns if column.startswith("Path ")]
+
+    fig = go.Figure()
+    for column in paths:
+        fig.add_trace(go.Scatter(x=fan_chart.index, y=fan_chart[column], mode="lines", name=column,
+                                 line=dict(width=1, color="rgba(180, 180, 180, 0.35)"), showlegend=False,
+                                 hoverinfo="skip"))
+
+    # Shade symmetric bands from the outside in: 5-95, then 25-75, ...
+    for i in range(len(bands) // 2):
+        lower, upper = bands[i], bands[-(i + 1)]
+        opacity = 0.15 + 0.15 * i
+        fig.add_trace(go.Scatter(x=fan_chart.index, y=fan_chart[upper], mode="lines", line=dict(width=0),
+                                 showlegend=False, hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=fan_chart.index, y=fan_chart[lower], mode="lines", line=dict(width=0),
+                                 fill="tonexty", fillcolor=f"rgba(0, 150, 255, {opacity})",
+                                 name=f"{lower[1:]}-{upper[1:]}th percentile"))
+
+    if len(bands) % 2:
+        median = bands[len(bands) // 2]
+        fig.add_trace(go.Scatter(x=fan_chart.index, y=fan_chart[median], mode="lines", name="Median",
+                                 line=dict(width=2, color="rgb(0, 150, 255)")))
+
+    fig.update_layout(
+        xaxis_title="Period",
+        yaxis_title="Price",
+        hovermode="x unified",
+    )
+
+    return fig
@@ -6,12 +6,123 @@
     Author: Joshua David Golafshan
 """
 
+import threading
+from collections import OrderedDict
 import numpy as np
 import plotly.graph_objects as go
-from src.core.black_scholes_model import BlackScholesModel
+from src.core.black_scholes_model import price_batch
 
+SPOT_QUANTUM = 0.01
+VOL_QUANTUM = 0.001
 
-def plot_heatmap(bs_model, spot_range, vol_range, strike):
+
+def quantized_range(low: float, high: float, num: int, quantum: float):
+    """
+    Evenly spaced grid over [low, high] with every point snapped to a multiple of `quantum`.
+
+    The endpoints are the lattice points just inside the range, and the interior points are
+    rounded to the lattice, so the grid cache can reuse any cell another grid already priced.
+    When the quantum is too coarse for `num` distinct points the grid has fewer points.
+
+    :param low: Lower end of the range.
+    :param high: Upper end of the range.
+    :param num: Requested number of grid points.
+    :param quantum: Lattice spacing the points are rounded to.
+    :return: Array of at most `num` grid points, all inside [low, high]
+    """
+    low_code = int(np.ceil(low / quantum - 1e-9))
+    high_code = max(int(np.floor(high / quantum + 1e-9)), low_code)
+    num = max(min(num, high_code - low_code + 1), 1)
+    codes = np.rint(np.linspace(low_code, high_code, num)).astype(np.int64)
+    return codes * quantum
+
+
+class HeatmapGridCache:
+    def __init__(self, max_entries: int = 32, spot_quantum: float = SPOT_QUANTUM, vol_quantum: float = VOL_QUANTUM):
+        """
+        Thread-safe LRU cache of priced volatility x spot grids.
+
+        Grids are keyed on the quantized (T, K, r); within a key the last priced grid is
+        kept together with its integer lattice coordinates, so a later request only prices
+        the rows and columns it does not share with that grid.
+
+        :param max_entries: Number of (T, K, r) keys kept before the least recently used is evicted.
+        :param spot_quantum: Spot lattice spacing used to match grid points.
+        :param vol_quantum: Volatility lattice spacing used to match grid points.
+        """
+        self.max_entries = max_entries
+        self.spot_quantum = spot_quantum
+        self.vol_quantum = vol_quantum
+        self._grids = OrderedDict()
+        self._lock = threading.Lock()
+        self.cells_priced = 0
+        self.cells_reused = 0
+
+    def get_prices(self, time_to_maturity, strike, interest_rate, spot_range, vol_range):
+        """
+        Returns call and put price grids (rows = volatility, columns = spot).
+
+        :return: Tuple (call_prices, put_prices); the arrays are shared with the cache and
+                 read-only, copy them before modifying
+        """
+        key = (round(time_to_maturity, 6), round(strike, 6), round(interest_rate, 6))
+        spot_codes = np.rint(np.asarray(spot_range) / self.spot_quantum).astype(np.int64)
+        vol_codes = np.rint(np.asarray(vol_range) / self.vol_quantum).astype(np.int64)
+        spot_values = spot_codes * self.spot_quantum
+        vol_values = vol_codes * self.vol_quantum
+
+        call_prices = np.full((len(vol_codes), len(spot_codes)), np.nan)
+        put_prices = np.full_like(call_prices, np.nan)
+
+        with self._lock:
+            cached = self._grids.get(key)
+            if cached is not None:
+                self._grids.move_to_end(key)
+
+        # Copy every cell whose (vol, spot) lattice point was priced in the cached grid
+        if cached is not None:
+            cached_vol, cached_spot, cached_call, cached_put = cached
+            vol_hit, vol_pos = _lookup(cached_vol, vol_codes)
+            spot_hit, spot_pos = _lookup(cached_spot, spot_codes)
+            rows, cols = np.ix_(np.flatnonzero(vol_hit), np.flatnonzero(spot_hit))
+            src = np.ix_(vol_pos[vol_hit], spot_pos[spot_hit])
+            call_prices[rows, cols] = cached_call[src]
+            put_prices[rows, cols] = cached_put[src]
+        else:
+            vol_hit = np.zeros(len(vol_codes), dtype=bool)
+            spot_hit = np.zeros(len(spot_codes), dtype=bool)
+
+        # Missing cells form new rows (all columns) plus new columns (on the reused rows)
+        cells_priced = 0
+        for rows, cols in ((np.flatnonzero(~vol_hit), np.arange(len(spot_codes))),
+                           (np.flatnonzero(vol_hit), np.flatnonzero(~spot_hit))):
+            if rows.size and cols.size:
+                prices = price_batch(time_to_maturity, strike, spot_values[cols][np.newaxis, :],
+                                     vol_values[rows][:, np.newaxis], interest_rate)
+                call_prices[np.ix_(rows, cols)] = prices["call_price"]
+                put_prices[np.ix_(rows, cols)] = prices["put_price"]
+                cells_priced += rows.size * cols.size
+
+        for array in (vol_codes, spot_codes, call_prices, put_prices):
+            array.flags.writeable = False
+        with self._lock:
+            self.cells_priced += cells_priced
+            self.cells_reused += int(vol_hit.sum() * spot_hit.sum())
+            self._grids[key] = (vol_codes, spot_codes, call_prices, put_prices)
+            self._grids.move_to_end(key)
+            while len(self._grids) > self.max_entries:
+                self._grids.popitem(last=False)
+
+        return call_prices, put_prices
+
+
+def _lookup(cached_codes, codes):
+    """Positions of `codes` inside `cached_codes` (lattice codes are strictly increasing)."""
+    positions = np.clip(np.searchsorted(cached_codes, codes), 0, len(cached_codes) - 1)
+    return cached_codes[positions] == codes, positions
+
+
+def plot_heatmap(bs_model, spot_range, vol_range, strike, grid_cache=None):
     """
     Generates heatmaps for call and put option prices using Plotly.
 
@@ -19,30 +130,32 @@ def plot_heatmap(bs_model, spot_range, vol_range, strike):
     :param spot_range: Array of spot prices (x-axis).
     :param vol_range: Array of volatilities (y-axis).
     :param strike: The strike price for the option.
+    :param grid_cache: Optional HeatmapGridCache used to memoize the priced grid.
 
     :return: Plotly figures (fig_call, fig_put)
     """
-    call_prices = np.zeros((len(vol_range), len(spot_range)))
-    put_prices = np.zeros((len(vol_range), len(spot_range)))
+    spot_range = np.asarray(spot_range)
+    vol_range = np.asarray(vol_range)
 
     custom_colorscale = [
         [0.0, "red"],
         [1.0, "green"]
     ]
 
-    # Compute prices across spot and volatility ranges
-    for i, vol in enumerate(vol_range):
-        for j, spot in enumerate(spot_range):
-            bs_temp = BlackScholesModel(
-                time_to_maturity=bs_model.time_to_maturity,
-                strike=strike,
-                current_price=spot,
-                volatility=vol,
-                interest_rate=bs_model.interest_rate
-            )
-            call_price, put_price = bs_temp.calculate_prices()
-            call_prices[i, j] = call_price
-            put_prices[i, j] = put_price
+    # Price the whole volatility (rows) x spot (columns) grid in one vectorized call
+    if grid_cache is not None:
+        call_prices, put_prices = grid_cache.get_prices(bs_model.time_to_maturity, strike, bs_model.interest_rate,
+                                                        spot_range, vol_range)
+    else:
+        prices = price_batch(
+            time_to_maturity=bs_model.time_to_maturity,
+            strike=strike,
+            current_price=spot_range[np.newaxis, :],
+            volatility=vol_range[:, np.newaxis],
+            interest_rate=bs_model.interest_rate
+        )
+        call_prices = prices["call_price"]
+        put_prices = prices["put_price"]
 
     # Create Call Option Heatmap
     fig_call = go.Figure(
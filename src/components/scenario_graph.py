@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+def plot_pnl_profile(spot_axis, pnl, days_elapsed):
+    """
+    Generates PnL-versus-spot curves, one per elapsed-time scenario, using Plotly.
+
+    :param spot_axis: Array of spot prices (x-axis).
+    :param pnl: Array of shape (len(spot_axis), len(days_elapsed)).
+    :param days_elapsed: Elapsed days of each curve.
+
+    :return: Plotly figure
+    """
+    fig = go.Figure()
+    for i, days in enumerate(days_elapsed):
+        fig.add_trace(go.Scatter(x=np.round(spot_axis, 2), y=pnl[:, i], mode="lines", name=f"T+{days:g}d",
+                                 hovertemplate='Spot Price: %{x}<br>PnL: %{y:.2f}<extra></extra>'))
+    fig.add_hline(y=0, line_dash="dot", line_color="grey")
+    fig.update_layout(
+        title=dict(text="Position PnL", x=0.5, y=0.86, xanchor="center"),
+        xaxis_title="Spot Price",
+        yaxis_title="PnL",
+    )
+
+    return fig
+
+
+def plot_pnl_heatmap(spot_axis, vol_axis, pnl):
+    """
+    Generates a spot x volatility-shift PnL heatmap using Plotly.
+
+    :param spot_axis: Array of spot prices (x-axis).
+    :param vol_axis: Array of volatility shifts (y-axis).
+    :param pnl: Array of shape (len(spot_axis), len(vol_axis)).
+
+    :return: Plotly figure
+    """
+    fig = go.Figure(
+        data=go.Heatmap(
+            z=pnl.T,
+            x=np.round(spot_axis, 2),
+            y=np.round(vol_axis, 3),
+            colorscale=[[0.0, "red"], [0.5, "white"], [1.0, "green"]],
+            zmid=0,
+            colorbar=dict(title="PnL"),
+            hovertemplate='Spot Price: %{x}<br>Vol Shift: %{y}<br>PnL: %{z:.2f}<extra></extra>'
+        )
+    )
+    fig.update_layout(
+        title=dict(text="PnL by Spot and Volatility Shift", x=0.5, y=0.86, xanchor="center"),
+        xaxis_title="Spot Price",
+        yaxis_title="Volatility Shift",
+    )
+
+    return fig
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+"""
+
+import plotly.graph_objects as go
+
+
+def plot_volatility_surface(surface):
+    """
+    Generates a 3D implied-volatility surface using Plotly.
+
+    :param surface: DataFrame indexed by strike with one column per expiration.
+
+    :return: Plotly figure
+    """
+    fig = go.Figure(
+        data=go.Surface(
+            z=surface.to_numpy().T,
+            x=surface.index,
+            y=list(surface.columns),
+            colorscale="Viridis",
+            connectgaps=False,
+            colorbar=dict(title="Implied Vol"),
+            hovertemplate='Strike: %{x}<br>Expiry: %{y}<br>Implied Vol: %{z:.2%}<extra></extra>'
+        )
+    )
+    fig.update_layout(
+        title=dict(text="Implied Volatility Surface", x=0.5, xanchor="center"),
+        scene=dict(xaxis_title="Strike", yaxis_title="Expiry", zaxis_title="Implied Vol"),
+        height=600,
+    )
+
+    return fig
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+"""
+
+import timeit
+import numpy as np
+from src.core.black_scholes_model import BlackScholesModel
+
+
+class BinomialTreeModel:
+    def __init__(self, time_to_maturity, strike, current_price, volatility, interest_rate, steps: int = 200,
+                 american: bool = True):
+        """
+        Cox-Ross-Rubinstein binomial lattice for American (or European) call and put options.
+
+        Every parameter except steps/american may be a scalar or a 1-D array; arrays are
+        broadcast so a whole batch of contracts sharing a step count is priced at once.
+
+        :param time_to_maturity: Time to option expiration (T).
+        :param strike: Strike price (K).
+        :param current_price: Current price of the underlying asset (S).
+        :param volatility: Volatility of the asset (o).
+        :param interest_rate: Risk-free interest rate (r).
+        :param steps: Number of time steps in the lattice.
+        :param american: Allow early exercise when True, otherwise price European options.
+        """
+        self.time_to_maturity = time_to_maturity
+        self.strike = strike
+        self.current_price = current_price
+        self.volatility = volatility
+        self.interest_rate = interest_rate
+        self.steps = steps
+        self.american = american
+
+    def calculate_prices(self):
+        """
+        Prices calls and puts by backward induction, one vectorized time slice at a time.
+
+        :return: Tuple (call_price, put_price), scalars or arrays matching the broadcast inputs
+        :raises ValueError: If steps < 1, or if a contract's risk-neutral up probability falls
+                            outside [0, 1] (volatility too low for the rate and step size)
+        """
+        if self.steps < 1:
+            raise ValueError(f"The lattice needs at least one step, got {self.steps}.")
+        T, K, S, o, r = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (
+            self.time_to_maturity, self.strike, self.current_price, self.volatility, self.interest_rate)))
+        shape = T.shape
+        T, K, S, o, r = (a.reshape(-1, 1) for a in (T, K, S, o, r))
+        n = self.steps
+
+        dt = T / n
+        up = np.exp(o * np.sqrt(dt))
+        down = 1 / up
+        discount = np.exp(-r * dt)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p_up = (np.exp(r * dt) - down) / (up - down)
+        if not np.all((p_up >= 0) & (p_up <= 1)):
+            raise ValueError("Up probability outside [0, 1]: the volatility must exceed |r| * sqrt(T / steps); "
+                             "use more steps or a higher volatility.")
+        p_down = 1 - p_up
+
+        # Terminal spot prices S * u^j * d^(n - j), j = 0..n, one row per contract
+        spot = S * up ** np.arange(n + 1) * down ** np.arange(n, -1, -1)
+        call_values = np.maximum(spot - K, 0.0)
+        put_values = np.maximum(K - spot, 0.0)
+
+        for _ in range(n):
+            # Node j at step i has spot S_{i+1, j} / d = S_{i+1, j} * u
+            spot = spot[:, :-1] * up
+            call_values = discount * (p_up * call_values[:, 1:] + p_down * call_values[:, :-1])
+            put_values = discount * (p_up * put_values[:, 1:] + p_down * put_values[:, :-1])
+            if self.american:
+                np.maximum(call_values, spot - K, out=call_values)
+                np.maximum(put_values, K - spot, out=put_values)
+
+        call_price, put_price = call_values[:, 0].reshape(shape), put_values[:, 0].reshape(shape)
+        if not shape:
+            return float(call_price), float(put_price)
+        return call_price, put_price
+
+
+def benchmark(step_counts=(25, 50, 100, 200, 400, 800, 1600), batch_size=100):
+    """
+    Convergence and latency of the lattice against the Black-Scholes closed form. An
+    American call on a non-dividend-paying asset is never exercised early, so it must
+    converge to the European Black-Scholes call price.
+
+    :param step_counts: Lattice sizes to evaluate.
+    :param batch_size: Number of contracts priced together per call.
+    """
+    rng = np.random.default_rng(0)
+    strike = rng.uniform(80, 120, batch_size)
+    time_to_maturity = rng.uniform(0.1, 2.0, batch_size)
+    volatility = rng.uniform(0.1, 0.6, batch_size)
+    exact_call = BlackScholesModel(time_to_maturity, strike, 100.0, volatility, 0.05).calculate_all()["call_price"]
+
+    print(f"{'steps':>6} | {'max |call - BS|':>16} | {'ms per batch of ' + str(batch_size):>20}")
+    for steps in step_counts:
+        model = BinomialTreeModel(time_to_maturity, strike, 100.0, volatility, 0.05, steps=steps)
+        runs = 5
+        elapsed = timeit.timeit(model.calculate_prices, number=runs)
+        call_price, _ = model.calculate_prices()
+        error = np.max(np.abs(call_price - exact_call))
+        print(f"{steps:>6} | {error:>16.2e} | {elapsed / runs * 1e3:>20.2f}")
+
+
+if __name__ == "__main__":
+    benchmark()
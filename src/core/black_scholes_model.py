@@ -7,9 +7,19 @@
 """
 
 
-from numpy import exp, sqrt, log
+import timeit
+import numpy as np
+from numpy import exp, sqrt, log, pi
+from scipy.special import ndtr
 from scipy.stats import norm
 
+SQRT_2PI = sqrt(2 * pi)
+
+
+def _norm_pdf(x):
+    """Standard normal density, without the scipy.stats frozen-distribution dispatch."""
+    return exp(-0.5 * x * x) / SQRT_2PI
+
 
 class BlackScholesModel:
     def __init__(self, time_to_maturity: float, strike: float, current_price: float,
@@ -105,6 +115,96 @@ class BlackScholesModel:
 
         return call_price, put_price
 
+    def calculate_all(self):
+        """
+        Computes the call/put prices and all Greeks in one fused pass. Every shared term
+        (d1, d2, sqrt(T), the discount factor and the normal CDF/PDF values) is evaluated
+        exactly once. Every input may be a scalar or a NumPy array; arrays are broadcast
+        against each other.
+
+        :return: dict with "call_price", "put_price" and the keys of calculate_greeks()
+        """
+        T = self.time_to_maturity
+        S = self.current_price
+        K = self.strike
+        o = self.volatility
+        r = self.interest_rate
+
+        sqrt_t = sqrt(T)
+        o_sqrt_t = o * sqrt_t
+        d1 = (log(S / K) + (r + 0.5 * o ** 2) * T) / o_sqrt_t
+        d2 = d1 - o_sqrt_t
+
+        discounted_strike = K * exp(-r * T)
+        cdf_d1 = ndtr(d1)
+        cdf_d2 = ndtr(d2)
+        cdf_minus_d1 = ndtr(-d1)
+        cdf_minus_d2 = ndtr(-d2)
+        pdf_d1 = _norm_pdf(d1)
+
+        call_price = S * cdf_d1 - discounted_strike * cdf_d2
+        put_price = discounted_strike * cdf_minus_d2 - S * cdf_minus_d1
+
+        s_pdf_d1 = S * pdf_d1
+        theta_decay = -s_pdf_d1 * o / (2 * sqrt_t)
+
+        return {
+            "call_price": call_price,
+            "put_price": put_price,
+            "call_delta": cdf_d1,
+            "put_delta": -cdf_minus_d1,
+            "gamma": pdf_d1 / (S * o_sqrt_t),
+            "vega": s_pdf_d1 * sqrt_t,
+            "call_theta": theta_decay - r * discounted_strike * cdf_d2,
+            "put_theta": theta_decay + r * discounted_strike * cdf_minus_d2,
+            "call_rho": T * discounted_strike * cdf_d2,
+            "put_rho": -T * discounted_strike * cdf_minus_d2,
+        }
+
+
+def price_batch(time_to_maturity, strike, current_price, volatility, interest_rate):
+    """
+    Vectorized Black-Scholes pricing over NumPy arrays.
+
+    Each parameter may be a scalar or an array; all of them are broadcast to a common
+    shape, so e.g. a (len(vol), 1) volatility column against a (1, len(spot)) spot row
+    prices a whole volatility x spot grid in a single call.
+
+    :param time_to_maturity: Time to option expiration (T).
+    :param strike: Strike price (K).
+    :param current_price: Current price of the underlying asset (S).
+    :param volatility: Volatility of the asset (o).
+    :param interest_rate: Risk-free interest rate (r).
+    :return: dict of arrays: call_price, put_price and every Greek, all of the broadcast shape
+    """
+    T, K, S, o, r = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (
+        time_to_maturity, strike, current_price, volatility, interest_rate)))
+    return BlackScholesModel(T, K, S, o, r).calculate_all()
+
+
+def benchmark(number=2000, grid_size=200):
+    """
+    Micro-benchmark of the fused calculate_all() kernel against the two-method
+    calculate_prices() + calculate_greeks() path, for a single option and a grid.
+
+    :param number: Number of timed calls per measurement.
+    :param grid_size: Side length of the square volatility x spot grid.
+    """
+    scalar_model = BlackScholesModel(2, 90, 100, 0.2, 0.05)
+    spot = np.linspace(50, 150, grid_size)[np.newaxis, :]
+    vol = np.linspace(0.05, 1.0, grid_size)[:, np.newaxis]
+    grid_model = BlackScholesModel(2, 90, spot, vol, 0.05)
+
+    cases = [
+        ("scalar", scalar_model, number),
+        (f"{grid_size}x{grid_size} grid", grid_model, max(number // 100, 1)),
+    ]
+    for label, model, runs in cases:
+        two_method = timeit.timeit(lambda: (model.calculate_prices(), model.calculate_greeks()), number=runs)
+        fused = timeit.timeit(model.calculate_all, number=runs)
+        print(f"{label:>16}: two-method {two_method / runs * 1e6:10.1f} us/call | "
+              f"fused {fused / runs * 1e6:10.1f} us/call | speed-up {two_method / fused:5.1f}x")
+
 
 if __name__ == "__main__":
     time_to_maturity = 2
@@ -121,3 +221,5 @@ if __name__ == "__main__":
         volatility=volatility,
         interest_rate=interest_rate)
     BS.calculate_prices()
+
+    benchmark()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Vectorized implied-volatility solver built on the Black-Scholes model.
+"""
+
+import timeit
+import numpy as np
+from src.core.black_scholes_model import BlackScholesModel
+
+MIN_VOLATILITY = 1e-6
+MAX_VOLATILITY = 5.0
+
+
+def implied_volatility(market_price, current_price, strike, time_to_maturity, interest_rate, is_call=True,
+                       tolerance=1e-8, volatility_tolerance=1e-12, max_iterations=100):
+    """
+    Inverts the Black-Scholes formula for a whole array of quotes at once.
+
+    Every element runs a safeguarded Newton iteration in lockstep: each step keeps a
+    [low, high] volatility bracket around the root and falls back to bisection whenever
+    the Newton step leaves the bracket or vega vanishes. Converged elements are masked
+    out of later iterations.
+
+    :param market_price: Observed option prices.
+    :param current_price: Current price of the underlying asset (S).
+    :param strike: Strike prices (K).
+    :param time_to_maturity: Time to option expiration in years (T).
+    :param interest_rate: Risk-free interest rate (r).
+    :param is_call: True for calls, False for puts (scalar or boolean array).
+    :param tolerance: Absolute price error at which an element counts as converged.
+    :param volatility_tolerance: Bracket width at which iteration stops for quotes whose price error cannot reach
+                                 `tolerance` (vega ~ 0); they count as converged only if the root lies strictly
+                                 inside (MIN_VOLATILITY, MAX_VOLATILITY).
+    :param max_iterations: Maximum number of lockstep iterations.
+    :return: Tuple (volatility, converged). volatility is NaN wherever the quote lies
+             outside the no-arbitrage bounds or the iteration did not converge.
+    """
+    price, S, K, T, r, call = np.broadcast_arrays(
+        np.asarray(market_price, dtype=float), np.asarray(current_price, dtype=float),
+        np.asarray(strike, dtype=float), np.asarray(time_to_maturity, dtype=float),
+        np.asarray(interest_rate, dtype=float), np.asarray(is_call, dtype=bool))
+    price, S, K, T, r, call = (a.ravel() for a in (price, S, K, T, r, call))
+    shape = np.broadcast_shapes(*(np.shape(a) for a in (market_price, current_price, strike,
+                                                        time_to_maturity, interest_rate, is_call)))
+
+    # No-arbitrage bounds; quotes outside them have no implied volatility
+    discounted_strike = K * np.exp(-r * T)
+    lower_bound = np.where(call, np.maximum(S - discounted_strike, 0.0), np.maximum(discounted_strike - S, 0.0))
+    upper_bound = np.where(call, S, discounted_strike)
+    valid = (T > 0) & (price > lower_bound) & (price < upper_bound)
+
+    volatility = np.full(price.shape, np.nan)
+    converged = np.zeros(price.shape, dtype=bool)
+    low = np.full(price.shape, MIN_VOLATILITY)
+    high = np.full(price.shape, MAX_VOLATILITY)
+
+    # Brenner-Subrahmanyam approximation as the starting point
+    with np.errstate(divide="ignore", invalid="ignore"):
+        guess = np.sqrt(2 * np.pi / T) * price / S
+    volatility[valid] = np.clip(guess[valid], 0.05, 2.0)
+
+    active = np.flatnonzero(valid)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+
+        sigma = volatility[active]
+        results = BlackScholesModel(T[active], K[active], S[active], sigma, r[active]).calculate_all()
+        model_price = np.where(call[active], results["call_price"], results["put_price"])
+        vega = results["vega"]
+        error = model_price - price[active]
+
+        done = np.abs(error) < tolerance
+        converged[active[done]] = True
+
+        # Shrink the bracket around the root; price is increasing in volatility
+        too_high = error > 0
+        high[active] = np.where(too_high, sigma, high[active])
+        low[active] = np.where(too_high, low[active], sigma)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            newton = sigma - error / vega
+        outside = ~np.isfinite(newton) | (newton <= low[active]) | (newton >= high[active])
+        step = np.where(outside, 0.5 * (low[active] + high[active]), newton)
+        volatility[active] = np.where(done, sigma, step)
+
+        # A bracket pinned at either bound means the root lies outside [MIN_VOLATILITY, MAX_VOLATILITY]
+        collapsed = ~done & (high[active] - low[active] < volatility_tolerance)
+        pinned = (low[active] <= MIN_VOLATILITY) | (high[active] >= MAX_VOLATILITY)
+        converged[active[collapsed & ~pinned]] = True
+        active = active[~(done | collapsed)]
+
+    volatility[~converged] = np.nan
+    return volatility.reshape(shape), converged.reshape(shape)
+
+
+def benchmark(chain_size=5000):
+    """
+    Times the solver on a synthetic option chain and reports the recovery error.
+
+    :param chain_size: Number of quotes in the synthetic chain.
+    """
+    rng = np.random.default_rng(0)
+    strike = rng.uniform(50, 150, chain_size)
+    time_to_maturity = rng.uniform(0.05, 2.0, chain_size)
+    true_volatility = rng.uniform(0.1, 0.8, chain_size)
+    is_call = rng.random(chain_size) < 0.5
+    prices = BlackScholesModel(time_to_maturity, strike, 100.0, true_volatility, 0.05).calculate_all()
+    market_price = np.where(is_call, prices["call_price"], prices["put_price"])
+
+    runs = 10
+    elapsed = timeit.timeit(lambda: implied_volatility(market_price, 100.0, strike, time_to_maturity, 0.05, is_call),
+                            number=runs)
+    volatility, converged = implied_volatility(market_price, 100.0, strike, time_to_maturity, 0.05, is_call)
+
+    # Quotes with (almost) no time value carry no volatility information, so only
+    # measure the recovery error where vega is meaningful
+    identifiable = prices["vega"] > 1e-3
+    error = np.nanmax(np.abs(volatility - true_volatility)[identifiable])
+    print(f"{chain_size} quotes: {elapsed / runs * 1e3:.2f} ms/chain, converged {converged.mean():.2%}, "
+          f"max volatility error {error:.2e} over {identifiable.sum()} identifiable quotes")
+
+
+if __name__ == "__main__":
+    benchmark()
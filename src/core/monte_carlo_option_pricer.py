@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Monte Carlo pricing of path-dependent options with a Black-Scholes control variate.
+"""
+
+import numpy as np
+from src.core.black_scholes_model import BlackScholesModel
+from src.core.monte_carlo_simulation import gbm_log_increments, to_price_paths
+
+OPTION_STYLES = ("asian", "barrier", "lookback")
+BARRIER_TYPES = ("up-and-out", "up-and-in", "down-and-out", "down-and-in")
+CHUNK_CELLS = 2_000_000  # Path values per chunk (16 MB of float64)
+
+
+class MonteCarloOptionPricer:
+    def __init__(self, time_to_maturity: float, strike: float, current_price: float, volatility: float,
+                 interest_rate: float, num_paths: int = 100_000, num_steps: int = 252, seed=None,
+                 antithetic: bool = True, chunk_size: int = None):
+        """
+        Monte Carlo pricer for Asian, barrier and lookback options under risk-neutral GBM.
+
+        The discounted European payoff on the same paths is used as a control variate,
+        since its exact value is the Black-Scholes price. Paths are generated and priced in
+        chunks whose payoff moments are accumulated, so memory does not grow with num_paths.
+
+        :param time_to_maturity: Time to option expiration (T).
+        :param strike: Strike price (K).
+        :param current_price: Current price of the underlying asset (S).
+        :param volatility: Volatility of the asset (o).
+        :param interest_rate: Risk-free interest rate (r).
+        :param num_paths: Number of simulated paths (rounded up to even with antithetic variates).
+        :param num_steps: Monitoring dates per path.
+        :param seed: Optional seed for reproducible prices.
+        :param antithetic: Pair every path with its antithetic counterpart.
+        :param chunk_size: Paths per chunk; by default about CHUNK_CELLS / num_steps.
+        """
+        self.time_to_maturity = time_to_maturity
+        self.strike = strike
+        self.current_price = current_price
+        self.volatility = volatility
+        self.interest_rate = interest_rate
+        self.num_paths = num_paths + (num_paths % 2 if antithetic else 0)
+        self.num_steps = num_steps
+        self.seed = seed
+        self.antithetic = antithetic
+        self.chunk_size = chunk_size or max(CHUNK_CELLS // num_steps, 2)
+        if antithetic:
+            self.chunk_size += self.chunk_size % 2
+
+    def simulate_paths(self):
+        """
+        Generates risk-neutral price paths chunk by chunk, each of shape (chunk_size, num_steps);
+        with antithetic variates every chunk holds its own antithetic pairs (first half, second half).
+        """
+        rng = np.random.default_rng(self.seed)
+        dt = self.time_to_maturity / self.num_steps
+        drift = (self.interest_rate - 0.5 * self.volatility ** 2) * dt
+        for chunk_start in range(0, self.num_paths, self.chunk_size):
+            num_paths = min(self.chunk_size, self.num_paths - chunk_start)
+            increments = gbm_log_increments(rng, drift, self.volatility * np.sqrt(dt), num_paths, self.num_steps,
+                                            self.antithetic)
+            yield to_price_paths(self.current_price, increments)
+
+    def _payoff(self, paths, option_style, option_type, barrier, barrier_type):
+        is_call = option_type == "call"
+        terminal = paths[:, -1]
+
+        if option_style == "asian":
+            average = paths.mean(axis=1)
+            return np.maximum(average - self.strike, 0.0) if is_call else np.maximum(self.strike - average, 0.0)
+
+        if option_style == "lookback":
+            # Floating strike: buy at the path minimum (call) or sell at the path maximum (put)
+            return terminal - np.minimum(paths.min(axis=1), self.current_price) if is_call else \
+                np.maximum(paths.max(axis=1), self.current_price) - terminal
+
+        if barrier is None:
+            raise ValueError("A barrier level is required for barrier options.")
+        if barrier_type not in BARRIER_TYPES:
+            raise ValueError(f"Unknown barrier type {barrier_type!r}, expected one of {BARRIER_TYPES}.")
+        if barrier_type.startswith("up"):
+            touched = np.maximum(paths.max(axis=1), self.current_price) >= barrier
+        else:
+            touched = np.minimum(paths.min(axis=1), self.current_price) <= barrier
+        active = touched if barrier_type.endswith("in") else ~touched
+        vanilla = np.maximum(terminal - self.strike, 0.0) if is_call else np.maximum(self.strike - terminal, 0.0)
+        return np.where(active, vanilla, 0.0)
+
+    def price(self, option_style: str, option_type: str = "call", barrier: float = None,
+              barrier_type: str = "up-and-out"):
+        """
+        Prices a path-dependent option.
+
+        :param option_style: "asian" (arithmetic average), "barrier" or "lookback" (floating strike).
+        :param option_type: "call" or "put".
+        :param barrier: Barrier level, required for barrier options.
+        :param barrier_type: One of BARRIER_TYPES.
+        :return: dict with price and standard_error (control-variate estimate), plain_price and
+                 plain_standard_error (without control variate) and the fitted beta
+        """
+        if option_style not in OPTION_STYLES:
+            raise ValueError(f"Unknown option style {option_style!r}, expected one of {OPTION_STYLES}.")
+
+        discount = np.exp(-self.interest_rate * self.time_to_maturity)
+        bs_prices = BlackScholesModel(self.time_to_maturity, self.strike, self.current_price, self.volatility,
+                                      self.interest_rate).calculate_all()
+        european_exact = bs_prices["call_price"] if option_type == "call" else bs_prices["put_price"]
+
+        moments = _PairMoments()
+        for paths in self.simulate_paths():
+            target = discount * self._payoff(paths, option_style, option_type, barrier, barrier_type)
+            terminal = paths[:, -1]
+            european = discount * (np.maximum(terminal - self.strike, 0.0) if option_type == "call"
+                                   else np.maximum(self.strike - terminal, 0.0))
+
+            # Antithetic pairs are not independent samples; average each pair first
+            if self.antithetic:
+                half = len(paths) // 2
+                target = 0.5 * (target[:half] + target[half:])
+                european = 0.5 * (european[:half] + european[half:])
+            moments.update(target, european)
+
+        target_variance, european_variance, covariance = moments.covariance()
+        beta = covariance / european_variance if european_variance > 0 else 0.0
+        controlled_variance = max(target_variance - 2 * beta * covariance + beta ** 2 * european_variance, 0.0)
+        samples = moments.count
+
+        return {
+            "price": float(moments.mean_x - beta * (moments.mean_y - european_exact)),
+            "standard_error": float(np.sqrt(controlled_variance / samples)),
+            "plain_price": float(moments.mean_x),
+            "plain_standard_error": float(np.sqrt(target_variance / samples)),
+            "beta": float(beta),
+        }
+
+
+class _PairMoments:
+    """Running means and co-moments of paired samples (x, y), merged chunk by chunk (Chan et al.)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+
+    def update(self, x, y):
+        count = x.size
+        if count == 0:
+            return
+        mean_x, mean_y = x.mean(), y.mean()
+        dx, dy = x - mean_x, y - mean_y
+        total = self.count + count
+        delta_x, delta_y = mean_x - self.mean_x, mean_y - self.mean_y
+        weight = self.count * count / total
+        self.m2_x += dx @ dx + delta_x ** 2 * weight
+        self.m2_y += dy @ dy + delta_y ** 2 * weight
+        self.c_xy += dx @ dy + delta_x * delta_y * weight
+        self.mean_x += delta_x * count / total
+        self.mean_y += delta_y * count / total
+        self.count = total
+
+    def covariance(self):
+        """Sample variance of x, variance of y and covariance of x and y."""
+        ddof = max(self.count - 1, 1)
+        return self.m2_x / ddof, self.m2_y / ddof, self.c_xy / ddof
+
+
+if __name__ == "__main__":
+    pricer = MonteCarloOptionPricer(time_to_maturity=1.0, strike=100, current_price=100, volatility=0.2,
+                                    interest_rate=0.05, num_paths=100_000, num_steps=252, seed=0)
+    for style, kwargs in (("asian", {}), ("barrier", {"barrier": 130, "barrier_type": "up-and-out"}),
+                          ("lookback", {})):
+        result = pricer.price(style, **kwargs)
+        print(f"{style:>9}: {result['price']:.4f} ± {result['standard_error']:.4f} "
+              f"(plain {result['plain_price']:.4f} ± {result['plain_standard_error']:.4f}, "
+              f"variance reduction {(result['plain_standard_error'] / result['standard_error']) ** 2:.1f}x)")
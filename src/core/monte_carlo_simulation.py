@@ -1,62 +1,595 @@
+import os
+import time
+import itertools
+import timeit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
 import numpy as np
 import pandas as pd
 
+PATH_MODELS = ("bootstrap", "gbm")
+PARALLEL_BLOCK_SIZE = 50_000
+FAN_CHART_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def bootstrap_log_increments(rng, log_returns, num_paths, num_steps, antithetic=False, dtype=np.float64):
+    """
+    Resamples historical log-returns with replacement.
+
+    :param rng: numpy.random.Generator.
+    :param log_returns: 1-D array of historical log-returns.
+    :param num_paths: Number of paths.
+    :param num_steps: Number of steps per path.
+    :param antithetic: Pair every path with its mirror image around the mean return.
+    :param dtype: dtype of the result.
+    :return: Array of shape (num_paths, num_steps)
+    """
+    log_returns = np.asarray(log_returns, dtype=dtype)
+    base_paths = -(-num_paths // 2) if antithetic else num_paths
+    increments = log_returns[rng.integers(0, log_returns.size, size=(base_paths, num_steps))]
+    if antithetic:
+        increments = np.concatenate([increments, 2 * log_returns.mean(dtype=dtype) - increments])[:num_paths]
+    return increments
+
+
+def gbm_log_increments(rng, drift, volatility, num_paths, num_steps, antithetic=False, dtype=np.float64):
+    """
+    Normal log-increments of a geometric Brownian motion.
+
+    :param rng: numpy.random.Generator.
+    :param drift: Mean log-return per step (already including the -o^2/2 correction).
+    :param volatility: Standard deviation of the log-return per step.
+    :param num_paths: Number of paths.
+    :param num_steps: Number of steps per path.
+    :param antithetic: Pair every path's shocks Z with -Z.
+    :param dtype: dtype of the result.
+    :return: Array of shape (num_paths, num_steps)
+    """
+    base_paths = -(-num_paths // 2) if antithetic else num_paths
+    shocks = rng.standard_normal(size=(base_paths, num_steps), dtype=dtype)
+    if antithetic:
+        shocks = np.concatenate([shocks, -shocks])[:num_paths]
+    return (drift + volatility * shocks).astype(dtype, copy=False)
+
+
+def to_price_paths(start_price, log_increments):
+    """
+    Turns per-step log-increments into price paths with a cumulative sum along the step axis.
+
+    :param start_price: Price at step 0.
+    :param log_increments: Array of shape (num_paths, num_steps).
+    :return: Array of prices with the same shape
+    """
+    paths = np.cumsum(log_increments, axis=1)
+    np.exp(paths, out=paths)
+    paths *= start_price
+    return paths
+
+
+def generate_price_paths(rng, start_price, log_returns, num_paths, num_steps, path_model="bootstrap",
+                         antithetic=False, dtype=np.float64):
+    """
+    Draws price paths from historical log-returns with the given path model.
+
+    :param rng: numpy.random.Generator.
+    :param start_price: Price at step 0.
+    :param log_returns: 1-D array of historical log-returns used for bootstrapping/calibration.
+    :param num_paths: Number of paths.
+    :param num_steps: Number of steps per path.
+    :param path_model: "bootstrap" or "gbm".
+    :param antithetic: Use antithetic variates.
+    :param dtype: dtype of the result.
+    :return: Array of shape (num_paths, num_steps)
+    """
+    dtype = np.dtype(dtype)
+    if path_model == "bootstrap":
+        increments = bootstrap_log_increments(rng, log_returns, num_paths, num_steps, antithetic, dtype)
+    else:
+        increments = gbm_log_increments(rng, log_returns.mean(), log_returns.std(ddof=1), num_paths, num_steps,
+                                        antithetic, dtype)
+    return to_price_paths(dtype.type(start_price), increments)
+
+
+def representative_paths(paths, num_samples):
+    """
+    Deterministic sample of paths spread evenly over the ranking of terminal values.
+
+    :param paths: Array of shape (num_paths, num_steps).
+    :param num_samples: Number of paths to keep.
+    :return: Array of shape (min(num_samples, num_paths), num_steps)
+    """
+    if num_samples <= 0 or len(paths) == 0:
+        return paths[:0]
+    order = np.argsort(paths[:, -1], kind="stable")
+    ranks = np.unique(np.linspace(0, len(paths) - 1, min(num_samples, len(paths))).round().astype(int))
+    return paths[order[ranks]]
+
+
+class StreamingPathStatistics:
+    def __init__(self, num_steps: int, bins: int = 2048, lower=None, width=None, num_samples: int = 0):
+        """
+        Bounded-memory per-step summary of simulated price paths.
+
+        Chunks of paths are folded into a running mean/variance (Chan et al. parallel update)
+        and a fixed-size log-price histogram per step, from which quantiles are interpolated.
+        The histogram range of every step is set from the first chunk, widened by its own
+        width on both sides. When later values fall outside it, that step's range is doubled
+        around its centre (pairs of bins are merged) until they fit, so the number of
+        doublings depends only on the extremes seen and merged results do not depend on
+        the chunking.
+
+        :param num_steps: Number of steps per path.
+        :param bins: Histogram bins per step (even); memory is num_steps * bins * 8 bytes.
+        :param lower: Optional per-step lower edge of the histogram (log-price); set from the first chunk when None.
+        :param width: Optional per-step bin width matching `lower`.
+        :param num_samples: Number of representative paths kept from the first chunk (see representative_paths).
+        """
+        if bins % 2:
+            raise ValueError(f"bins must be even, got {bins}.")
+        self.num_steps = num_steps
+        self.bins = bins
+        self.count = 0
+        self.mean = np.zeros(num_steps)
+        self.m2 = np.zeros(num_steps)
+        self.minimum = np.full(num_steps, np.inf)
+        self.maximum = np.full(num_steps, -np.inf)
+        self.counts = np.zeros((num_steps, bins), dtype=np.int64)
+        self.lower = lower
+        self.width = width
+        self.num_samples = num_samples
+        self.sample_paths = None
+
+    def update(self, paths):
+        """
+        Folds a chunk of paths into the running statistics.
+
+        :param paths: Array of shape (chunk_size, num_steps).
+        :return: The chunk's own (count, mean, m2), so a caller can refold moments in a fixed order
+        """
+        paths = np.asarray(paths, dtype=np.float64)
+        chunk_count = paths.shape[0]
+        if chunk_count == 0:
+            return 0, np.zeros(self.num_steps), np.zeros(self.num_steps)
+
+        chunk_mean = paths.mean(axis=0)
+        chunk_m2 = ((paths - chunk_mean) ** 2).sum(axis=0)
+        self.fold_moments(chunk_count, chunk_mean, chunk_m2)
+        np.minimum(self.minimum, paths.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, paths.max(axis=0), out=self.maximum)
+
+        if self.sample_paths is None:
+            self.sample_paths = representative_paths(paths, self.num_samples)
+
+        log_paths = np.log(paths)
+        if self.lower is None:
+            low, high = log_paths.min(axis=0), log_paths.max(axis=0)
+            span = np.maximum(high - low, 1e-6)
+            self.lower = low - span
+            self.width = 3 * span / self.bins
+        self._cover(np.log(self.minimum), np.log(self.maximum))
+
+        bin_index = ((log_paths - self.lower) / self.width).astype(np.int64)
+        np.clip(bin_index, 0, self.bins - 1, out=bin_index)
+        bin_index += np.arange(self.num_steps) * self.bins
+        self.counts += np.bincount(bin_index.ravel(), minlength=self.num_steps * self.bins).reshape(self.counts.shape)
+        return chunk_count, chunk_mean, chunk_m2
+
+    def fold_moments(self, count, mean, m2):
+        """
+        Folds the count, mean and sum of squared deviations of other paths into the running
+        mean/variance. Floating-point results depend on the folding order.
+        """
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    def _cover(self, low, high):
+        """Doubles the histogram range of every step until it contains [low, high] (log-prices)."""
+        while True:
+            outside = (low < self.lower) | (high >= self.lower + self.bins * self.width)
+            if not outside.any():
+                return
+            self.counts, self.lower, self.width = _double_range(self.counts, self.lower, self.width, outside)
+
+    def merge(self, other):
+        """
+        Folds another StreamingPathStatistics into this one. Both must start from the same
+        histogram range (lower/width); ranges doubled since then are aligned before adding.
+
+        :param other: StreamingPathStatistics built with the same initial lower/width.
+        """
+        if other.count == 0:
+            return
+        self.merge_histogram(other)
+        self.fold_moments(other.count, other.mean, other.m2)
+
+    def merge_histogram(self, other):
+        """
+        Adds another StreamingPathStatistics' histogram, extremes and sample paths, but not its
+        moments (see fold_moments). Integer counts make the result independent of merge order.
+
+        :param other: StreamingPathStatistics built with the same initial lower/width.
+        """
+        if other.count == 0:
+            return
+        if self.lower is None:
+            self.lower, self.width = other.lower.copy(), other.width.copy()
+        self._cover(np.log(other.minimum), np.log(other.maximum))
+        other_counts, other_lower, other_width = other.counts, other.lower, other.width
+        while np.any(other_width < self.width):
+            other_counts, other_lower, other_width = _double_range(other_counts, other_lower, other_width,
+                                                                   other_width < self.width)
+        if self.sample_paths is None:
+            self.sample_paths = other.sample_paths
+        np.minimum(self.minimum, other.minimum, out=self.minimum)
+        np.maximum(self.maximum, other.maximum, out=self.maximum)
+        self.counts += other_counts
+
+    def variance(self):
+        """Sample variance of every step."""
+        return self.m2 / max(self.count - 1, 1)
+
+    def quantile(self, q):
+        """
+        Interpolated q-quantile of every step.
+
+        :param q: Quantile in [0, 1].
+        :return: Array of shape (num_steps,)
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        target = q * self.count
+        bin_index = np.minimum((cumulative < target).sum(axis=1), self.bins - 1)
+        steps = np.arange(self.num_steps)
+        below = np.where(bin_index > 0, cumulative[steps, np.maximum(bin_index - 1, 0)], 0)
+        in_bin = np.maximum(self.counts[steps, bin_index], 1)
+        fraction = np.clip((target - below) / in_bin, 0.0, 1.0)
+        value = np.exp(self.lower + (bin_index + fraction) * self.width)
+        return np.clip(value, self.minimum, self.maximum)
+
+
+def _double_range(counts, lower, width, steps):
+    """
+    Doubles the histogram range of the selected steps around its centre: the bin width
+    doubles and every pair of bins on the new grid is merged, so no count changes bin
+    boundaries. Returns new (counts, lower, width) arrays.
+    """
+    bins = counts.shape[1]
+    padding = np.zeros((int(steps.sum()), bins // 2), dtype=counts.dtype)
+    doubled = np.concatenate([padding, counts[steps], padding], axis=1).reshape(-1, bins, 2).sum(axis=2)
+    counts, lower, width = counts.copy(), lower.copy(), width.copy()
+    counts[steps] = doubled
+    lower[steps] -= bins // 2 * width[steps]
+    width[steps] *= 2
+    return counts, lower, width
+
 
 class MonteCarloSimulation:
-    def __init__(self, data, forward_period, num_simulations):
+    def __init__(self, data, forward_period, num_simulations, seed=None, dtype=np.float64, path_model="bootstrap",
+                 look_back=None, antithetic=False):
         """
         Initializes the Monte Carlo Simulation.
 
-        :param data: Historical data in the form of a pandas DataFrame.
+        :param data: Historical data in the form of a pandas DataFrame (the "Close" column is used when present).
         :param forward_period: Number of periods to simulate into the future.
         :param num_simulations: Number of simulations to run.
+        :param seed: Optional seed for the random number generator, for reproducible runs.
+        :param dtype: np.float64 (default) or np.float32 to halve the memory of the results.
+        :param path_model: "bootstrap" (resampled historical log-returns) or "gbm" (calibrated geometric
+                           Brownian motion).
+        :param look_back: Number of most recent returns used for calibration; None uses the whole history.
+        :param antithetic: Use antithetic variates (every path is paired with its mirror image).
         """
+        if path_model not in PATH_MODELS:
+            raise ValueError(f"Unknown path model {path_model!r}, expected one of {PATH_MODELS}.")
         self.data = data
         self.forward_period = forward_period
         self.num_simulations = num_simulations
+        self.seed = seed
+        self.dtype = np.dtype(dtype)
+        self.path_model = path_model
+        self.look_back = look_back
+        self.antithetic = antithetic
+        self.simulation_outcomes = None
         self.simulation_results = None
+        self.streaming_statistics = None
+
+    def _calibration_window(self):
+        """Returns (last price, log-returns over the look-back window) from the history."""
+        prices = self.data["Close"] if isinstance(self.data, pd.DataFrame) and "Close" in self.data else self.data
+        prices = np.asarray(prices, dtype=np.float64).ravel()
+        prices = prices[np.isfinite(prices) & (prices > 0)]
+        if prices.size < 2:
+            raise ValueError("At least two valid historical prices are required to calibrate the simulation.")
+
+        log_returns = np.diff(np.log(prices))
+        if self.look_back:
+            log_returns = log_returns[-self.look_back:]
+        return prices[-1], log_returns
+
+    def _generate_paths(self, rng, start_price, log_returns, num_paths):
+        """Draws `num_paths` price paths with the configured path model."""
+        return generate_price_paths(rng, start_price, log_returns, num_paths, self.forward_period, self.path_model,
+                                    self.antithetic, self.dtype)
 
     def simulate(self):
         """
-        Runs the Monte Carlo simulation to generate future outcomes.
+        Runs the Monte Carlo simulation to generate future price paths.
+        """
+        rng = np.random.default_rng(self.seed)
+        start_price, log_returns = self._calibration_window()
+        self.simulation_outcomes = self._generate_paths(rng, start_price, log_returns, self.num_simulations)
+        self.simulation_results = None
+        self.streaming_statistics = None
+
+    def simulate_streaming(self, chunk_size=50_000, bins=2048, num_samples=10):
+        """
+        Runs the simulation in fixed-size chunks that are folded into StreamingPathStatistics
+        and discarded, so memory stays bounded regardless of num_simulations. Only the
+        mean/percentile accessors are available afterwards.
+
+        :param chunk_size: Number of paths generated per chunk.
+        :param bins: Histogram bins per step used for the quantile estimates.
+        :param num_samples: Representative paths kept for get_fan_chart().
         """
-        # Initialize a DataFrame to store simulation results
-        simulation_outcomes = np.zeros((self.num_simulations, self.forward_period))
+        rng = np.random.default_rng(self.seed)
+        start_price, log_returns = self._calibration_window()
+        statistics = StreamingPathStatistics(self.forward_period, bins, num_samples=num_samples)
 
-        # Generate random outcomes based on the historical data
-        for i in range(self.num_simulations):
-            # Sample from the historical data and simulate forward
-            random_walk = np.random.choice(self.data.values.flatten(), size=self.forward_period)
-            simulation_outcomes[i, :] = random_walk
+        for chunk_start in range(0, self.num_simulations, chunk_size):
+            num_paths = min(chunk_size, self.num_simulations - chunk_start)
+            statistics.update(self._generate_paths(rng, start_price, log_returns, num_paths))
 
-        # Convert the results to a DataFrame
-        self.simulation_results = pd.DataFrame(simulation_outcomes,
-                                               columns=[f'Simulation{i + 1}' for i in range(self.forward_period)])
+        self.streaming_statistics = statistics
+        self.simulation_outcomes = None
+        self.simulation_results = None
+
+    def simulate_parallel(self, workers=None, block_size=PARALLEL_BLOCK_SIZE, streaming=False, bins=2048,
+                          num_samples=10, executor=None):
+        """
+        Runs the simulation on a process pool.
+
+        The simulation count is split into fixed blocks of `block_size` paths, and block i
+        draws from its own stream SeedSequence(seed).spawn(num_blocks)[i]. Block 0 runs
+        in-process; the other blocks are split into one contiguous slice per worker, so at
+        most `workers` tasks are in flight and each returns a single result. Streaming slices
+        accumulate one histogram and report every block's moments, which are folded in block
+        order, so the result is bit-identical for any number of workers. The historical
+        returns are published once through shared memory instead of being pickled with
+        every task.
+
+        :param workers: Number of worker slices (default: os.cpu_count()); 1 runs in-process.
+        :param block_size: Paths per block; part of the result's identity, keep it fixed to reproduce a run.
+        :param streaming: Fold blocks into StreamingPathStatistics instead of returning every path.
+        :param bins: Histogram bins per step for streaming mode.
+        :param num_samples: Representative paths kept (from block 0) for get_fan_chart() in streaming mode.
+        :param executor: Optional long-lived pool from create_process_pool(); by default a pool is
+                         created for this run and shut down afterwards.
+        """
+        workers = workers or os.cpu_count() or 1
+        start_price, log_returns = self._calibration_window()
+        num_blocks = -(-self.num_simulations // block_size)
+        seeds = np.random.SeedSequence(self.seed).spawn(num_blocks)
+        config = {"start_price": start_price, "num_steps": self.forward_period, "path_model": self.path_model,
+                  "antithetic": self.antithetic, "dtype": self.dtype.str, "streaming": streaming, "bins": bins,
+                  "num_samples": num_samples}
+        blocks = [(seeds[i], min(block_size, self.num_simulations - i * block_size)) for i in range(num_blocks)]
+        state = {"log_returns": log_returns, **config}
+
+        # Block 0 runs first in-process: in streaming mode it sets the initial histogram range of every block
+        first = _simulate_slice(blocks[:1], state)
+        lower, width = (first[0].lower, first[0].width) if streaming else (None, None)
+        slices = [list(part) for part in np.array_split(np.arange(1, num_blocks), min(workers, num_blocks - 1))
+                  if part.size] if num_blocks > 1 else []
+
+        if workers == 1 or not slices:
+            results = (_simulate_slice([blocks[i] for i in part], state, lower, width) for part in slices)
+            collected = self._collect([first], results, streaming, bins, num_samples)
+        else:
+            shared = shared_memory.SharedMemory(create=True, size=log_returns.nbytes)
+            pool = executor or create_process_pool(len(slices))
+            futures = []
+            try:
+                np.ndarray(log_returns.shape, dtype=log_returns.dtype, buffer=shared.buf)[:] = log_returns
+                futures = [pool.submit(_simulate_shared_slice, shared.name, log_returns.shape, config,
+                                       [blocks[i] for i in part], lower, width) for part in slices]
+                collected = self._collect([first], (future.result() for future in futures), streaming, bins,
+                                          num_samples)
+            finally:
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                if executor is None:
+                    pool.shutdown()
+                shared.close()
+                shared.unlink()
+
+        self.simulation_results = None
+        if streaming:
+            self.streaming_statistics = collected
+            self.simulation_outcomes = None
+        else:
+            self.simulation_outcomes = np.concatenate(collected)
+            self.streaming_statistics = None
+
+    def _collect(self, first, rest, streaming, bins, num_samples):
+        """
+        Combines slice results in block order: paths are kept for concatenation, streaming
+        histograms are merged as they arrive and the per-block moments are folded in block order.
+        """
+        if not streaming:
+            return first + list(rest)
+        statistics = StreamingPathStatistics(self.forward_period, bins, num_samples=num_samples)
+        for histogram, moments in itertools.chain(first, rest):
+            statistics.merge_histogram(histogram)
+            for block_moments in moments:
+                statistics.fold_moments(*block_moments)
+        return statistics
 
     def get_simulation_results(self):
         """
-        Returns the results of the simulation as a DataFrame.
+        Returns the results of the simulation as a DataFrame, one row per simulated path
+        and one column per future period.
         """
-        if self.simulation_results is None:
+        if self.simulation_outcomes is None:
             raise ValueError("Simulation has not been run yet. Call simulate() first.")
+        if self.simulation_results is None:
+            self.simulation_results = pd.DataFrame(self.simulation_outcomes, columns=self._period_columns(),
+                                                   copy=False)
         return self.simulation_results
 
+    def _period_columns(self):
+        return [f'Simulation{i + 1}' for i in range(self.forward_period)]
+
+    def _period_index(self):
+        return pd.RangeIndex(1, self.forward_period + 1, name="Period")
+
     def get_mean_outcome(self):
         """
-        Returns the mean outcome across all simulations for each period as a DataFrame.
+        Returns the mean outcome across all simulations for each period as a Series.
         """
-        if self.simulation_results is None:
-            raise ValueError("Simulation has not been run yet. Call simulate() first.")
-        mean_outcome = self.simulation_results.mean(axis=0)
-        return mean_outcome
+        if self.streaming_statistics is not None:
+            return pd.Series(self.streaming_statistics.mean, index=self._period_columns())
+        return self.get_simulation_results().mean(axis=0)
 
     def get_percentile_outcome(self, percentile=50):
         """
-        Returns the percentile outcome (default 50th percentile) across all simulations for each period as a DataFrame.
+        Returns the percentile outcome (default 50th percentile) across all simulations for each period as a Series.
 
         :param percentile: The percentile to return (default is 50th percentile, i.e., median).
         """
-        if self.simulation_results is None:
+        if self.streaming_statistics is not None:
+            return pd.Series(self.streaming_statistics.quantile(percentile / 100), index=self._period_columns())
+        return self.get_simulation_results().quantile(q=percentile / 100, axis=0)
+
+    def get_fan_chart(self, percentiles=FAN_CHART_PERCENTILES, num_samples=10):
+        """
+        Summarises the simulation as percentile bands plus a few representative paths, so
+        the size of the result does not depend on num_simulations.
+
+        :param percentiles: Percentiles of the bands, e.g. (5, 25, 50, 75, 95).
+        :param num_samples: Number of representative paths (capped by what streaming runs kept).
+        :return: DataFrame indexed by period with columns "P<percentile>" and "Path <n>"
+        """
+        if self.streaming_statistics is not None:
+            samples = self.streaming_statistics.sample_paths[:num_samples]
+            bands = {f"P{p}": self.streaming_statistics.quantile(p / 100) for p in percentiles}
+        elif self.simulation_outcomes is not None:
+            samples = representative_paths(self.simulation_outcomes, num_samples)
+            bands = dict(zip((f"P{p}" for p in percentiles),
+                             np.percentile(self.simulation_outcomes, percentiles, axis=0)))
+        else:
             raise ValueError("Simulation has not been run yet. Call simulate() first.")
-        percentile_outcome = self.simulation_results.quantile(q=percentile / 100, axis=0)
-        return percentile_outcome
\ No newline at end of file
+
+        fan_chart = pd.DataFrame(bands, index=self._period_index())
+        for i, path in enumerate(samples):
+            fan_chart[f"Path {i + 1}"] = path
+        return fan_chart
+
+
+def create_process_pool(max_workers=None):
+    """
+    Process pool for simulate_parallel(). Workers are started with forkserver where available
+    (spawn otherwise) rather than fork, so a long-lived pool is safe to create from a threaded
+    server and can be shared by every run.
+
+    :param max_workers: Number of worker processes (default: os.cpu_count()).
+    :return: concurrent.futures.ProcessPoolExecutor
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+
+
+def _simulate_slice(blocks, state, lower=None, width=None):
+    """
+    Simulates consecutive blocks of paths. Returns their concatenated paths or, in streaming
+    mode, (StreamingPathStatistics, [(count, mean, m2) per block]).
+    """
+    if not state["streaming"]:
+        return np.concatenate([_generate_block(seed, num_paths, state) for seed, num_paths in blocks])
+    statistics = StreamingPathStatistics(state["num_steps"], state["bins"], lower, width, state["num_samples"])
+    moments = [statistics.update(_generate_block(seed, num_paths, state)) for seed, num_paths in blocks]
+    return statistics, moments
+
+
+def _simulate_shared_slice(shared_name, shape, config, blocks, lower, width):
+    """Pool task: reads the shared historical returns once, then simulates one slice."""
+    shared = shared_memory.SharedMemory(name=shared_name)
+    try:
+        log_returns = np.ndarray(shape, dtype=np.float64, buffer=shared.buf).copy()
+    finally:
+        shared.close()
+    return _simulate_slice(blocks, {"log_returns": log_returns, **config}, lower, width)
+
+
+def _generate_block(seed, num_paths, state):
+    return generate_price_paths(np.random.default_rng(seed), state["start_price"], state["log_returns"], num_paths,
+                                state["num_steps"], state["path_model"], state["antithetic"], state["dtype"])
+
+
+def benchmark(simulation_counts=(30, 300, 3_000, 30_000, 300_000, 1_000_000), forward_period=30):
+    """
+    Times simulate() across simulation counts for float64 and float32 results, then
+    compares the spread of the mean terminal price with and without antithetic variates.
+
+    :param simulation_counts: Numbers of simulations to time.
+    :param forward_period: Number of simulated periods per path.
+    """
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, size=10_000)))
+    history = pd.DataFrame({"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+                            "Volume": rng.integers(1e5, 1e7, size=close.size)})
+
+    print(f"{'simulations':>12} | {'float64 ms':>10} | {'float32 ms':>10} | {'float32 MB':>10}")
+    for num_simulations in simulation_counts:
+        timings = []
+        for dtype in (np.float64, np.float32):
+            simulation = MonteCarloSimulation(history, forward_period, num_simulations, seed=0, dtype=dtype)
+            runs = 3
+            timings.append(timeit.timeit(simulation.simulate, number=runs) / runs * 1e3)
+        megabytes = simulation.simulation_outcomes.nbytes / 1e6
+        print(f"{num_simulations:>12} | {timings[0]:>10.2f} | {timings[1]:>10.2f} | {megabytes:>10.1f}")
+
+    print(f"\n{'model':>10} | {'antithetic':>10} | std of mean terminal price over 200 seeds (1,000 paths each)")
+    for path_model in PATH_MODELS:
+        for antithetic in (False, True):
+            estimates = []
+            for seed in range(200):
+                simulation = MonteCarloSimulation(history, forward_period, 1_000, seed=seed, path_model=path_model,
+                                                  look_back=252, antithetic=antithetic)
+                simulation.simulate()
+                estimates.append(simulation.simulation_outcomes[:, -1].mean())
+            print(f"{path_model:>10} | {str(antithetic):>10} | {np.std(estimates):.4f}")
+
+    print(f"\n{'percentile':>10} | max relative error of the streaming estimate vs exact (200,000 paths)")
+    exact = MonteCarloSimulation(history, forward_period, 200_000, seed=1, path_model="gbm", look_back=252)
+    exact.simulate()
+    streaming = MonteCarloSimulation(history, forward_period, 200_000, seed=1, path_model="gbm", look_back=252)
+    streaming.simulate_streaming(chunk_size=20_000)
+    for percentile in (5, 25, 50, 75, 95):
+        error = np.abs(streaming.get_percentile_outcome(percentile) / exact.get_percentile_outcome(percentile) - 1)
+        print(f"{percentile:>10} | {error.max():.2e}")
+    mean_error = np.abs(streaming.get_mean_outcome() / exact.get_mean_outcome() - 1).max()
+    print(f"{'mean':>10} | {mean_error:.2e}")
+
+    print(f"\n{'workers':>10} | {'seconds':>8} | {'speed-up':>8} | identical to 1 worker (1,000,000 paths x 252 steps)")
+    reference, baseline = None, None
+    for workers in (1, 2, 4, 8):
+        simulation = MonteCarloSimulation(history, 252, 1_000_000, seed=2, path_model="gbm", look_back=252)
+        started = time.perf_counter()
+        simulation.simulate_parallel(workers=workers, streaming=True)
+        elapsed = time.perf_counter() - started
+        statistics = simulation.streaming_statistics
+        if reference is None:
+            reference, baseline = statistics, elapsed
+        identical = np.array_equal(statistics.counts, reference.counts) and np.array_equal(statistics.mean,
+                                                                                           reference.mean)
+        print(f"{workers:>10} | {elapsed:>8.2f} | {baseline / elapsed:>7.2f}x | {identical}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Option-chain loading, batched pricing and implied-volatility surface construction.
+"""
+
+import orjson
+import numpy as np
+import pandas as pd
+from src.core.black_scholes_model import price_batch
+from src.core.implied_volatility import implied_volatility
+
+CHAIN_COLUMNS = ["contractSymbol", "expiration", "option_type", "strike", "lastPrice", "bid", "ask", "volume",
+                 "openInterest"]
+
+
+def fetch_option_chain(provider, symbol: str) -> pd.DataFrame:
+    """
+    Downloads every listed expiry of a symbol into a single flat DataFrame.
+
+    :param provider: A MarketDataProvider.
+    :param symbol: Ticker symbol.
+    :return: DataFrame with CHAIN_COLUMNS, one row per contract.
+    """
+    frames = []
+    for expiration in provider.option_expirations(symbol):
+        calls, puts = provider.option_chain(symbol, expiration)
+        for option_type, contracts in (("call", calls), ("put", puts)):
+            frames.append(contracts.assign(expiration=expiration, option_type=option_type))
+
+    if not frames:
+        return pd.DataFrame(columns=CHAIN_COLUMNS)
+    return pd.concat(frames, ignore_index=True).reindex(columns=CHAIN_COLUMNS)
+
+
+def load_option_chain_fixture(file_path: str):
+    """
+    Loads an option chain saved as JSON (recorded or synthetic) so the chain pricing can
+    run offline (see also RecordReplayProvider for replaying whole upstream sessions).
+
+    The fixture is a JSON object {"symbol", "snapshot", "current_price", "contracts": [...]}
+    where each contract record carries the CHAIN_COLUMNS fields.
+
+    :param file_path: Path to the JSON fixture.
+    :return: Tuple (chain DataFrame, current_price, snapshot)
+    """
+    with open(file_path, "rb") as f:
+        fixture = orjson.loads(f.read())
+    chain = pd.DataFrame(fixture["contracts"]).reindex(columns=CHAIN_COLUMNS)
+    return chain, fixture["current_price"], fixture["snapshot"]
+
+
+def price_option_chain(chain: pd.DataFrame, current_price: float, interest_rate: float, volatility: float,
+                       snapshot) -> pd.DataFrame:
+    """
+    Prices every contract of an option chain in one batched computation and derives
+    each contract's implied volatility from its market quote.
+
+    :param chain: DataFrame with CHAIN_COLUMNS (see fetch_option_chain).
+    :param current_price: Current price of the underlying asset (S).
+    :param interest_rate: Risk-free interest rate (r).
+    :param volatility: Volatility used for the theoretical model price (e.g. historical volatility).
+    :param snapshot: Valuation time (anything pd.Timestamp accepts).
+    :return: The chain with time_to_maturity, market_price, model_price, delta, gamma,
+             vega and implied_volatility columns added.
+    """
+    chain = chain.copy()
+    as_of = pd.Timestamp(snapshot).tz_localize(None).normalize()
+    days = (pd.to_datetime(chain["expiration"]) - as_of).dt.days.to_numpy(dtype=float)
+    chain["time_to_maturity"] = np.maximum(days, 1.0) / 365.0
+
+    # Mid quote where a two-sided market exists, otherwise the last traded price
+    bid = chain["bid"].to_numpy(dtype=float)
+    ask = chain["ask"].to_numpy(dtype=float)
+    has_market = (bid > 0) & (ask > 0)
+    chain["market_price"] = np.where(has_market, 0.5 * (bid + ask), chain["lastPrice"].to_numpy(dtype=float))
+
+    is_call = (chain["option_type"] == "call").to_numpy()
+    strike = chain["strike"].to_numpy(dtype=float)
+    time_to_maturity = chain["time_to_maturity"].to_numpy()
+
+    results = price_batch(time_to_maturity, strike, current_price, volatility, interest_rate)
+    chain["model_price"] = np.where(is_call, results["call_price"], results["put_price"])
+    chain["delta"] = np.where(is_call, results["call_delta"], results["put_delta"])
+    chain["gamma"] = results["gamma"]
+    chain["vega"] = results["vega"]
+
+    chain["implied_volatility"], _ = implied_volatility(chain["market_price"].to_numpy(), current_price, strike,
+                                                        time_to_maturity, interest_rate, is_call)
+    return chain
+
+
+def build_volatility_surface(priced_chain: pd.DataFrame, current_price: float) -> pd.DataFrame:
+    """
+    Builds a strike x expiry implied-volatility surface from a priced chain.
+
+    Out-of-the-money contracts are the liquid side of the chain, so puts are used below
+    the current price and calls at or above it.
+
+    :param priced_chain: Output of price_option_chain().
+    :param current_price: Current price of the underlying asset (S).
+    :return: DataFrame indexed by strike with one column per expiration (NaN where no quote).
+    """
+    is_call = priced_chain["option_type"] == "call"
+    out_of_the_money = np.where(priced_chain["strike"] >= current_price, is_call, ~is_call)
+    surface = priced_chain[out_of_the_money].pivot_table(index="strike", columns="expiration",
+                                                         values="implied_volatility", aggfunc="mean")
+    return surface.sort_index().sort_index(axis=1)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Multi-leg option/stock positions evaluated over a scenario cube with the Black-Scholes model.
+"""
+
+import timeit
+import numpy as np
+from src.core.black_scholes_model import BlackScholesModel
+
+LEG_TYPES = ("call", "put", "stock")
+SCENARIO_KEYS = ("value", "pnl", "delta", "gamma", "vega", "theta")
+
+
+class PositionLeg:
+    def __init__(self, leg_type: str, quantity: float, strike: float = 0.0, time_to_maturity: float = 0.0,
+                 volatility: float = 0.0, entry_price: float = None):
+        """
+        One leg of a position.
+
+        :param leg_type: "call", "put" or "stock".
+        :param quantity: Signed number of contracts/shares (negative for short).
+        :param strike: Strike price (K); ignored for stock.
+        :param time_to_maturity: Time to option expiration (T); ignored for stock.
+        :param volatility: Volatility used to price the leg (o); ignored for stock.
+        :param entry_price: Price paid per unit; defaults to the model value at the current price.
+        """
+        if leg_type not in LEG_TYPES:
+            raise ValueError(f"Unknown leg type {leg_type!r}, expected one of {LEG_TYPES}.")
+        self.leg_type = leg_type
+        self.quantity = quantity
+        self.strike = strike
+        self.time_to_maturity = time_to_maturity
+        self.volatility = volatility
+        self.entry_price = entry_price
+
+
+class OptionPortfolio:
+    def __init__(self, legs, current_price: float, interest_rate: float):
+        """
+        A multi-leg position whose value, PnL and Greeks are evaluated over a scenario cube.
+
+        :param legs: List of PositionLeg.
+        :param current_price: Current price of the underlying asset (S).
+        :param interest_rate: Risk-free interest rate (r).
+        """
+        self.legs = legs
+        self.current_price = current_price
+        self.interest_rate = interest_rate
+
+        self._quantity = np.array([leg.quantity for leg in legs], dtype=float)
+        self._strike = np.array([leg.strike for leg in legs], dtype=float)
+        self._maturity = np.array([leg.time_to_maturity for leg in legs], dtype=float)
+        self._volatility = np.array([leg.volatility for leg in legs], dtype=float)
+        self._is_call = np.array([leg.leg_type == "call" for leg in legs])
+        self._is_stock = np.array([leg.leg_type == "stock" for leg in legs])
+
+        today = self._leg_values(np.float64(current_price), 0.0, 0.0)["value"]
+        self._entry_price = np.array([today[i] if leg.entry_price is None else leg.entry_price
+                                      for i, leg in enumerate(legs)], dtype=float)
+
+    def _leg_values(self, spot, vol_shift, elapsed):
+        """Per-unit value and Greeks of every leg; the leg axis is the last axis."""
+        call = self._is_call
+        stock = self._is_stock
+        time_left = self._maturity - elapsed
+        # Expired options are worth their intrinsic value and carry no Greeks; the model only
+        # sees live options (stock and expired legs get a placeholder maturity that is discarded)
+        expired = (time_left <= 0) & ~stock
+        live_time = np.where(expired | stock, 1.0, time_left)
+        volatility = np.maximum(self._volatility + vol_shift, 1e-6)
+        option_strike = np.where(stock, 1.0, self._strike)
+
+        results = BlackScholesModel(live_time, option_strike, spot, volatility, self.interest_rate).calculate_all()
+        intrinsic = np.where(call, np.maximum(spot - self._strike, 0.0), np.maximum(self._strike - spot, 0.0))
+
+        def option_value(live):
+            return np.where(expired, 0.0, live)
+
+        return {
+            "value": np.where(stock, spot, np.where(expired, intrinsic,
+                                                    np.where(call, results["call_price"], results["put_price"]))),
+            "delta": np.where(stock, 1.0, option_value(np.where(call, results["call_delta"], results["put_delta"]))),
+            "gamma": np.where(stock, 0.0, option_value(results["gamma"])),
+            "vega": np.where(stock, 0.0, option_value(results["vega"])),
+            "theta": np.where(stock, 0.0, option_value(np.where(call, results["call_theta"], results["put_theta"]))),
+        }
+
+    def evaluate_scenarios(self, spot_shocks, vol_shocks, time_decay):
+        """
+        Evaluates the aggregated position over every (spot shock, vol shock, elapsed time)
+        combination in one broadcasted computation.
+
+        :param spot_shocks: Relative spot moves, e.g. np.linspace(-0.2, 0.2, 41).
+        :param vol_shocks: Additive volatility shifts, e.g. np.linspace(-0.1, 0.1, 5).
+        :param time_decay: Elapsed time in years, e.g. [0, 7 / 365, 30 / 365].
+        :return: dict of arrays with shape (len(spot_shocks), len(vol_shocks), len(time_decay))
+                 for the keys in SCENARIO_KEYS
+        """
+        spot = self.current_price * (1 + np.asarray(spot_shocks, dtype=float))[:, None, None, None]
+        vol_shift = np.asarray(vol_shocks, dtype=float)[None, :, None, None]
+        elapsed = np.asarray(time_decay, dtype=float)[None, None, :, None]
+
+        per_unit = self._leg_values(spot, vol_shift, elapsed)
+        scenarios = {key: per_unit[key] @ self._quantity for key in per_unit}
+        scenarios["pnl"] = (per_unit["value"] - self._entry_price) @ self._quantity
+        return scenarios
+
+
+def strategy_legs(strategy: str, current_price: float, time_to_maturity: float, volatility: float, width: float = 0.05):
+    """
+    Builds the legs of a common strategy with strikes spaced `width` (relative) around the current price.
+
+    :param strategy: One of "Bull Call Spread", "Bear Put Spread", "Long Straddle", "Iron Condor", "Covered Call".
+    :param current_price: Current price of the underlying asset (S).
+    :param time_to_maturity: Time to expiration of every option leg (T).
+    :param volatility: Volatility used for every option leg (o).
+    :param width: Relative strike spacing.
+    :return: List of PositionLeg
+    """
+    def option(leg_type, quantity, offset):
+        return PositionLeg(leg_type, quantity, round(current_price * (1 + offset * width), 2), time_to_maturity,
+                           volatility)
+
+    strategies = {
+        "Bull Call Spread": lambda: [option("call", 1, 0), option("call", -1, 1)],
+        "Bear Put Spread": lambda: [option("put", 1, 0), option("put", -1, -1)],
+        "Long Straddle": lambda: [option("call", 1, 0), option("put", 1, 0)],
+        "Iron Condor": lambda: [option("put", 1, -2), option("put", -1, -1), option("call", -1, 1),
+                                option("call", 1, 2)],
+        "Covered Call": lambda: [PositionLeg("stock", 100), option("call", -100, 1)],
+    }
+    if strategy not in strategies:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {list(strategies)}.")
+    return strategies[strategy]()
+
+
+if __name__ == "__main__":
+    portfolio = OptionPortfolio(strategy_legs("Iron Condor", 100.0, 0.25, 0.2), current_price=100.0,
+                                interest_rate=0.05)
+    spot_shocks = np.linspace(-0.2, 0.2, 81)
+    vol_shocks = np.linspace(-0.1, 0.1, 11)
+    time_decay = np.arange(0, 60, 5) / 365
+    runs = 50
+    elapsed = timeit.timeit(lambda: portfolio.evaluate_scenarios(spot_shocks, vol_shocks, time_decay), number=runs)
+    print(f"{spot_shocks.size * vol_shocks.size * time_decay.size} scenarios x {len(portfolio.legs)} legs: "
+          f"{elapsed / runs * 1e3:.2f} ms")
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Persistent on-disk OHLCV store, one memory-mapped column file per field and symbol.
+"""
+
+import os
+import re
+import time
+import threading
+import orjson
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+DEFAULT_ROOT = "data/bars"
+META_FILE = "meta.json"
+INFO_FILE = "info.json"
+INDEX_FILE = "index.bin"
+# Columns whose new non-zero values mean previously stored (adjusted) prices are stale
+CORPORATE_ACTION_COLUMNS = ("Dividends", "Stock Splits")
+
+
+def _generation_file(file_name: str, generation: Optional[int]) -> str:
+    """Name of a data file in a generation; stores written before generations use the bare name."""
+    if generation is None:
+        return file_name
+    stem, extension = os.path.splitext(file_name)
+    return f"{stem}.{generation}{extension}"
+
+
+class BarStore:
+    def __init__(self, root: str = DEFAULT_ROOT):
+        """
+        Columnar bar store. Every symbol is a directory holding a raw int64 UTC-nanosecond
+        index file, one raw float64 file per column and a meta.json with the row count.
+        Reads memory-map the column files, so loading a symbol does not copy its history.
+
+        Files are never modified once meta.json points at them: an append writes a new
+        generation of files (kept rows plus new rows), atomically replaces meta.json to
+        switch to it and only then unlinks the previous generation. Readers still mapping
+        the old files keep a valid view (truncating a mapped file would fault them), and
+        an interrupted write leaves only unreferenced files behind.
+
+        :param root: Directory that holds one sub-directory per symbol.
+        """
+        self.root = root
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _symbol_dir(self, symbol: str) -> str:
+        return os.path.join(self.root, re.sub(r"[^A-Za-z0-9.^=_-]", "_", symbol.upper()))
+
+    def _lock(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(symbol.upper(), threading.Lock())
+
+    def read_meta(self, symbol: str) -> Optional[dict]:
+        """Returns the stored metadata of a symbol, or None if it has never been stored."""
+        return self._read_json(symbol, META_FILE)
+
+    def _read_json(self, symbol: str, file_name: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(self._symbol_dir(symbol), file_name), "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def _write_json(self, symbol: str, file_name: str, data: dict):
+        path = os.path.join(self._symbol_dir(symbol), file_name)
+        with open(path + ".tmp", "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(path + ".tmp", path)
+
+    def _write_meta(self, symbol: str, meta: dict):
+        self._write_json(symbol, META_FILE, meta)
+
+    def _map(self, symbol: str, meta: dict) -> tuple:
+        """Read-only memory maps of the index and every column of the current generation."""
+        directory, rows, generation = self._symbol_dir(symbol), meta["rows"], meta.get("generation")
+        index = np.memmap(os.path.join(directory, _generation_file(INDEX_FILE, generation)), dtype=np.int64,
+                          mode="r", shape=(rows,))
+        columns = {name: np.memmap(os.path.join(directory, _generation_file(f"col_{i}.bin", generation)),
+                                   dtype=np.float64, mode="r", shape=(rows,))
+                   for i, name in enumerate(meta["columns"])}
+        return index, columns
+
+    def read(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Loads a symbol's bars as a DataFrame backed by read-only memory maps.
+
+        :param symbol: Ticker symbol.
+        :return: DataFrame indexed by timestamp, or None if the symbol is not stored
+        """
+        while True:
+            meta = self.read_meta(symbol)
+            if meta is None:
+                return None
+            if meta["rows"] == 0:
+                return pd.DataFrame(columns=meta["columns"], index=pd.DatetimeIndex([], tz=meta["timezone"]))
+            try:
+                index, columns = self._map(symbol, meta)
+                break
+            except FileNotFoundError:
+                continue  # An append switched generations between reading meta and mapping; use the new one
+
+        timestamps = pd.DatetimeIndex(pd.to_datetime(index, utc=True)).tz_convert(meta["timezone"])
+        timestamps.name = meta.get("index_name")
+        return pd.DataFrame(columns, index=timestamps, copy=False)
+
+    def append(self, symbol: str, bars: pd.DataFrame):
+        """
+        Appends bars to a symbol. Stored rows at or after the first new timestamp are
+        replaced, so re-fetching the latest (possibly still forming) bar updates it in place.
+
+        Columns missing from the new bars are stored as NaN for those rows; columns the
+        store has not seen before are added, with NaN for the stored rows.
+
+        :param symbol: Ticker symbol.
+        :param bars: DataFrame indexed by timestamp with numeric columns.
+        """
+        if bars.empty:
+            return
+
+        with self._lock(symbol):
+            directory = self._symbol_dir(symbol)
+            os.makedirs(directory, exist_ok=True)
+            meta = self.read_meta(symbol)
+            index = bars.index if bars.index.tz is not None else bars.index.tz_localize("UTC")
+            new_index = index.tz_convert("UTC").as_unit("ns").asi8
+            new_columns = [str(column) for column in bars.columns]
+
+            if meta is None:
+                meta = {"columns": new_columns, "rows": 0, "timezone": str(index.tz), "index_name": bars.index.name}
+            stored_columns = list(meta["columns"])
+            columns = stored_columns + [column for column in new_columns if column not in stored_columns]
+
+            if meta["rows"]:
+                stored_index, stored_values = self._map(symbol, meta)
+                keep_rows = int(np.searchsorted(stored_index, new_index[0], side="left"))
+            else:
+                stored_index, stored_values, keep_rows = np.empty(0, dtype=np.int64), {}, 0
+
+            values = bars.set_axis(new_columns, axis=1).reindex(columns=columns).to_numpy(dtype=np.float64)
+            generation = meta.get("generation", -1) + 1
+            files = [(INDEX_FILE, stored_index[:keep_rows], new_index)]
+            for i, column in enumerate(columns):
+                stored = stored_values[column][:keep_rows] if column in stored_values else np.full(keep_rows, np.nan)
+                files.append((f"col_{i}.bin", stored, values[:, i]))
+            for file_name, stored, new in files:
+                with open(os.path.join(directory, _generation_file(file_name, generation)), "wb") as f:
+                    f.write(np.ascontiguousarray(stored).tobytes())
+                    f.write(np.ascontiguousarray(new).tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+            del stored_index, stored_values
+
+            meta.update(columns=columns, rows=keep_rows + len(new_index), generation=generation,
+                        refreshed_at=time.time())
+            self._write_meta(symbol, meta)
+            self._remove_stale_files(directory, generation)
+
+    @staticmethod
+    def _remove_stale_files(directory: str, generation: int):
+        """Unlinks data files of other generations; mapped views of them stay valid until closed."""
+        for file_name in os.listdir(directory):
+            match = re.fullmatch(r"(?:index|col_\d+)(?:\.(\d+))?\.bin", file_name)
+            if match and match.group(1) != str(generation):
+                try:
+                    os.remove(os.path.join(directory, file_name))
+                except OSError:
+                    pass  # Still open elsewhere (e.g. on Windows); removed by a later append
+
+    def touch(self, symbol: str):
+        """Marks a symbol as refreshed now without changing its bars."""
+        with self._lock(symbol):
+            meta = self.read_meta(symbol)
+            if meta is not None:
+                meta["refreshed_at"] = time.time()
+                self._write_meta(symbol, meta)
+
+    def read_info(self, symbol: str, max_age: float = None) -> Optional[dict]:
+        """
+        Returns the instrument info stored next to a symbol's bars.
+
+        :param symbol: Ticker symbol.
+        :param max_age: Seconds the stored info is considered fresh; None accepts any age.
+        :return: The info dict, or None if it is missing or older than max_age
+        """
+        record = self.read_info_record(symbol, max_age)
+        return None if record is None else record["info"]
+
+    def read_info_record(self, symbol: str, max_age: float = None) -> Optional[dict]:
+        """
+        Same as read_info, but returns {"info": ..., "refreshed_at": <epoch seconds>} so callers
+        can age the info from when it was fetched rather than from when it was read.
+        """
+        stored = self._read_json(symbol, INFO_FILE)
+        if stored is None or (max_age is not None and time.time() - stored["refreshed_at"] >= max_age):
+            return None
+        return stored
+
+    def write_info(self, symbol: str, info: dict):
+        """Stores the instrument info of a symbol next to its bars."""
+        with self._lock(symbol):
+            os.makedirs(self._symbol_dir(symbol), exist_ok=True)
+            self._write_json(symbol, INFO_FILE, {"info": info, "refreshed_at": time.time()})
+
+
+def load_history(store: BarStore, provider, symbol: str, max_age: float = 3600.0) -> pd.DataFrame:
+    """
+    Returns the full daily history of a symbol, hitting the network only when needed.
+
+    A symbol refreshed less than `max_age` seconds ago is served straight from disk. An
+    older one fetches only the bars since its last stored day and appends them; an
+    unknown symbol downloads its whole history once. Provider prices are adjusted for
+    dividends and splits, so an increment carrying a corporate action the store has not
+    seen re-downloads the whole history rather than mixing two adjustment bases.
+
+    :param store: BarStore instance.
+    :param provider: A MarketDataProvider.
+    :param symbol: Ticker symbol.
+    :param max_age: Seconds a stored history is considered fresh.
+    :return: DataFrame of daily bars
+    """
+    meta = store.read_meta(symbol)
+    if meta is not None and meta["rows"] and time.time() - meta.get("refreshed_at", 0) < max_age:
+        return store.read(symbol)
+
+    if meta is None or not meta["rows"]:
+        bars = provider.history(symbol, period="max")
+        store.append(symbol, bars)
+        stored = store.read(symbol)
+        return bars if stored is None else stored
+
+    stored = store.read(symbol)
+    new_bars = provider.history(symbol, start=stored.index[-1].date().isoformat())
+    if new_bars.empty:
+        store.touch(symbol)
+    elif _has_new_corporate_actions(stored, new_bars):
+        # Starts at or before the first stored bar, so every stored row is replaced
+        store.append(symbol, provider.history(symbol, period="max"))
+    else:
+        store.append(symbol, new_bars)
+    return store.read(symbol)
+
+
+def _has_new_corporate_actions(stored: pd.DataFrame, new_bars: pd.DataFrame) -> bool:
+    """True when the new bars carry a non-zero dividend or split that the stored bars do not."""
+    columns = [column for column in CORPORATE_ACTION_COLUMNS if column in new_bars.columns]
+    if not columns:
+        return False
+    fresh = new_bars[columns].fillna(0.0).to_numpy()
+    known = stored.reindex(index=new_bars.index, columns=columns).fillna(0.0).to_numpy()
+    return bool(((fresh != 0) & (fresh != known)).any())
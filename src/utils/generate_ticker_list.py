@@ -3,13 +3,38 @@
 """
     Date: 04/04/2024
     Author: Joshua David Golafshan
+    Description: Builds static/tickers.json from the EODData stock lists with a bounded-concurrency, pooled fetcher.
+
+    Usage:
+        python -m src.utils.generate_ticker_list --output static/tickers.json --columnar static/tickers
+        python -m src.utils.generate_ticker_list --save-fixtures data/eoddata      # record the raw pages
+        python -m src.utils.generate_ticker_list --fixtures data/eoddata          # rebuild offline
+        python -m src.utils.generate_ticker_list --incremental --delta-output delta.json  # nightly refresh
+        python -m src.utils.generate_ticker_list --fixtures data/eoddata --benchmark-parsers
 """
+import os
 import json
+import time
+import hashlib
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+from email.utils import formatdate
 
 import requests
 from tqdm import tqdm
 from bs4 import BeautifulSoup
-from typing import Optional, Any, List, Tuple
+from requests.adapters import HTTPAdapter
+from html.parser import HTMLParser
+from typing import Optional, Any, Callable, List, Tuple
+from src.utils.resilience import TokenBucket
+from src.utils.ticker_directory import DEFAULT_ROOT, json_to_ticker_directory
+
+BASE_URL = "https://www.eoddata.com/stocklist/{exchange_code}/{first_letter}.htm"
+# Manifest key -> response header carrying the validator, and the request header that sends it back
+VALIDATOR_HEADERS = {"etag": "ETag", "last_modified": "Last-Modified"}
+CONDITIONAL_HEADERS = {"etag": "If-None-Match", "last_modified": "If-Modified-Since"}
 
 exchange_list = [
     {"exchange_name": "American Stock Exchange", "exchange_code": "AMEX"},
@@ -36,19 +61,170 @@ starting_letter = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', '
                    'U', 'V', 'W', 'X', 'Y', 'Z']
 
 
-def parse_html(exchange_code: str, first_letter: str) -> Optional[Any]:
-    url = f"https://www.eoddata.com/stocklist/{exchange_code}/{first_letter}.htm"
-
-    # Send GET request
-    response = requests.get(url)
-
-    # Check if request was successful
-    if response.status_code != 200:
-        print(f"Failed to fetch data for {exchange_code} - {first_letter}. Status Code: {response.status_code}")
-        return None  # Return None to indicate failure
+def build_session(pool_size: int = 8) -> requests.Session:
+    """
+    Session with a connection pool sized for the fetcher. Retries are left to HostLimiter,
+    so every attempt goes through the per-host limits.
 
-    # Parse the HTML
-    return BeautifulSoup(response.text, "html.parser")
+    :param pool_size: Connections kept alive per host.
+    :return: requests.Session
+    """
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "Financial-Instrument-Dashboard ticker directory builder"
+    return session
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HostLimiter:
+    def __init__(self, max_concurrent: int = 4, rate: float = 4.0, retries: int = 3, backoff: float = 0.5,
+                 max_backoff: float = 30.0):
+        """
+        Per-host politeness: at most `max_concurrent` requests in flight and `rate`
+        requests per second to any single host, however many workers are fetching.
+        Connection errors, 429 and 5xx answers are retried with exponential backoff
+        (honouring Retry-After); every retry takes a new token and slot, and the wait
+        happens without holding a slot.
+
+        :param max_concurrent: Concurrent requests per host.
+        :param rate: Sustained requests per second per host.
+        :param retries: Retries per request after the first attempt.
+        :param backoff: Delay before the first retry in seconds, doubled on every retry.
+        :param max_backoff: Upper bound of a single delay, including Retry-After.
+        """
+        self.max_concurrent = max_concurrent
+        self.rate = rate
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host: str):
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = (threading.BoundedSemaphore(self.max_concurrent),
+                                     TokenBucket(rate=self.rate, capacity=self.max_concurrent))
+            return self._hosts[host]
+
+    def get(self, session: requests.Session, url: str, timeout: float = 30.0,
+            headers: Optional[dict] = None) -> requests.Response:
+        semaphore, bucket = self._host(urlsplit(url).netloc)
+        for attempt in range(self.retries + 1):
+            with semaphore:
+                bucket.acquire()
+                try:
+                    response = session.get(url, timeout=timeout, headers=headers)
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt == self.retries:
+                        raise
+                    response = None
+            if response is not None and (response.status_code not in RETRY_STATUSES or attempt == self.retries):
+                return response
+            time.sleep(self._delay(attempt, response))
+
+    def _delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Seconds before the next attempt: Retry-After when the server sent seconds, else exponential."""
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        delay = float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt
+        return min(delay, self.max_backoff)
+
+
+class HttpPageSource:
+    def __init__(self, session: requests.Session, limiter: HostLimiter, save_directory: Optional[str] = None,
+                 timeout: float = 30.0):
+        """
+        Fetches stock list pages over HTTP.
+
+        :param session: Pooled session from build_session().
+        :param limiter: Per-host politeness limits.
+        :param save_directory: If given, every fetched page is also written there as a fixture.
+        :param timeout: Request timeout in seconds.
+        """
+        self.session = session
+        self.limiter = limiter
+        self.save_directory = save_directory
+        self.timeout = timeout
+
+    def fetch(self, exchange_code: str, first_letter: str) -> Optional[str]:
+        result = self.fetch_if_changed(exchange_code, first_letter)
+        return None if result is None else result[0]
+
+    def fetch_if_changed(self, exchange_code: str, first_letter: str,
+                         validators: Optional[dict] = None) -> Optional[Tuple[Optional[str], dict]]:
+        """
+        Conditional GET: the stored ETag / Last-Modified are sent as If-None-Match /
+        If-Modified-Since, so an unchanged page costs a 304 without a body.
+
+        :param validators: {"etag": ..., "last_modified": ...} from the previous fetch.
+        :return: None if the fetch failed, else (html or None if not modified, new validators)
+        """
+        validators = validators or {}
+        headers = {header: validators[key] for key, header in CONDITIONAL_HEADERS.items() if validators.get(key)}
+        url = BASE_URL.format(exchange_code=exchange_code, first_letter=first_letter)
+        response = self.limiter.get(self.session, url, timeout=self.timeout, headers=headers or None)
+
+        received = {key: response.headers[header] for key, header in VALIDATOR_HEADERS.items()
+                    if response.headers.get(header)}
+        if response.status_code == 304 and headers:
+            return None, {**validators, **received}
+
+        # Check if request was successful
+        if response.status_code != 200:
+            tqdm.write(f"Failed to fetch data for {exchange_code} - {first_letter}. "
+                       f"Status Code: {response.status_code}")
+            return None
+
+        if self.save_directory:
+            path = fixture_path(self.save_directory, exchange_code, first_letter)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(response.text)
+        return response.text, received
+
+
+class FixturePageSource:
+    def __init__(self, directory: str, latency: float = 0.0):
+        """
+        Reads stock list pages saved by HttpPageSource, so a rebuild can run offline.
+
+        :param directory: Fixture directory (<directory>/<exchange_code>/<letter>.htm).
+        :param latency: Seconds of artificial delay per page, to simulate the network.
+        """
+        self.directory = directory
+        self.latency = latency
+
+    def fetch(self, exchange_code: str, first_letter: str) -> Optional[str]:
+        result = self.fetch_if_changed(exchange_code, first_letter)
+        return None if result is None else result[0]
+
+    def fetch_if_changed(self, exchange_code: str, first_letter: str,
+                         validators: Optional[dict] = None) -> Optional[Tuple[Optional[str], dict]]:
+        """Same contract as HttpPageSource.fetch_if_changed, with the file's mtime as Last-Modified."""
+        if self.latency:
+            time.sleep(self.latency)
+        path = fixture_path(self.directory, exchange_code, first_letter)
+        try:
+            last_modified = formatdate(os.path.getmtime(path), usegmt=True)
+            if (validators or {}).get("last_modified") == last_modified:
+                return None, validators
+            with open(path, encoding="utf-8") as f:
+                return f.read(), {"last_modified": last_modified}
+        except FileNotFoundError:
+            return None
+
+
+def fixture_path(directory: str, exchange_code: str, first_letter: str) -> str:
+    return os.path.join(directory, exchange_code, f"{first_letter}.htm")
+
+
+def parse_html(html: str) -> Any:
+    return BeautifulSoup(html, "html.parser")
 
 
 def extract_tickers(parsed_html: Any) -> List[Tuple[str, str]]:
@@ -58,7 +234,6 @@ def extract_tickers(parsed_html: Any) -> List[Tuple[str, str]]:
     table = parsed_html.find("table", class_="quotes")
 
     if not table:
-        print("No stock data table found.")
         return tickers  # Return empty list if table is missing
 
     # Iterate through each row, extracting the first two columns directly
@@ -73,37 +248,267 @@ def extract_tickers(parsed_html: Any) -> List[Tuple[str, str]]:
     return tickers
 
 
-def run(letters=None) -> List[Any]:
+def extract_tickers_bs4(html: str) -> List[Tuple[str, str]]:
+    """Reference backend: BeautifulSoup with the pure-Python html.parser."""
+    return extract_tickers(parse_html(html))
+
+
+def extract_tickers_lxml(html: str) -> List[Tuple[str, str]]:
+    """
+    lxml backend: parses in C and selects the rows of the first table.quotes with XPath.
+    Requires the optional lxml package.
     """
-    Fetches tickers from all exchanges for each letter.
+    import lxml.html
 
-    Args:
-        letters (List[str], optional): Subset of letters to fetch. Defaults to A-Z.
+    tables = lxml.html.fromstring(html).xpath(
+        '//table[contains(concat(" ", normalize-space(@class), " "), " quotes ")]')
+    if not tables:
+        return []
+
+    tickers = []
+    for row in list(tables[0].iter("tr"))[1:]:  # Skip the header row
+        cols = row.findall(".//td")
+        if len(cols) > 1:
+            tickers.append((cols[0].text_content().strip(), cols[1].text_content().strip()))
+    return tickers
 
-    Returns:
-        List[Tuple[str, str]]: List of (ticker, company_name).
+
+class _QuotesTableTokenizer(HTMLParser):
+    """
+    Streaming tokenizer that only materialises the text of the first two cells of each
+    row of the first table.quotes; everything outside that table is skipped.
     """
-    if letters is None:
-        letters = starting_letter  # Default to A-Z
 
-    all_tickers = []  # Store all tickers and names
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tickers = []
+        self._table_depth = 0  # > 0 while inside the quotes table (counts nested tables)
+        self._done = False
+        self._rows_seen = 0
+        self._cells = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if tag == "table":
+            if self._table_depth:
+                self._table_depth += 1
+            elif "quotes" in (dict(attrs).get("class") or "").split():
+                self._table_depth = 1
+        elif not self._table_depth:
+            return
+        elif tag == "tr":
+            self._end_row()
+            self._rows_seen += 1
+            self._cells = []
+        elif tag == "td" and self._cells is not None:
+            self._end_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if not self._table_depth:
+            return
+        if tag == "td":
+            self._end_cell()
+        elif tag == "tr":
+            self._end_row()
+        elif tag == "table":
+            self._table_depth -= 1
+            if not self._table_depth:
+                self._end_row()
+                self._done = True
+
+    def handle_data(self, data):
+        if self._cell is not None and len(self._cells) < 2:
+            self._cell.append(data)
+
+    def close(self):
+        super().close()
+        self._end_row()  # Tolerate a table truncated before </tr>
+
+    def _end_cell(self):
+        if self._cell is not None:
+            self._cells.append("".join(self._cell).strip())
+            self._cell = None
+
+    def _end_row(self):
+        self._end_cell()
+        # The first row of the table is the header row
+        if self._cells is not None and self._rows_seen > 1 and len(self._cells) > 1:
+            self.tickers.append((self._cells[0], self._cells[1]))
+        self._cells = None
+
+
+def extract_tickers_stream(html: str) -> List[Tuple[str, str]]:
+    """Dependency-free backend: a streaming stdlib tokenizer targeting table.quotes rows."""
+    tokenizer = _QuotesTableTokenizer()
+    tokenizer.feed(html)
+    tokenizer.close()
+    return tokenizer.tickers
+
+
+PARSER_BACKENDS = {
+    "bs4": extract_tickers_bs4,
+    "lxml": extract_tickers_lxml,
+    "stream": extract_tickers_stream,
+}
+
+
+def get_parser(name: str = "auto") -> Callable[[str], List[Tuple[str, str]]]:
+    """
+    Looks up a parsing backend. "auto" picks lxml when it is installed and the
+    streaming tokenizer otherwise.
 
-    for exchange in tqdm(exchange_list, desc="Fetching Exchanges"):
-        exchange_code = exchange["exchange_code"]
-        exchange_name = exchange["exchange_name"]
+    :param name: "auto", "bs4", "lxml" or "stream".
+    :return: Function mapping page HTML to a list of (ticker, company_name)
+    """
+    if name == "auto":
+        try:
+            import lxml.html  # noqa: F401
+            name = "lxml"
+        except ImportError:
+            name = "stream"
+    return PARSER_BACKENDS[name]
 
-        for letter in tqdm(letters, desc=f"{exchange_code} - Letters", leave=False):
-            try:
-                html = parse_html(exchange_code, letter)
 
-                if html:
-                    tickers_and_names = extract_tickers(html)
-                    for ticker, name in tickers_and_names:
+def fetch_page(source, exchange: dict, letter: str,
+               parser: Callable[[str], List[Tuple[str, str]]] = extract_tickers_bs4) -> List[Tuple[str, str, str, str]]:
+    """
+    Fetches and parses one stock list page.
+
+    :return: List of (ticker, company_name, exchange_code, exchange_name)
+    """
+    html = source.fetch(exchange["exchange_code"], letter)
+    if html is None:
+        return []
+    return [(ticker, name, exchange["exchange_code"], exchange["exchange_name"]) for ticker, name in parser(html)]
 
-                        all_tickers.append((ticker, name, exchange_code, exchange_name))
 
-            except Exception as e:
-                print(f"❌ Error fetching {exchange_code} - {letter}: {e}")
+def benchmark_parsers(directory: str, repeats: int = 3):
+    """
+    Times every available backend over all saved pages in a fixture directory and checks
+    that each produces exactly the same tuples as the BeautifulSoup reference.
+
+    :param directory: Fixture directory written with --save-fixtures.
+    :param repeats: Timed passes per backend (the best is reported).
+    """
+    pages = []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.endswith(".htm"):
+                with open(os.path.join(root, name), encoding="utf-8") as f:
+                    pages.append(f.read())
+    if not pages:
+        raise SystemExit(f"No saved pages found in {directory}")
+
+    size = sum(len(page) for page in pages) / 1e6
+    reference = [extract_tickers_bs4(page) for page in pages]
+    rows = sum(len(tickers) for tickers in reference)
+    print(f"{len(pages)} pages, {size:.1f} MB, {rows} rows")
+
+    baseline = None
+    for name, parser in PARSER_BACKENDS.items():
+        try:
+            results = [parser(page) for page in pages]
+        except ImportError:
+            print(f"{name:>8}: not installed")
+            continue
+
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for page in pages:
+                parser(page)
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"{name:>8}: {best * 1e3:8.1f} ms  {baseline / best:5.1f}x  "
+              f"{'identical' if results == reference else 'MISMATCH'}")
+
+
+class JsonArrayWriter:
+    def __init__(self, filename: str):
+        """
+        Streams records into a JSON array in the order they are written. The array is written
+        to a temporary file and moved into place on close, so readers never see a partial file.
+
+        :param filename: Final output path.
+        """
+        self.filename = filename
+        self.count = 0
+        self._tmp = filename + ".tmp"
+        self._f = open(self._tmp, "w", encoding="utf-8")
+        self._f.write("[")
+
+    def write(self, ticker: str, name: str, exchange_code: str, exchange_name: str):
+        record = {"ticker": ticker, "company_name": name, "exchange_name": exchange_name,
+                  "exchange_code": exchange_code}
+        self._f.write(("," if self.count else "") + "\n    " + json.dumps(record, ensure_ascii=False))
+        self.count += 1
+
+    def close(self):
+        self._f.write("\n]\n")
+        self._f.close()
+        os.replace(self._tmp, self.filename)
+
+    def abort(self):
+        self._f.close()
+        os.remove(self._tmp)
+
+
+def run(source, exchanges=None, letters=None, workers: int = 8, output: Optional[str] = None,
+        parser: Callable[[str], List[Tuple[str, str]]] = extract_tickers_bs4) -> List[Any]:
+    """
+    Fetches tickers from all exchanges for each letter on a bounded thread pool. Pages are
+    parsed as they complete and released in exchange then letter order: a page is appended
+    (and streamed to the output file, if given) once every page before it is done, so the
+    output is the same whatever order the pages finish in.
+
+    :param source: Page source (HttpPageSource or FixturePageSource).
+    :param exchanges: Subset of exchange_list entries. Defaults to all exchanges.
+    :param letters: Subset of letters to fetch. Defaults to A-Z.
+    :param workers: Pages fetched concurrently.
+    :param output: Optional JSON file the records are streamed to.
+    :param parser: Parsing backend, see get_parser().
+    :return: List of (ticker, company_name, exchange_code, exchange_name)
+    """
+    exchanges = exchanges or exchange_list
+    letters = letters or starting_letter  # Default to A-Z
+
+    all_tickers = []  # Store all tickers and names
+    writer = JsonArrayWriter(output) if output else None
+    pages = [(exchange, letter) for exchange in exchanges for letter in letters]
+    finished = {}  # Page position -> rows, held until every earlier page is finished
+    next_page = 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticker-fetch") as executor:
+            futures = {executor.submit(fetch_page, source, exchange, letter, parser): position
+                       for position, (exchange, letter) in enumerate(pages)}
+
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Fetching pages"):
+                position = futures[future]
+                try:
+                    finished[position] = future.result()
+                except Exception as e:
+                    exchange, letter = pages[position]
+                    tqdm.write(f"❌ Error fetching {exchange['exchange_code']} - {letter}: {e}")
+                    finished[position] = []
+
+                while next_page in finished:
+                    rows = finished.pop(next_page)
+                    next_page += 1
+                    all_tickers.extend(rows)
+                    if writer:
+                        for row in rows:
+                            writer.write(*row)
+    except BaseException:
+        if writer:
+            writer.abort()
+        raise
+
+    if writer:
+        writer.close()
 
     # Summary
     print(f"\n✅ Total Tickers Fetched: {len(all_tickers)}")
@@ -112,28 +517,291 @@ def run(letters=None) -> List[Any]:
 
 def save_to_json(data, filename="tickers.json"):
     """
-    Saves the list of tickers and company names to a JSON file.
+    Saves the list of tickers to a JSON file.
 
     Args:
-        data (List[Tuple[str, str]]): List of (ticker, company_name) tuples.
+        data (List[Tuple[str, str, str, str]]): List of (ticker, company_name, exchange_code, exchange_name) tuples.
         filename (str): Name of the JSON file to save.
     """
+    writer = JsonArrayWriter(filename)
+    for row in data:
+        writer.write(*row)
+    writer.close()
+    print(f"✅ Data successfully saved to {filename}")
+
+
+def _digest(value) -> str:
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False)
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+def _load_json(path: str, default):
     try:
-        # Convert list of tuples to a list of dictionaries
-        json_data = [
-            {"ticker": ticker, "company_name": name, "exchange_name": exchange_name, "exchange_code": exchange_code}
-            for ticker, name, exchange_name, exchange_code in data
-        ]
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def _write_json(path: str, data):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+
+def refresh_page(source, exchange: dict, letter: str, page_state: Optional[dict],
+                 parser: Callable[[str], List[Tuple[str, str]]]
+                 ) -> Optional[Tuple[dict, Optional[List[Tuple[str, str]]]]]:
+    """
+    Fetches one page and compares it with its state from the previous refresh. The page is
+    requested conditionally with the ETag / Last-Modified recorded last time, so an
+    unchanged page is not even downloaded; otherwise the raw HTML hash short-circuits
+    parsing, and the hash of the extracted rows decides whether the listing changed, so
+    quote columns and page chrome changing daily do not count.
+
+    :return: None if the fetch failed, else (new page state, rows or None if unchanged)
+    """
+    validators = {key: page_state[key] for key in VALIDATOR_HEADERS if page_state and page_state.get(key)}
+    result = source.fetch_if_changed(exchange["exchange_code"], letter, validators)
+    if result is None:
+        return None
+    html, validators = result
+    if html is None:
+        return {**page_state, **validators}, None
+
+    html_hash = _digest(html)
+    if page_state and page_state["html"] == html_hash:
+        return {key: value for key, value in page_state.items() if key not in VALIDATOR_HEADERS} | validators, None
 
-        # Save to JSON file
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=4, ensure_ascii=False)
+    rows = parser(html)
+    state = {"html": html_hash, "rows": _digest(rows), "tickers": [ticker for ticker, _ in rows], **validators}
+    if page_state and page_state["rows"] == state["rows"]:
+        return state, None
+    return state, rows
 
-        print(f"✅ Data successfully saved to {filename}")
-    except Exception as e:
-        print(f"❌ Error saving data to JSON: {e}")
 
+def _letter_bucket(ticker: str) -> Optional[str]:
+    """Stock list page (A-Z) a ticker is listed under by name, or None if it does not start with a letter."""
+    first = ticker[:1].upper()
+    return first if "A" <= first <= "Z" else None
 
-# Example usage:
-tickers = run()
-save_to_json(tickers)
+
+def migrate_legacy_records(records: List[dict]) -> Tuple[List[dict], int]:
+    """
+    Fixes records written by the original save_to_json, which stored the exchange code
+    under "exchange_name" and the exchange name under "exchange_code". A record is
+    swapped back only when both values are recognised that way round.
+
+    :param records: Records of a tickers.json store.
+    :return: (records with the exchange fields in place, number of records migrated)
+    """
+    codes = {exchange["exchange_code"] for exchange in exchange_list}
+    names = {exchange["exchange_name"] for exchange in exchange_list}
+    migrated, fixed = 0, []
+    for record in records:
+        if record.get("exchange_code") in names and record.get("exchange_name") in codes:
+            record = {**record, "exchange_code": record["exchange_name"], "exchange_name": record["exchange_code"]}
+            migrated += 1
+        fixed.append(record)
+    return fixed, migrated
+
+
+def compute_delta(old_pages: dict, new_pages: dict, names: dict) -> dict:
+    """
+    Diffs the listings of changed pages.
+
+    :param old_pages: page key -> {(exchange_code, ticker): company_name} before the refresh.
+    :param new_pages: page key -> {(exchange_code, ticker): company_name} after the refresh.
+    :param names: exchange_code -> exchange_name.
+    :return: dict with "added", "removed" and "renamed" lists
+    """
+    old = {key: name for page in old_pages.values() for key, name in page.items()}
+    new = {key: name for page in new_pages.values() for key, name in page.items()}
+
+    added = {key: new[key] for key in new.keys() - old.keys()}
+    removed = {key: old[key] for key in old.keys() - new.keys()}
+    renamed = [{"exchange_code": code, "old_ticker": ticker, "ticker": ticker,
+                "old_name": old[code, ticker], "company_name": new[code, ticker]}
+               for code, ticker in sorted(old.keys() & new.keys()) if old[code, ticker] != new[code, ticker]]
+
+    # A symbol change shows up as a removal and an addition of the same company on the same exchange
+    removed_by_name = {(code, name): ticker for (code, ticker), name in removed.items()}
+    for (code, ticker), name in sorted(added.items()):
+        old_ticker = removed_by_name.pop((code, name), None)
+        if old_ticker is not None:
+            renamed.append({"exchange_code": code, "old_ticker": old_ticker, "ticker": ticker,
+                            "old_name": name, "company_name": name})
+            del added[code, ticker], removed[code, old_ticker]
+
+    def records(items):
+        return [{"ticker": ticker, "company_name": name, "exchange_name": names[code], "exchange_code": code}
+                for (code, ticker), name in sorted(items.items())]
+
+    return {"added": records(added), "removed": records(removed), "renamed": renamed}
+
+
+def apply_delta(records: List[dict], delta: dict) -> List[dict]:
+    """
+    Applies a delta from compute_delta() to the records of a tickers.json store, keeping
+    the order of existing records and appending new ones.
+    """
+    by_key = {(record["exchange_code"], record["ticker"]): record for record in records}
+    for record in delta["removed"]:
+        by_key.pop((record["exchange_code"], record["ticker"]), None)
+    for change in delta["renamed"]:
+        record = by_key.pop((change["exchange_code"], change["old_ticker"]), None)
+        if record is not None:
+            by_key[change["exchange_code"], change["ticker"]] = {
+                **record, "ticker": change["ticker"], "company_name": change["company_name"]}
+    for record in delta["added"]:
+        by_key[record["exchange_code"], record["ticker"]] = record
+    return list(by_key.values())
+
+
+def refresh(source, store: str, exchanges=None, letters=None, workers: int = 8,
+            parser: Callable[[str], List[Tuple[str, str]]] = extract_tickers_bs4,
+            manifest: Optional[str] = None) -> dict:
+    """
+    Incrementally refreshes an existing tickers.json store: every page is fetched and
+    hashed, unchanged pages are skipped, and the added/removed/renamed tickers of the
+    changed pages are applied to the store. Pages that fail to fetch keep their old listing.
+    A store in the legacy layout (exchange code and name swapped) is migrated first, so
+    its records match the fetched keys. The store and the manifest of page hashes and
+    HTTP validators are only rewritten when something changed.
+
+    :param source: Page source (HttpPageSource or FixturePageSource).
+    :param store: Path of the tickers.json store (created if missing).
+    :param exchanges: Subset of exchange_list entries. Defaults to all exchanges.
+    :param letters: Subset of letters to fetch. Defaults to A-Z.
+    :param workers: Pages fetched concurrently.
+    :param parser: Parsing backend, see get_parser().
+    :param manifest: Page-hash manifest path (default: <store>.pages.json).
+    :return: The delta, with a "pages" dict of fetched/changed/failed counts and the number of
+             "migrated" legacy records
+    """
+    exchanges = exchanges or exchange_list
+    letters = letters or starting_letter
+    manifest = manifest or store + ".pages.json"
+    names = {exchange["exchange_code"]: exchange["exchange_name"] for exchange in exchange_list}
+
+    records, migrated = migrate_legacy_records(_load_json(store, []))
+    if migrated:
+        tqdm.write(f"Migrated {migrated} legacy records with swapped exchange code/name in {store}")
+    pages = _load_json(manifest, {})
+    company_names = {(record["exchange_code"], record["ticker"]): record["company_name"] for record in records}
+
+    def listing(code: str, letter: str, tickers: Optional[List[str]], rows: List[Tuple[str, str]]) -> dict:
+        if tickers is None:
+            # No manifest entry yet: a ticker belongs to the page of its first letter. Tickers that
+            # start with a digit or symbol cannot be bucketed by name, so they belong to the page listing them
+            on_page = {ticker for ticker, _ in rows}
+            return {key: name for key, name in company_names.items()
+                    if key[0] == code and (_letter_bucket(key[1]) == letter or
+                                           (_letter_bucket(key[1]) is None and key[1] in on_page))}
+        return {(code, ticker): company_names[code, ticker] for ticker in tickers if (code, ticker) in company_names}
+
+    old_pages, new_pages = {}, {}
+    fetched = failed = 0
+    manifest_changed = not os.path.exists(manifest)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticker-refresh") as executor:
+        futures = {}
+        for exchange in exchanges:
+            for letter in letters:
+                key = f"{exchange['exchange_code']}/{letter}"
+                futures[executor.submit(refresh_page, source, exchange, letter, pages.get(key), parser)] = \
+                    (key, exchange["exchange_code"], letter)
+
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Refreshing pages"):
+            key, code, letter = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = None
+                tqdm.write(f"❌ Error fetching {code} - {letter}: {e}")
+            if result is None:
+                failed += 1
+                continue
+
+            fetched += 1
+            state, rows = result
+            if rows is not None:
+                old_pages[key] = listing(code, letter, pages.get(key, {}).get("tickers"), rows)
+                new_pages[key] = {(code, ticker): name for ticker, name in rows}
+            manifest_changed |= state != pages.get(key)
+            pages[key] = state
+
+    delta = compute_delta(old_pages, new_pages, names)
+    if delta["added"] or delta["removed"] or delta["renamed"] or migrated or not os.path.exists(store):
+        save_to_json([(record["ticker"], record["company_name"], record["exchange_code"], record["exchange_name"])
+                      for record in apply_delta(records, delta)], store)
+    if manifest_changed:
+        _write_json(manifest, pages)
+
+    delta["pages"] = {"fetched": fetched, "changed": len(new_pages), "failed": failed}
+    delta["migrated"] = migrated
+    print(f"\n✅ {fetched} pages fetched, {len(new_pages)} changed, {failed} failed: "
+          f"{len(delta['added'])} added, {len(delta['removed'])} removed, {len(delta['renamed'])} renamed")
+    return delta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the ticker directory from the EODData stock lists.")
+    parser.add_argument("--output", default="static/tickers.json", help="JSON file to write.")
+    parser.add_argument("--exchanges", nargs="+", metavar="CODE", help="Exchange codes to fetch (default: all).")
+    parser.add_argument("--letters", nargs="+", metavar="LETTER", help="Starting letters to fetch (default: A-Z).")
+    parser.add_argument("--workers", type=int, default=8, help="Pages fetched concurrently.")
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host.")
+    parser.add_argument("--rate", type=float, default=4.0, help="Requests per second per host.")
+    parser.add_argument("--retries", type=int, default=3, help="HTTP retries per page.")
+    parser.add_argument("--fixtures", metavar="DIR", help="Read saved pages from DIR instead of the network.")
+    parser.add_argument("--fixture-latency", type=float, default=0.0,
+                        help="Seconds of simulated latency per fixture page.")
+    parser.add_argument("--save-fixtures", metavar="DIR", help="Also save every fetched page to DIR.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only apply the added/removed/renamed tickers of changed pages to the existing output.")
+    parser.add_argument("--delta-output", metavar="FILE", help="With --incremental, also write the delta to FILE.")
+    parser.add_argument("--columnar", metavar="DIR", default=DEFAULT_ROOT,
+                        help="Columnar directory written alongside the JSON output (see src.utils.ticker_directory).")
+    parser.add_argument("--parser", choices=["auto", *PARSER_BACKENDS], default="auto",
+                        help="HTML parsing backend (auto: lxml if installed, else the streaming tokenizer).")
+    parser.add_argument("--benchmark-parsers", action="store_true",
+                        help="Benchmark the parsing backends over the pages in --fixtures and exit.")
+    args = parser.parse_args(argv)
+
+    if args.benchmark_parsers:
+        if not args.fixtures:
+            parser.error("--benchmark-parsers needs --fixtures DIR")
+        return benchmark_parsers(args.fixtures)
+
+    exchanges = exchange_list
+    if args.exchanges:
+        codes = {code.upper() for code in args.exchanges}
+        exchanges = [exchange for exchange in exchange_list if exchange["exchange_code"] in codes]
+        if unknown := codes - {exchange["exchange_code"] for exchange in exchanges}:
+            parser.error(f"unknown exchange code(s): {', '.join(sorted(unknown))}")
+    letters = [letter.upper() for letter in args.letters] if args.letters else None
+
+    if args.fixtures:
+        source = FixturePageSource(args.fixtures, latency=args.fixture_latency)
+    else:
+        source = HttpPageSource(build_session(pool_size=args.per_host),
+                                HostLimiter(args.per_host, args.rate, retries=args.retries),
+                                save_directory=args.save_fixtures)
+
+    start = time.perf_counter()
+    if args.incremental:
+        delta = refresh(source, args.output, exchanges, letters, workers=args.workers, parser=get_parser(args.parser))
+        if args.delta_output:
+            _write_json(args.delta_output, delta)
+        if delta["added"] or delta["removed"] or delta["renamed"] or delta["migrated"] or \
+                not os.path.exists(args.columnar):
+            json_to_ticker_directory(args.output, args.columnar)
+    else:
+        run(source, exchanges, letters, workers=args.workers, output=args.output, parser=get_parser(args.parser))
+        json_to_ticker_directory(args.output, args.columnar)
+    print(f"Finished in {time.perf_counter() - start:.1f}s, saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
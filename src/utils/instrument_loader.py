@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Concurrent loader for the independent parts of an instrument page (info and history).
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict
+from src.utils.bar_store import load_history
+
+
+class InstrumentDataLoader:
+    def __init__(self, provider, store, flights, max_workers: int = 8, info_ttl: float = 3600.0,
+                 max_info_entries: int = 256):
+        """
+        Fetches instrument info and history concurrently on a shared thread pool, so the
+        page pays max(info, history) latency instead of their sum. Concurrent requests for
+        the same part are coalesced through the SingleFlight group.
+
+        :param provider: A MarketDataProvider (normally a GuardedProvider, which rate-limits and retries).
+        :param store: BarStore used for the history and, across restarts, the instrument info.
+        :param flights: SingleFlight group shared with the rest of the process.
+        :param max_workers: Size of the thread pool.
+        :param info_ttl: Seconds instrument info is considered fresh, counted from when it was fetched
+                         (an info loaded from disk keeps its stored fetch time).
+        :param max_info_entries: Instrument infos kept in memory; the least recently used is evicted first.
+        """
+        self.provider = provider
+        self.store = store
+        self.flights = flights
+        self.info_ttl = info_ttl
+        self.max_info_entries = max_info_entries
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="instrument-loader")
+        self._info_cache = OrderedDict()
+        self._info_lock = threading.Lock()
+
+    def get_info(self, symbol: str) -> dict:
+        with self._info_lock:
+            cached = self._info_cache.get(symbol)
+            if cached is not None and time.time() - cached[0] < self.info_ttl:
+                self._info_cache.move_to_end(symbol)
+                return cached[1]
+            self._info_cache.pop(symbol, None)
+
+        record = self.store.read_info_record(symbol, max_age=self.info_ttl)
+        if record is None:
+            refreshed_at = time.time()
+            info = self.flights.do(("info", symbol), self._fetch_info, symbol)
+        else:
+            refreshed_at, info = record["refreshed_at"], record["info"]
+        with self._info_lock:
+            self._info_cache[symbol] = (refreshed_at, info)
+            self._info_cache.move_to_end(symbol)
+            while len(self._info_cache) > self.max_info_entries:
+                self._info_cache.popitem(last=False)
+        return info
+
+    def _fetch_info(self, symbol: str) -> dict:
+        info = self.provider.info(symbol)
+        if info:
+            self.store.write_info(symbol, info)
+        return info
+
+    def get_history(self, symbol: str):
+        return self.flights.do(("history", symbol), load_history, self.store, self.provider, symbol)
+
+    def submit(self, symbol: str) -> Dict[str, Future]:
+        """
+        Starts both fetches at once.
+
+        :param symbol: Ticker symbol.
+        :return: dict with "info" and "history" futures
+        """
+        return {
+            "info": self._executor.submit(self.get_info, symbol),
+            "history": self._executor.submit(self.get_history, symbol),
+        }
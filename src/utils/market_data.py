@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Market-data provider interface with a yfinance implementation and a file-backed record/replay stand-in.
+"""
+
+import io
+import os
+import time
+import hashlib
+import functools
+import orjson
+import pandas as pd
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from src.utils.resilience import TokenBucket, CircuitBreaker, call_with_resilience
+
+
+class MarketDataProvider(ABC):
+    """
+    Everything the dashboard needs from an upstream market-data source.
+    """
+
+    @abstractmethod
+    def history(self, symbol: str, period: Optional[str] = "max", start: Optional[str] = None) -> pd.DataFrame:
+        """Daily OHLCV bars, either for a yfinance-style period or from a start date (YYYY-MM-DD)."""
+
+    @abstractmethod
+    def info(self, symbol: str) -> dict:
+        """Instrument metadata (longName, symbol, exchange, ...)."""
+
+    @abstractmethod
+    def screen(self, query: str, **kwargs) -> dict:
+        """A predefined screener such as "day_gainers"; returns a dict with a "quotes" list."""
+
+    @abstractmethod
+    def option_expirations(self, symbol: str) -> List[str]:
+        """Listed option expiry dates (YYYY-MM-DD)."""
+
+    @abstractmethod
+    def option_chain(self, symbol: str, expiration: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Calls and puts DataFrames for one expiry."""
+
+
+class YahooFinanceProvider(MarketDataProvider):
+    """
+    Live data from Yahoo Finance through yfinance.
+    """
+
+    def __init__(self):
+        import yfinance
+        self._yf = yfinance
+
+    def history(self, symbol, period="max", start=None):
+        ticker = self._yf.Ticker(symbol)
+        return ticker.history(start=start) if start else ticker.history(period=period)
+
+    def info(self, symbol):
+        return self._yf.Ticker(symbol).info
+
+    def screen(self, query, **kwargs):
+        return self._yf.screen(query, **kwargs)
+
+    def option_expirations(self, symbol):
+        return list(self._yf.Ticker(symbol).options)
+
+    def option_chain(self, symbol, expiration):
+        chain = self._yf.Ticker(symbol).option_chain(expiration)
+        return chain.calls, chain.puts
+
+
+class RecordReplayProvider(MarketDataProvider):
+    def __init__(self, directory: str, upstream: Optional[MarketDataProvider] = None, latency: float = 0.0):
+        """
+        File-backed provider. With an upstream provider every response is fetched from it
+        and recorded; without one, recorded responses are replayed and a missing recording
+        raises KeyError, so no request ever reaches the network. Replayed history calls with
+        a start date are served from the recorded period="max" response when that exact
+        call was not recorded.
+
+        :param directory: Directory holding one JSON file per recorded call (DataFrames use
+                          pandas' "table" layout, which keeps dtypes and time zones).
+        :param upstream: Provider to record from; None replays.
+        :param latency: Seconds of artificial delay added to every replayed call.
+        """
+        self.directory = directory
+        self.upstream = upstream
+        self.latency = latency
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, method: str, args: tuple, kwargs: dict) -> str:
+        key = orjson.dumps([method, list(args), kwargs], option=orjson.OPT_SORT_KEYS)
+        symbol = str(args[0]).replace("/", "_") if args else "all"
+        return os.path.join(self.directory, f"{method}-{symbol}-{hashlib.sha1(key).hexdigest()[:16]}.json")
+
+    def _call(self, method: str, *args, **kwargs):
+        path = self._path(method, args, kwargs)
+        if self.upstream is not None:
+            response = getattr(self.upstream, method)(*args, **kwargs)
+            with open(path + ".tmp", "wb") as f:
+                f.write(orjson.dumps(_encode_response(response), default=str, option=orjson.OPT_SERIALIZE_NUMPY))
+            os.replace(path + ".tmp", path)
+            return response
+
+        if self.latency:
+            time.sleep(self.latency)
+        try:
+            with open(path, "rb") as f:
+                return _decode_response(orjson.loads(f.read()))
+        except FileNotFoundError:
+            raise KeyError(f"No recorded response for {method}{args} {kwargs} in {self.directory}") from None
+
+    def history(self, symbol, period="max", start=None):
+        if start is None or self.upstream is not None or \
+                os.path.exists(self._path("history", (symbol,), {"period": period, "start": start})):
+            return self._call("history", symbol, period=period, start=start)
+        # Incremental calls carry a date that changes every day; replay them from the full recorded history
+        bars = self._call("history", symbol, period="max", start=None)
+        start = pd.Timestamp(start)
+        if bars.index.tz is not None:
+            start = start.tz_localize(bars.index.tz)
+        return bars[bars.index >= start]
+
+    def info(self, symbol):
+        return self._call("info", symbol)
+
+    def screen(self, query, **kwargs):
+        return self._call("screen", query, **kwargs)
+
+    def option_expirations(self, symbol):
+        return self._call("option_expirations", symbol)
+
+    def option_chain(self, symbol, expiration):
+        return self._call("option_chain", symbol, expiration)
+
+
+def _encode_response(response):
+    """JSON-safe form of a provider response: a DataFrame, a tuple of DataFrames or plain data."""
+    if isinstance(response, pd.DataFrame):
+        return {"frame": orjson.loads(response.to_json(orient="table", date_unit="ns"))}
+    if isinstance(response, tuple):
+        return {"tuple": [_encode_response(item) for item in response]}
+    return {"value": response}
+
+
+def _decode_response(recorded):
+    if "frame" in recorded:
+        return pd.read_json(io.BytesIO(orjson.dumps(recorded["frame"])), orient="table")
+    if "tuple" in recorded:
+        return tuple(_decode_response(item) for item in recorded["tuple"])
+    return recorded["value"]
+
+
+class GuardedProvider(MarketDataProvider):
+    def __init__(self, upstream: MarketDataProvider, limiter: TokenBucket = None, breaker: CircuitBreaker = None,
+                 retries: int = 2):
+        """
+        Wraps a provider so every call shares one token-bucket rate limit, is retried with
+        exponential backoff and fails fast while the circuit breaker is open.
+
+        :param upstream: The provider doing the actual requests.
+        :param limiter: Shared TokenBucket (default: 2 requests/s, bursts of 5).
+        :param breaker: Shared CircuitBreaker (default: open after 5 consecutive failures for 30 s).
+        :param retries: Retries per call after the first attempt.
+        """
+        self.upstream = upstream
+        self.limiter = limiter or TokenBucket(rate=2.0, capacity=5)
+        self.breaker = breaker or CircuitBreaker()
+        self.retries = retries
+
+    def _call(self, method: str, *args, **kwargs):
+        return call_with_resilience(getattr(self.upstream, method), *args, limiter=self.limiter,
+                                    breaker=self.breaker, retries=self.retries, **kwargs)
+
+    def history(self, symbol, period="max", start=None):
+        return self._call("history", symbol, period=period, start=start)
+
+    def info(self, symbol):
+        return self._call("info", symbol)
+
+    def screen(self, query, **kwargs):
+        return self._call("screen", query, **kwargs)
+
+    def option_expirations(self, symbol):
+        return self._call("option_expirations", symbol)
+
+    def option_chain(self, symbol, expiration):
+        return self._call("option_chain", symbol, expiration)
+
+
+@functools.lru_cache(maxsize=None)
+def get_market_data_provider() -> MarketDataProvider:
+    """
+    Process-wide provider selected through environment variables:
+
+    - MARKET_DATA_PROVIDER: "yahoo" (default), "record" or "replay"
+    - MARKET_DATA_RECORDINGS: recordings directory (default "data/recordings")
+    - MARKET_DATA_LATENCY: seconds of injected latency per replayed call (default 0)
+
+    Live providers are wrapped in a GuardedProvider so all sessions share one rate limit.
+    """
+    mode = os.environ.get("MARKET_DATA_PROVIDER", "yahoo").lower()
+    directory = os.environ.get("MARKET_DATA_RECORDINGS", "data/recordings")
+
+    if mode == "yahoo":
+        return GuardedProvider(YahooFinanceProvider())
+    if mode == "record":
+        return RecordReplayProvider(directory, upstream=GuardedProvider(YahooFinanceProvider()))
+    if mode == "replay":
+        return RecordReplayProvider(directory, latency=float(os.environ.get("MARKET_DATA_LATENCY", "0")))
+    raise ValueError(f"Unknown MARKET_DATA_PROVIDER {mode!r}, expected 'yahoo', 'record' or 'replay'.")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Rate limiting, retry with backoff and circuit breaking for upstream calls.
+"""
+
+import json
+import time
+import random
+import threading
+from typing import Any, Callable
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling upstream while the circuit breaker is open."""
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Thread-safe token bucket shared by every caller of an upstream.
+
+        :param rate: Tokens added per second (sustained requests per second).
+        :param capacity: Maximum burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float = None) -> bool:
+        """
+        Takes one token, sleeping until one is available.
+
+        :param timeout: Maximum seconds to wait; None waits indefinitely.
+        :return: True if a token was taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Stops calling an upstream after `failure_threshold` consecutive failures. After
+        `reset_timeout` seconds a single trial call is let through (half-open); its success
+        closes the circuit again, its failure re-opens it.
+
+        :param failure_threshold: Consecutive failures that open the circuit.
+        :param reset_timeout: Seconds the circuit stays open before a trial call.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half-open" if time.monotonic() - self._opened_at >= self.reset_timeout else "open"
+
+    def before_call(self):
+        """Raises CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError("Upstream circuit is open; skipping call.")
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Ends a call whose outcome says nothing about upstream health; only a half-open trial is released."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Whether a failed upstream call is worth retrying: lookups that found nothing, bad
+    arguments and HTTP 4xx answers (other than 429) would fail the same way again. A
+    truncated or throttled JSON body is retried.
+    """
+    if isinstance(error, (LookupError, TypeError)) or \
+            (isinstance(error, ValueError) and not isinstance(error, json.JSONDecodeError)):
+        return False
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return not (isinstance(status, int) and 400 <= status < 500 and status != 429)
+
+
+def call_with_resilience(fn: Callable[..., Any], *args, limiter: TokenBucket = None, breaker: CircuitBreaker = None,
+                         retries: int = 3, backoff: float = 0.5, max_backoff: float = 8.0,
+                         retryable: Callable[[Exception], bool] = is_retryable, **kwargs) -> Any:
+    """
+    Calls fn behind a rate limiter and circuit breaker, retrying failures with
+    exponential backoff and full jitter.
+
+    The breaker sees one outcome per logical call: a failure once every retry is used
+    up, not one per attempt. Non-retryable errors (see is_retryable) are raised at once
+    and leave the breaker as it was: the upstream did answer, but a "not found" says
+    nothing about its health, so it neither counts as a failure nor resets earlier ones.
+
+    :param fn: The upstream call.
+    :param limiter: Optional TokenBucket; one token is taken per attempt.
+    :param breaker: Optional CircuitBreaker; an open circuit fails fast with CircuitOpenError.
+    :param retries: Retries after the first attempt.
+    :param backoff: Base delay in seconds, doubled on every retry.
+    :param max_backoff: Upper bound of a single delay.
+    :param retryable: Predicate deciding whether an exception is retried.
+    :return: The result of fn
+    """
+    if breaker is not None:
+        breaker.before_call()
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as error:
+            if not retryable(error):
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
+            if attempt == retries:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            time.sleep(random.uniform(0, min(max_backoff, backoff * 2 ** attempt)))
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
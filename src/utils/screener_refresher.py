@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Process-wide background refresher publishing immutable home-page screener snapshots.
+"""
+
+import time
+import logging
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_INDICES = [
+    {"symbol": "^GSPC", "longName": "S&P 500"},
+    {"symbol": "^DJI", "longName": "Dow Jones Industrial Average"},
+    {"symbol": "^IXIC", "longName": "NASDAQ Composite"},
+    {"symbol": "^FTSE", "longName": "FTSE 100"},
+    {"symbol": "^N225", "longName": "Nikkei 225"},
+    {"symbol": "^AXJO", "longName": "S&P/ASX 200"},
+    {"symbol": "^GDAXI", "longName": "DAX"},
+    {"symbol": "^HSI", "longName": "Hang Seng Index"},
+    {"symbol": "^GSPTSE", "longName": "S&P/TSX Composite"},
+    {"symbol": "^STI", "longName": "Straits Times Index"},
+]
+
+
+class ScreenerSnapshot(NamedTuple):
+    """Immutable view of the screeners; every quote is a dict in Yahoo's screener format."""
+    gainers: Tuple[dict, ...]
+    losers: Tuple[dict, ...]
+    indices: Tuple[dict, ...]
+    refreshed_at: float
+
+
+EMPTY_SNAPSHOT = ScreenerSnapshot((), (), (), 0.0)
+
+
+class ScreenerRefresher:
+    def __init__(self, provider, interval: float = 10.0, index_interval: float = 60.0, indices=None):
+        """
+        Refreshes gainers/losers and global index quotes on a schedule in one daemon
+        thread and publishes each result as a new immutable ScreenerSnapshot. Sessions only
+        read the latest snapshot, so upstream traffic does not grow with the number of viewers.
+
+        :param provider: A MarketDataProvider.
+        :param interval: Seconds between gainers/losers refreshes.
+        :param index_interval: Seconds between global index refreshes.
+        :param indices: Index definitions ({"symbol", "longName"}); defaults to GLOBAL_INDICES.
+        """
+        self.provider = provider
+        self.interval = interval
+        self.index_interval = index_interval
+        self.indices = indices or GLOBAL_INDICES
+        self.last_error: Optional[Exception] = None
+        self._snapshot = EMPTY_SNAPSHOT
+        self._first_snapshot = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def snapshot(self) -> ScreenerSnapshot:
+        """The most recently published snapshot (EMPTY_SNAPSHOT before the first refresh)."""
+        return self._snapshot
+
+    def start(self):
+        """Starts the background thread (no-op if it is already running)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="screener-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def wait_for_snapshot(self, timeout: float = None) -> ScreenerSnapshot:
+        """Blocks until the first refresh completed (or the timeout expired) and returns the snapshot."""
+        self._first_snapshot.wait(timeout)
+        return self._snapshot
+
+    def _fetch_indices(self):
+        """
+        Quotes every index from its last two closes. An index whose fetch fails or returns no
+        usable bars is logged and keeps its quote from the previous snapshot, if any.
+        """
+        previous = {quote["symbol"]: quote for quote in self._snapshot.indices}
+        quotes = []
+        for index in self.indices:
+            try:
+                bars = self.provider.history(index["symbol"], period="5d")
+            except Exception as e:
+                logger.warning("Index refresh failed for %s: %s", index["symbol"], e)
+                bars = None
+            closes = bars["Close"].dropna() if bars is not None and "Close" in bars else ()
+            if len(closes) < 2:
+                if bars is not None:
+                    logger.warning("Index refresh for %s returned fewer than two closes", index["symbol"])
+                if index["symbol"] in previous:
+                    quotes.append(previous[index["symbol"]])
+                continue
+            quotes.append({
+                "symbol": index["symbol"],
+                "longName": index["longName"],
+                "regularMarketPrice": float(closes.iloc[-1]),
+                "regularMarketChangePercent": float((closes.iloc[-1] / closes.iloc[-2] - 1) * 100),
+            })
+        return tuple(quotes)
+
+    def refresh(self, include_indices: bool = True):
+        """Fetches fresh data and publishes a new snapshot; keeps the old data of any failed part."""
+        previous = self._snapshot
+        gainers, losers, indices = previous.gainers, previous.losers, previous.indices
+        try:
+            gainers = tuple(self.provider.screen("day_gainers", sortField='percentchange', sortAsc=True)["quotes"])
+            losers = tuple(self.provider.screen("day_losers", sortField='percentchange', sortAsc=True)["quotes"])
+            if include_indices:
+                indices = self._fetch_indices()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+            logger.warning("Screener refresh failed: %s", e)
+
+        self._snapshot = ScreenerSnapshot(gainers, losers, indices, time.time())
+        self._first_snapshot.set()
+
+    def _run(self):
+        last_index_refresh = 0.0
+        while not self._stop.is_set():
+            include_indices = time.monotonic() - last_index_refresh >= self.index_interval
+            self.refresh(include_indices)
+            if include_indices:
+                last_index_refresh = time.monotonic()
+            self._stop.wait(self.interval)
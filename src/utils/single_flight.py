@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Single-flight request coalescing for concurrent sessions asking for the same upstream data.
+"""
+
+import logging
+import functools
+import threading
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Deduplicates concurrent calls by key: the first caller (the leader) runs the
+        function, every caller arriving while it is in flight blocks and receives the
+        leader's result or exception. Nothing is cached once the call has finished.
+        Calls that coalesced waiters are logged at INFO with the running stats().
+        """
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs fn(*args, **kwargs) unless a call with the same key is already in flight.
+
+        :param key: Identity of the request, e.g. ("history", "AAPL").
+        :param fn: Function performing the upstream fetch.
+        :return: The (possibly shared) result of fn
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._in_flight.get(key)
+            if call is not None:
+                self.coalesced += 1
+                call.waiters += 1
+                leader = False
+            else:
+                call = self._in_flight[key] = _Call()
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                waiters = call.waiters
+            call.done.set()
+            if waiters:
+                logger.info("Single-flight %r served %d coalesced caller(s); totals %s", key, waiters, self.stats())
+
+    def stats(self) -> dict:
+        """Counters: total calls, upstream executions, coalesced calls and keys currently in flight."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+@functools.lru_cache(maxsize=None)
+def get_single_flight(name: str = "market_data") -> SingleFlight:
+    """Process-wide SingleFlight group shared by every session (one per name)."""
+    return SingleFlight()
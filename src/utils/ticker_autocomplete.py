@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Ranked, typo-tolerant ticker suggestions over the instrument directory.
+"""
+
+import time
+import bisect
+import numpy as np
+import pandas as pd
+from difflib import SequenceMatcher
+from typing import List, Optional
+from src.utils.ticker_search import TickerSearchIndex
+
+MATCH_TIERS = {"exact": 0, "prefix": 1, "name": 2}  # Ranked in this order; popularity never crosses tiers
+MIN_SIMILARITY = 0.6
+FUZZY_CANDIDATES = 40
+POPULARITY_WEIGHT = 0.15  # Score added for the most searched symbol; scaled by log(count) for the others
+
+
+class TickerAutocomplete:
+    def __init__(self, df: pd.DataFrame, index: TickerSearchIndex):
+        """
+        Suggests instruments for a partially typed or misspelt query.
+
+        - Symbols are matched by prefix with a binary search over the sorted tickers.
+        - Company names (and tickers) are matched fuzzily: the search index shortlists the
+          rows sharing the most 2/3-grams with the query, and only that shortlist is scored
+          with a sequence similarity, so the cost does not grow with the directory.
+        - Results are ranked in tiers, exact symbol > symbol prefix > fuzzy match. Within a
+          tier they are ordered by match quality plus a popularity bonus of up to
+          POPULARITY_WEIGHT (log-scaled search count relative to the most searched symbol), so
+          a frequently searched instrument outranks a slightly closer but obscure one.
+
+        :param df: Directory with Ticker, Company Name and Exchange Symbol columns.
+        :param index: TickerSearchIndex built over the same rows.
+        """
+        self.index = index
+        self.tickers = df["Ticker"].fillna("").astype(str).tolist()
+        self.company_names = df["Company Name"].fillna("").astype(str).tolist()
+        self.exchanges = df["Exchange Symbol"].astype(str).tolist()
+
+        upper = [ticker.upper() for ticker in self.tickers]
+        self._order = np.argsort(np.array(upper), kind="stable")
+        self._sorted_tickers = [upper[row] for row in self._order.tolist()]
+        self._ticker_lengths = np.array([len(ticker) for ticker in self.tickers])
+        self._rows_by_ticker = {}
+        for row, ticker in enumerate(upper):
+            self._rows_by_ticker.setdefault(ticker, []).append(row)
+
+    def _prefix_rows(self, prefix: str) -> np.ndarray:
+        low = bisect.bisect_left(self._sorted_tickers, prefix)
+        high = bisect.bisect_left(self._sorted_tickers, prefix + "\uffff", low)
+        return self._order[low:high]
+
+    def _similarity(self, matcher: SequenceMatcher, query: str, row: int) -> float:
+        def ratio(text: str) -> float:
+            # The query is the matcher's cached second sequence; cheap upper bounds skip hopeless texts
+            matcher.set_seq1(text)
+            if matcher.real_quick_ratio() < MIN_SIMILARITY or matcher.quick_ratio() < MIN_SIMILARITY:
+                return 0.0
+            return matcher.ratio()
+
+        name = self.company_names[row].lower()
+        return max([ratio(self.tickers[row].lower()), ratio(name[:len(query)])] +
+                   [ratio(word) for word in name.split()])
+
+    def suggest(self, query: str, limit: int = 8, popularity: Optional[dict] = None) -> List[dict]:
+        """
+        Ranked suggestions for a query.
+
+        :param query: Text typed so far.
+        :param limit: Maximum number of suggestions.
+        :param popularity: Optional mapping of upper-cased ticker to search count.
+        :return: List of dicts with ticker, company_name, exchange, match ("exact", "prefix" or
+                 "name") and score (match quality plus popularity bonus within its tier), best first
+        """
+        query = query.strip()
+        if not query:
+            return []
+        upper, lower = query.upper(), query.lower()
+        popularity = popularity or {}
+
+        scores = {}
+        prefix_rows = self._prefix_rows(upper)
+        if len(prefix_rows) > 4 * limit:
+            # Broad prefixes: keep the shortest (closest) tickers and the popular ones
+            by_length = prefix_rows[np.argsort(self._ticker_lengths[prefix_rows], kind="stable")[:4 * limit]]
+            popular = [row for row in prefix_rows.tolist() if self.tickers[row].upper() in popularity]
+            prefix_rows = np.union1d(by_length, np.array(popular[:4 * limit], dtype=prefix_rows.dtype))
+        for row in prefix_rows.tolist():
+            exact = len(self.tickers[row]) == len(upper)
+            scores[row] = (len(upper) / len(self.tickers[row]), "exact" if exact else "prefix")
+
+        if len(lower) >= 2:
+            overlap = self.index.gram_overlap(lower)
+            shortlist = np.argpartition(-overlap, FUZZY_CANDIDATES)[:FUZZY_CANDIDATES] \
+                if len(overlap) > FUZZY_CANDIDATES else np.arange(len(overlap))
+            # Popular symbols are always scored, so a frequently searched instrument wins ties
+            popular = sorted(popularity, key=popularity.get, reverse=True)[:FUZZY_CANDIDATES]
+            popular_rows = [row for ticker in popular for row in self._rows_by_ticker.get(ticker, ())]
+            matcher = SequenceMatcher(None, b=lower, autojunk=False)
+            for row in shortlist[overlap[shortlist] > 0].tolist() + popular_rows:
+                if row in scores:
+                    continue
+                similarity = self._similarity(matcher, lower, row)
+                if similarity >= MIN_SIMILARITY:
+                    scores[row] = (similarity, "name")
+
+        top_count = np.log1p(max(popularity.values(), default=0))
+        for row, (score, match) in scores.items():
+            count = popularity.get(self.tickers[row].upper(), 0)
+            if count > 0:
+                scores[row] = (score + POPULARITY_WEIGHT * np.log1p(count) / top_count, match)
+
+        ranked = sorted(scores.items(), key=lambda item: (
+            MATCH_TIERS[item[1][1]], -item[1][0], len(self.tickers[item[0]]), self.tickers[item[0]]))
+        return [{"ticker": self.tickers[row], "company_name": self.company_names[row], "exchange": self.exchanges[row],
+                 "match": match, "score": float(score)} for row, (score, match) in ranked[:limit]]
+
+
+def benchmark(queries=("A", "AAP", "AAPL", "appl", "aple", "microsfot", "bank of amer", "berkshire hathway",
+                       "merstoholdings", "zzzzzz")):
+    """Per-keystroke latency of suggest() over a synthetic 54k-row directory."""
+    rng = np.random.default_rng(0)
+    letters = list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    syllables = ["ba", "co", "de", "fi", "gro", "hol", "in", "ka", "lu", "mer", "no", "pa", "ri", "sto", "tek", "vi"]
+    suffixes = ["Inc.", "Corp", "Ltd", "Holdings", "Group", "Trust", "Plc"]
+
+    def word():
+        return "".join(rng.choice(syllables, size=rng.integers(2, 5))).capitalize()
+
+    df = pd.DataFrame({
+        "Ticker": ["".join(rng.choice(letters, size=rng.integers(1, 6))) for _ in range(54_000)],
+        "Company Name": [f"{word()} {word()} {rng.choice(suffixes)}" for _ in range(54_000)],
+        "Exchange Name": "New York Stock Exchange",
+        "Exchange Symbol": "NYSE",
+    })
+    df.loc[:3] = [["AAPL", "Apple Inc.", "NASDAQ Stock Exchange", "NASDAQ"],
+                  ["MSFT", "Microsoft Corporation", "NASDAQ Stock Exchange", "NASDAQ"],
+                  ["BAC", "Bank of America Corporation", "New York Stock Exchange", "NYSE"],
+                  ["BRK-B", "Berkshire Hathaway Inc.", "New York Stock Exchange", "NYSE"]]
+
+    start = time.perf_counter()
+    autocomplete = TickerAutocomplete(df, TickerSearchIndex(df))
+    print(f"Built in {time.perf_counter() - start:.2f}s over {len(df)} rows")
+
+    popularity = {"AAPL": 120, "MSFT": 80, "BAC": 5}
+    for query in queries:
+        autocomplete.suggest(query, popularity=popularity)
+        start = time.perf_counter()
+        for _ in range(20):
+            suggestions = autocomplete.suggest(query, popularity=popularity)
+        elapsed = (time.perf_counter() - start) / 20
+        top = ", ".join(f"{item['ticker']}" for item in suggestions[:3])
+        print(f"{query!r:>15}: {elapsed * 1e3:6.2f}ms  {top}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Compact columnar ticker directory written by the scraper and loaded by the instrument pages.
+
+    Usage:
+        python -m src.utils.ticker_directory static/tickers.json static/tickers   # convert a JSON directory
+        python -m src.utils.ticker_directory static/tickers.json --benchmark      # compare load time and memory
+"""
+
+import os
+import gc
+import sys
+import time
+import shutil
+import hashlib
+import argparse
+import tracemalloc
+import orjson
+import numpy as np
+import pandas as pd
+from typing import Iterable, List
+
+DEFAULT_ROOT = "static/tickers"
+META_FILE = "meta.json"
+EXCHANGE_FILE = "exchange.bin"
+TEXT_COLUMNS = ("ticker", "company_name")
+# Staging directories older than this are left over from an interrupted writer
+STALE_STAGING_SECONDS = 3600
+
+
+class TickerDirectory:
+    def __init__(self, version: str, tickers: List[str], company_names: List[str], exchange: np.ndarray,
+                 exchange_codes: List[str], exchange_names: List[str]):
+        """
+        In-memory ticker directory. Exchanges are dictionary-encoded: `exchange` holds one
+        small integer per row indexing `exchange_codes` / `exchange_names`.
+
+        :param version: Content hash of the directory; changes whenever any row changes.
+        :param tickers: Ticker symbol per row.
+        :param company_names: Company name per row.
+        :param exchange: uint8 exchange code per row.
+        :param exchange_codes: Dictionary of exchange symbols (e.g. "NYSE").
+        :param exchange_names: Dictionary of exchange names, aligned with exchange_codes.
+        """
+        self.version = version
+        self.tickers = tickers
+        self.company_names = company_names
+        self.exchange = exchange
+        self.exchange_codes = exchange_codes
+        self.exchange_names = exchange_names
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def to_frame(self) -> pd.DataFrame:
+        """The directory as the DataFrame shown on the instruments page, with categorical exchange columns."""
+        codes = np.asarray(self.exchange, dtype=np.int16)
+        return pd.DataFrame({
+            "Ticker": self.tickers,
+            "Company Name": self.company_names,
+            "Exchange Name": pd.Categorical.from_codes(codes, categories=pd.Index(self.exchange_names)),
+            "Exchange Symbol": pd.Categorical.from_codes(codes, categories=pd.Index(self.exchange_codes)),
+        })
+
+
+def _clean(value: str) -> str:
+    # Text columns are newline-delimited on disk
+    return value.replace("\r", " ").replace("\n", " ")
+
+
+def write_ticker_directory(records: Iterable[dict], root: str = DEFAULT_ROOT) -> str:
+    """
+    Writes ticker records (dicts with ticker, company_name, exchange_code and
+    exchange_name, as in tickers.json) in the columnar layout:
+
+    - ticker.txt / company_name.txt: UTF-8, one value per line
+    - exchange.bin: raw uint8 dictionary codes, memory-mappable
+    - meta.json: row count, exchange dictionaries and the content version
+
+    The files go into a new subdirectory named after the version, which is never modified
+    afterwards. The root meta.json is the pointer to the current subdirectory and is
+    replaced atomically last, so a reader always sees one complete version. Subdirectories
+    other than the new and the previous one are removed, as are staging directories that an
+    interrupted writer left behind more than STALE_STAGING_SECONDS ago.
+
+    :param records: Ticker records.
+    :param root: Output directory.
+    :return: The version of the written directory
+    """
+    os.makedirs(root, exist_ok=True)
+
+    exchanges = {}
+    columns = {name: [] for name in TEXT_COLUMNS}
+    codes = []
+    for record in records:
+        exchange = (record["exchange_code"], record["exchange_name"])
+        codes.append(exchanges.setdefault(exchange, len(exchanges)))
+        for name in TEXT_COLUMNS:
+            columns[name].append(_clean(record[name] or ""))
+    if len(exchanges) > 255:
+        raise ValueError(f"{len(exchanges)} exchanges do not fit the uint8 exchange column.")
+
+    files = {f"{name}.txt": "\n".join(values).encode("utf-8") for name, values in columns.items()}
+    files[EXCHANGE_FILE] = np.asarray(codes, dtype=np.uint8).tobytes()
+    digest = hashlib.sha1(orjson.dumps(list(exchanges)))
+    for data in files.values():
+        digest.update(data)
+
+    version = digest.hexdigest()[:16]
+    meta = {
+        "version": version,
+        "rows": len(codes),
+        "exchange_codes": [code for code, _ in exchanges],
+        "exchange_names": [name for _, name in exchanges],
+        "directory": version,
+    }
+    files[META_FILE] = orjson.dumps(meta)
+
+    directory = os.path.join(root, version)
+    if not os.path.isdir(directory):  # The same version is already complete on disk
+        staging = os.path.join(root, f".{version}.{os.getpid()}.tmp")
+        os.makedirs(staging, exist_ok=True)
+        for file_name, data in files.items():
+            with open(os.path.join(staging, file_name), "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            os.rename(staging, directory)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)  # A concurrent writer published the same version
+            if not os.path.isdir(directory):
+                raise
+
+    previous = _read_meta(root).get("directory") if os.path.exists(os.path.join(root, META_FILE)) else None
+    path = os.path.join(root, META_FILE)
+    with open(path + ".tmp", "wb") as f:
+        f.write(files[META_FILE])
+    os.replace(path + ".tmp", path)
+
+    # Keep the previous version for readers that resolved the pointer before the switch
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if os.path.isdir(path) and name not in (version, previous) and not name.startswith("."):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.isdir(path) and name.startswith(".") and name.endswith(".tmp") and \
+                time.time() - os.path.getmtime(path) > STALE_STAGING_SECONDS:
+            shutil.rmtree(path, ignore_errors=True)
+        elif previous is None and name in files and name != META_FILE:
+            os.remove(path)  # Unversioned files of the previous layout
+    return version
+
+
+def _read_meta(root: str) -> dict:
+    with open(os.path.join(root, META_FILE), "rb") as f:
+        return orjson.loads(f.read())
+
+
+def read_ticker_version(root: str = DEFAULT_ROOT) -> str:
+    """The version of the directory on disk, without loading it."""
+    return _read_meta(root)["version"]
+
+
+def load_ticker_directory(root: str = DEFAULT_ROOT, version: str = None) -> TickerDirectory:
+    """
+    Loads a directory written by write_ticker_directory(). The exchange column is
+    memory-mapped; the text columns are decoded with one split per column.
+
+    :param root: Directory holding the root meta.json (directories written before versioned
+                 subdirectories keep their files next to it).
+    :param version: Load this version (the current one or the one it replaced) instead of the current one.
+    :return: TickerDirectory
+    :raises FileNotFoundError: If the requested version is no longer on disk
+    """
+    meta = _read_meta(root)
+    if version and version != meta["version"]:
+        versioned = os.path.join(root, version)
+        if not os.path.isdir(versioned):
+            raise FileNotFoundError(f"Ticker directory version {version} is no longer in {root}.")
+        meta = _read_meta(versioned)
+    directory = os.path.join(root, meta.get("directory", ""))
+
+    rows = meta["rows"]
+    text = {}
+    for name in TEXT_COLUMNS:
+        with open(os.path.join(directory, f"{name}.txt"), "rb") as f:
+            text[name] = f.read().decode("utf-8").split("\n") if rows else []
+
+    exchange = np.memmap(os.path.join(directory, EXCHANGE_FILE), dtype=np.uint8, mode="r", shape=(rows,)) \
+        if rows else np.empty(0, dtype=np.uint8)
+    return TickerDirectory(meta["version"], text["ticker"], text["company_name"], exchange,
+                           meta["exchange_codes"], meta["exchange_names"])
+
+
+def json_to_ticker_directory(json_path: str, root: str = DEFAULT_ROOT) -> str:
+    """Converts a tickers.json file into the columnar layout and returns its version."""
+    with open(json_path, "rb") as f:
+        return write_ticker_directory(orjson.loads(f.read()), root)
+
+
+def load_json_frame(json_path: str) -> pd.DataFrame:
+    """The previous loading path: the whole tickers.json parsed into a DataFrame with renamed columns."""
+    with open(json_path) as f:
+        data = orjson.loads(f.read())
+    df = pd.DataFrame(data)
+    df.rename(columns={
+        'ticker': 'Ticker',
+        'company_name': 'Company Name',
+        'exchange_name': 'Exchange Name',
+        'exchange_code': 'Exchange Symbol',
+    }, inplace=True)
+    return df
+
+
+def benchmark(json_path: str = None, repeats: int = 5):
+    """
+    Compares loading the directory from JSON against the columnar layout: best load time,
+    peak memory allocated while loading (tracemalloc) and the resident size of the resulting
+    DataFrame (memory_usage(deep=True)).
+
+    :param json_path: A tickers.json; a synthetic 54k-row directory is generated when omitted.
+    :param repeats: Timed loads per format.
+    """
+    import tempfile
+    from src.utils.generate_ticker_list import exchange_list
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if json_path is None:
+            rng = np.random.default_rng(0)
+            json_path = os.path.join(tmp, "tickers.json")
+            records = []
+            for i in range(54_000):
+                exchange = exchange_list[int(rng.integers(len(exchange_list)))]
+                records.append({"ticker": f"T{i:05d}", "company_name": f"Company {i} Holdings Ltd",
+                                "exchange_name": exchange["exchange_name"], "exchange_code": exchange["exchange_code"]})
+            with open(json_path, "wb") as f:
+                f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+
+        root = os.path.join(tmp, "tickers")
+        json_to_ticker_directory(json_path, root)
+        json_size = os.path.getsize(json_path)
+        directory = os.path.join(root, read_ticker_version(root))
+        columnar_size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"{'':>9}  {'on disk':>10}  {'load':>9}  {'peak':>10}  {'resident':>10}")
+
+        for name, size, load in (("json", json_size, lambda: load_json_frame(json_path)),
+                                 ("columnar", columnar_size, lambda: load_ticker_directory(root).to_frame())):
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                frame = load()
+                best = min(best, time.perf_counter() - start)
+                del frame
+
+            gc.collect()
+            tracemalloc.start()
+            frame = load()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            resident = frame.memory_usage(deep=True).sum()
+            print(f"{name:>9}  {size / 1e6:8.1f}MB  {best * 1e3:7.1f}ms  {peak / 1e6:8.1f}MB  {resident / 1e6:8.1f}MB"
+                  f"  ({len(frame)} rows)")
+            del frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert or benchmark the columnar ticker directory.")
+    parser.add_argument("json_path", nargs="?", help="tickers.json to convert (or to benchmark against).")
+    parser.add_argument("root", nargs="?", default=DEFAULT_ROOT, help="Output directory.")
+    parser.add_argument("--benchmark", action="store_true", help="Compare JSON and columnar loading.")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        return benchmark(args.json_path)
+    if not args.json_path:
+        parser.error("json_path is required unless --benchmark is given")
+    print(f"Wrote {args.root} (version {json_to_ticker_directory(args.json_path, args.root)})")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
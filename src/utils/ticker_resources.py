@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Process-wide cached ticker directory, search index and autocomplete shared by the pages.
+"""
+
+import os
+import numpy as np
+import streamlit as st
+from src.utils.ticker_search import TickerSearchIndex
+from src.utils.ticker_autocomplete import TickerAutocomplete
+from src.utils.ticker_directory import DEFAULT_ROOT as TICKER_DIRECTORY, META_FILE, load_ticker_directory, \
+    load_json_frame, read_ticker_version
+
+TICKER_JSON = "static/tickers.json"
+
+
+def get_directory_version() -> str:
+    """
+    Version of the ticker directory on disk; caches below are keyed by it, so a rebuild invalidates
+    them. Each keeps at most two versions: the current one and the one sessions may still be on.
+    """
+    if os.path.exists(os.path.join(TICKER_DIRECTORY, META_FILE)):
+        return read_ticker_version(TICKER_DIRECTORY)
+    return f"json-{os.path.getmtime(TICKER_JSON)}"
+
+
+@st.cache_resource(show_spinner="Loading ticker data", max_entries=2)
+def load_clean_ticker_data(version: str):
+    """
+    Load the ticker directory, preferring the columnar artifact over the JSON file. The frame
+    is shared by every session (not copied per rerun), so callers must not modify it.
+    """
+    if not version.startswith("json-"):
+        return load_ticker_directory(TICKER_DIRECTORY, version).to_frame()
+    return load_json_frame(TICKER_JSON)
+
+
+@st.cache_resource(show_spinner="Building search index", max_entries=2)
+def get_search_index(version: str) -> TickerSearchIndex:
+    """Search index built once per directory version and shared by every session."""
+    return TickerSearchIndex(load_clean_ticker_data(version))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_sort_orders(version: str) -> dict:
+    """
+    Case-insensitive ascending row order of every directory column, computed once per version.
+
+    :return: dict mapping column name to a permutation of the row positions
+    """
+    df = load_clean_ticker_data(version)
+    return {column: np.argsort(df[column].astype(str).str.lower().to_numpy(), kind="stable")
+            for column in df.columns}
+
+
+def sort_rows(rows, order, num_rows, descending=False):
+    """
+    Orders the matching rows by a precomputed permutation of the whole directory: one
+    linear pass over the permutation instead of re-sorting strings on every rerun.
+
+    :param rows: Row positions to order (e.g. the matches of a search).
+    :param order: Permutation of all row positions from get_sort_orders().
+    :param num_rows: Number of rows in the directory.
+    :param descending: Reverse the order.
+    :return: The row positions of `rows`, sorted
+    """
+    if len(rows) != num_rows:
+        member = np.zeros(num_rows, dtype=bool)
+        member[rows] = True
+        order = order[member[order]]
+    return order[::-1] if descending else order
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_autocomplete(version: str) -> TickerAutocomplete:
+    """Autocomplete over the directory, sharing the search index of the same version."""
+    return TickerAutocomplete(load_clean_ticker_data(version), get_search_index(version))
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_search_popularity(_db_client) -> dict:
+    """
+    How often each value was searched, from the user history collection.
+
+    :param _db_client: MongoClient of the app (not hashed; there is one per process).
+    :return: dict mapping upper-cased search value to its count (empty if the database is unavailable)
+    """
+    try:
+        collection = _db_client["user_history"]["history"]
+        pipeline = [
+            {"$match": {"use_type": "searched"}},
+            {"$unwind": "$page_parameters"},
+            {"$group": {"_id": {"$toUpper": "$page_parameters.search_value"}, "count": {"$sum": 1}}},
+        ]
+        return {item["_id"]: item["count"] for item in collection.aggregate(pipeline) if item["_id"]}
+    except Exception:
+        return {}
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    Description: Prebuilt n-gram inverted index for substring search over the ticker directory.
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+MAX_GRAM = 3
+
+
+class TickerSearchIndex:
+    def __init__(self, df: pd.DataFrame):
+        """
+        Case-insensitive substring index over the Ticker and Company Name columns, with
+        dictionary codes for the exchange columns.
+
+        Every 1-, 2- and 3-gram of the lowercased text maps to the sorted array of rows
+        containing it (stored CSR-style in two flat arrays). A query of up to three
+        characters is answered by one posting list; a longer one intersects the posting
+        lists of its trigrams and verifies the few remaining candidates. Exchange names and
+        symbols only have a handful of distinct values, so they are matched on their
+        dictionaries and mapped back to rows through the codes.
+
+        :param df: Directory with Ticker, Company Name, Exchange Name and Exchange Symbol columns.
+        """
+        self.rows = len(df)
+        tickers = [str(value).lower() for value in df["Ticker"].fillna("")]
+        names = [str(value).lower() for value in df["Company Name"].fillna("")]
+
+        exchange_names = pd.Categorical(df["Exchange Name"])
+        exchange_symbols = pd.Categorical(df["Exchange Symbol"])
+        self.exchange_names = list(exchange_names.categories)
+        self.exchange_symbols = list(exchange_symbols.categories)
+        self._name_codes = exchange_names.codes
+        self._symbol_codes = exchange_symbols.codes
+
+        # Ticker and name joined by a separator no query contains, so verification is one substring test
+        self._text = [f"{ticker}\x00{name}" for ticker, name in zip(tickers, names)]
+
+        gram_ids, ids, counts = {}, [], []
+        for ticker, name in zip(tickers, names):
+            grams = set()
+            for text in (ticker, name):
+                for n in range(1, MAX_GRAM + 1):
+                    grams.update([text[i:i + n] for i in range(len(text) - n + 1)])
+            ids.extend([gram_ids.setdefault(gram, len(gram_ids)) for gram in grams])
+            counts.append(len(grams))
+
+        ids = np.array(ids, dtype=np.int32)
+        order = np.argsort(ids, kind="stable")  # Rows stay sorted within each gram
+        self._postings = np.repeat(np.arange(self.rows, dtype=np.int32), counts)[order]
+        self._offsets = np.zeros(len(gram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ids, minlength=len(gram_ids)), out=self._offsets[1:])
+        self._gram_ids = gram_ids
+
+    def _posting(self, gram: str) -> np.ndarray:
+        gram_id = self._gram_ids.get(gram)
+        if gram_id is None:
+            return np.empty(0, dtype=np.int32)
+        return self._postings[self._offsets[gram_id]:self._offsets[gram_id + 1]]
+
+    def gram_overlap(self, text: str) -> np.ndarray:
+        """
+        Number of distinct 2- and 3-grams of text that each row contains; a cheap
+        similarity used to shortlist candidates for fuzzy matching.
+
+        :param text: Lowercased text.
+        :return: int array with one count per row
+        """
+        grams = {text[i:i + n] for n in (2, 3) for i in range(len(text) - n + 1)}
+        postings = [self._posting(gram) for gram in grams]
+        if not postings:
+            return np.zeros(self.rows, dtype=np.int64)
+        return np.bincount(np.concatenate(postings), minlength=self.rows)
+
+    def _text_matches(self, query: str) -> np.ndarray:
+        if len(query) <= MAX_GRAM:
+            return self._posting(query)
+
+        postings = sorted((self._posting(query[i:i + MAX_GRAM]) for i in range(len(query) - MAX_GRAM + 1)), key=len)
+        candidates = postings[0]
+        member = np.zeros(self.rows, dtype=bool)
+        for posting in postings[1:]:
+            if not len(candidates):
+                break
+            # Linear-time intersection of sorted posting lists through a row bitmap
+            member[candidates] = True
+            next_candidates = posting[member[posting]]
+            member[candidates] = False
+            candidates = next_candidates
+        text = self._text
+        return np.array([row for row in candidates.tolist() if query in text[row]], dtype=np.int32)
+
+    def _exchange_matches(self, query: str) -> Optional[np.ndarray]:
+        names = [code for code, value in enumerate(self.exchange_names) if query in value.lower()]
+        symbols = [code for code, value in enumerate(self.exchange_symbols) if query in value.lower()]
+        if not names and not symbols:
+            return None
+        return np.isin(self._name_codes, names) | np.isin(self._symbol_codes, symbols)
+
+    def search(self, query: str = "", exchange_name: Optional[str] = None,
+               exchange_symbol: Optional[str] = None) -> np.ndarray:
+        """
+        Rows whose ticker, company name, exchange name or exchange symbol contains the
+        query (case-insensitive), restricted to the given exchange name and symbol.
+
+        :param query: Search text; empty matches every row.
+        :param exchange_name: Exact exchange name to keep, or None.
+        :param exchange_symbol: Exact exchange symbol to keep, or None.
+        :return: Sorted array of row positions
+        """
+        if query := query.strip().lower():
+            rows = self._text_matches(query)
+            exchange_mask = self._exchange_matches(query)
+            if exchange_mask is not None:
+                exchange_mask[rows] = True
+                rows = np.flatnonzero(exchange_mask)
+        else:
+            rows = np.arange(self.rows)
+
+        for value, categories, codes in ((exchange_name, self.exchange_names, self._name_codes),
+                                         (exchange_symbol, self.exchange_symbols, self._symbol_codes)):
+            if value is not None:
+                if value not in categories:
+                    return np.empty(0, dtype=np.int64)
+                rows = rows[codes[rows] == categories.index(value)]
+        return rows
+
+
+def benchmark(df: pd.DataFrame = None, queries=("a", "ap", "appl", "corp 12", "holdings", "nyse", "zzzz")):
+    """
+    Compares the index against the previous full-scan str.contains filter on the same
+    queries and checks that both return the same rows.
+
+    :param df: Directory to search; a synthetic 54k-row directory when omitted.
+    :param queries: Queries to time.
+    """
+    if df is None:
+        from src.utils.ticker_directory import TickerDirectory
+        from src.utils.generate_ticker_list import exchange_list
+        rng = np.random.default_rng(0)
+        words = np.array(["Apple", "Corp", "Holdings", "Energy", "Bank", "Global", "Mining", "Pharma", "Trust", "Ltd"])
+        df = TickerDirectory(
+            "synthetic",
+            ["".join(rng.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), size=rng.integers(1, 5))) for _ in range(54_000)],
+            [" ".join(rng.choice(words, size=3)) + f" {i}" for i in range(54_000)],
+            rng.integers(len(exchange_list), size=54_000).astype(np.uint8),
+            [exchange["exchange_code"] for exchange in exchange_list],
+            [exchange["exchange_name"] for exchange in exchange_list],
+        ).to_frame()
+
+    start = time.perf_counter()
+    index = TickerSearchIndex(df)
+    print(f"Index built in {time.perf_counter() - start:.2f}s over {len(df)} rows, {len(index._postings)} postings")
+
+    columns = ["Ticker", "Company Name", "Exchange Name", "Exchange Symbol"]
+    for query in queries:
+        start = time.perf_counter()
+        matches = np.zeros(len(df), dtype=bool)
+        for column in columns:
+            matches |= df[column].astype(str).str.lower().str.contains(query, na=False, regex=False).to_numpy()
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = index.search(query)
+        indexed = time.perf_counter() - start
+        print(f"{query!r:>12}: scan {scan * 1e3:7.2f}ms  index {indexed * 1e3:7.3f}ms  {len(rows):6d} rows  "
+              f"{'identical' if np.array_equal(rows, np.flatnonzero(matches)) else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -6,9 +6,7 @@
     Author: Joshua David Golafshan
 """
 import datetime
-import yfinance as yf
 import streamlit as st
-from typing import Optional, Any
 from pymongo.errors import DuplicateKeyError
 
 
@@ -22,13 +20,6 @@ def search_logic(value: str):
         st.switch_page("pages/instrument.py")
 
 
-def yahoo_data(ticker: str) -> Optional[Any]:
-    try:
-        return yf.Ticker(ticker)
-    except:
-        return None
-
-
 def user_component():
     # HTML for floating user ID box with a copy button
     session_id = st.session_state.get("user_id", "USER-123456")
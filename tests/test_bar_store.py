@@ -0,0 +1,85 @@
+import os
+import numpy as np
+import pandas as pd
+from src.utils.bar_store import BarStore, load_history
+
+
+def bars(start, days, columns=("Open", "Close"), value=1.0):
+    index = pd.date_range(start, periods=days, freq="D", tz="America/New_York", name="Date")
+    return pd.DataFrame({column: value + np.arange(days, dtype=float) for column in columns}, index=index)
+
+
+def test_append_replaces_overlapping_bars(tmp_path):
+    store = BarStore(str(tmp_path))
+    store.append("AAPL", bars("2024-01-01", 10))
+    store.append("AAPL", bars("2024-01-10", 3, value=100.0))
+
+    stored = store.read("AAPL")
+
+    assert len(stored) == 12
+    assert stored.index[-1] == pd.Timestamp("2024-01-12", tz="America/New_York")
+    assert stored["Close"].iloc[8:].tolist() == [9.0, 100.0, 101.0, 102.0]
+
+
+def test_schema_change_keeps_history(tmp_path):
+    store = BarStore(str(tmp_path))
+    store.append("AAPL", bars("2024-01-01", 10))
+    store.append("AAPL", bars("2024-01-11", 2, columns=("Close", "Dividends"), value=50.0))
+
+    stored = store.read("AAPL")
+
+    assert list(stored.columns) == ["Open", "Close", "Dividends"]
+    assert len(stored) == 12
+    assert stored["Close"].tolist() == [float(i) for i in range(1, 11)] + [50.0, 51.0]
+    assert stored["Open"].iloc[-2:].isna().all() and stored["Dividends"].iloc[:10].isna().all()
+
+
+def test_readers_keep_their_view_across_appends(tmp_path):
+    store = BarStore(str(tmp_path))
+    store.append("AAPL", bars("2024-01-01", 10))
+    before = store.read("AAPL")
+
+    store.append("AAPL", bars("2024-01-05", 3, value=100.0))
+
+    assert before["Close"].tolist() == [float(i) for i in range(1, 11)]
+    assert len(store.read("AAPL")) == 7
+    data_files = [name for name in os.listdir(tmp_path / "AAPL") if name.endswith(".bin")]
+    assert len(data_files) == 3
+
+
+def test_instrument_info_round_trip(tmp_path):
+    store = BarStore(str(tmp_path))
+    store.write_info("AAPL", {"symbol": "AAPL", "marketCap": np.int64(3)})
+
+    assert store.read_info("AAPL") == {"symbol": "AAPL", "marketCap": 3}
+    assert store.read_info("AAPL", max_age=0) is None
+    assert store.read_info("MSFT") is None
+
+
+class HistoryProvider:
+    def __init__(self, full):
+        self.full = full
+        self.calls = []
+
+    def history(self, symbol, period="max", start=None):
+        self.calls.append(start or period)
+        return self.full if start is None else self.full[self.full.index >= pd.Timestamp(start, tz=self.full.index.tz)]
+
+
+def test_new_dividend_refetches_the_whole_history(tmp_path):
+    store = BarStore(str(tmp_path))
+    history = bars("2024-01-01", 10, columns=("Close", "Dividends"), value=0.0)
+    history["Dividends"] = 0.0
+    store.append("AAPL", history)
+
+    adjusted = history.assign(Close=history["Close"] * 0.99)
+    adjusted.loc[adjusted.index[-1], "Dividends"] = 0.5
+    provider = HistoryProvider(adjusted)
+    stored = load_history(store, provider, "AAPL", max_age=0)
+
+    assert provider.calls == ["2024-01-10", "max"]
+    assert stored["Close"].tolist() == adjusted["Close"].tolist()
+
+    provider.calls.clear()
+    load_history(store, provider, "AAPL", max_age=0)
+    assert provider.calls == ["2024-01-10"]
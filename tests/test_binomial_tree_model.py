@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from src.core.black_scholes_model import price_batch
+from src.core.binomial_tree_model import BinomialTreeModel
+
+
+def inputs(size=20):
+    rng = np.random.default_rng(0)
+    return (rng.uniform(0.05, 2.0, size), rng.uniform(60, 140, size), 100.0, rng.uniform(0.05, 0.8, size),
+            rng.uniform(0.0, 0.08, size))
+
+
+def test_binomial_european_call_converges_to_black_scholes():
+    T, K, S, o, r = inputs()
+    exact = price_batch(T, K, S, o, r)
+
+    call, put = BinomialTreeModel(T, K, S, o, r, steps=800, american=False).calculate_prices()
+
+    np.testing.assert_allclose(call, exact["call_price"], atol=2e-2)
+    np.testing.assert_allclose(put, exact["put_price"], atol=2e-2)
+
+
+def test_binomial_american_put_is_worth_at_least_european():
+    american_put = BinomialTreeModel(1.0, 110.0, 100.0, 0.2, 0.05, steps=400).calculate_prices()[1]
+    european_put = BinomialTreeModel(1.0, 110.0, 100.0, 0.2, 0.05, steps=400, american=False).calculate_prices()[1]
+
+    assert american_put > european_put
+    assert american_put >= 10.0
+
+
+@pytest.mark.parametrize("volatility, steps", [(0.0, 100), (0.01, 1), (0.2, 0)])
+def test_binomial_rejects_invalid_lattices(volatility, steps):
+    with pytest.raises(ValueError):
+        BinomialTreeModel(1.0, 100.0, 100.0, volatility, 0.05, steps=steps).calculate_prices()
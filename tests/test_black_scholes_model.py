@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from src.core.black_scholes_model import BlackScholesModel, price_batch
+
+
+def inputs(size=50):
+    rng = np.random.default_rng(0)
+    return (rng.uniform(0.05, 2.0, size), rng.uniform(60, 140, size), 100.0, rng.uniform(0.05, 0.8, size),
+            rng.uniform(0.0, 0.08, size))
+
+
+def test_batch_matches_scalar_pricing():
+    T, K, S, o, r = inputs()
+    batch = price_batch(T, K, S, o, r)
+
+    for i in range(len(T)):
+        model = BlackScholesModel(T[i], K[i], S, o[i], r[i])
+        call_price, put_price = model.calculate_prices()
+        greeks = model.calculate_greeks()
+        assert batch["call_price"][i] == pytest.approx(call_price, rel=1e-10, abs=1e-12)
+        assert batch["put_price"][i] == pytest.approx(put_price, rel=1e-10, abs=1e-12)
+        for key, value in greeks.items():
+            assert batch[key][i] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+def test_put_call_parity():
+    T, K, S, o, r = inputs()
+    prices = price_batch(T, K, S, o, r)
+
+    np.testing.assert_allclose(prices["call_price"] - prices["put_price"], S - K * np.exp(-r * T), atol=1e-10)
+    np.testing.assert_allclose(prices["call_delta"] - prices["put_delta"], 1.0, atol=1e-12)
+
+
+def test_grid_broadcasts_volatility_against_spot():
+    spot = np.linspace(50, 150, 7)[np.newaxis, :]
+    vol = np.linspace(0.1, 0.5, 4)[:, np.newaxis]
+
+    grid = price_batch(1.0, 100.0, spot, vol, 0.05)["call_price"]
+
+    assert grid.shape == (4, 7)
+    assert grid[2, 5] == pytest.approx(BlackScholesModel(1.0, 100.0, spot[0, 5], vol[2, 0], 0.05).calculate_prices()[0])
@@ -0,0 +1,144 @@
+import os
+import json
+import time
+import pytest
+import requests
+from src.utils.generate_ticker_list import FixturePageSource, HostLimiter, HttpPageSource, PARSER_BACKENDS, \
+    exchange_list, extract_tickers_bs4, refresh, run
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "eoddata")
+
+
+def exchanges(*codes):
+    return [exchange for exchange in exchange_list if exchange["exchange_code"] in codes]
+
+
+def test_scrapes_saved_eoddata_pages():
+    rows = run(FixturePageSource(FIXTURES), exchanges("NASDAQ", "NYSE", "LSE"), letters=["A", "B", "Z"], workers=2)
+
+    assert len(rows) == 18
+    assert ("AAPL", "Apple Inc", "NASDAQ", "NASDAQ Stock Exchange") in rows
+    assert ("BRK.B", "Berkshire Hathaway Inc  Cl B", "NYSE", "New York Stock Exchange") in rows
+    assert ("AV.", "Aviva Plc", "LSE", "London Stock Exchange") in rows
+    # Navigation and footer tables are not part of the listing
+    assert not {ticker for ticker, *_ in rows} & {"A", "B", "Z", "Terms"}
+
+
+@pytest.mark.parametrize("backend", ["lxml", "stream"])
+def test_parser_backends_match_bs4_reference(backend):
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    pages = sorted(os.path.join(root, name) for root, _, files in os.walk(FIXTURES) for name in files)
+    assert pages
+
+    for path in pages:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        assert PARSER_BACKENDS[backend](html) == extract_tickers_bs4(html), path
+
+
+def test_refresh_skips_unmodified_pages_and_migrates_legacy_store(tmp_path):
+    store = str(tmp_path / "tickers.json")
+    legacy = [{"ticker": "AAPL", "company_name": "Apple Inc", "exchange_name": "NASDAQ",
+               "exchange_code": "NASDAQ Stock Exchange"},
+              {"ticker": "AXXX", "company_name": "Delisted Corp", "exchange_name": "NASDAQ",
+               "exchange_code": "NASDAQ Stock Exchange"}]
+    with open(store, "w", encoding="utf-8") as f:
+        json.dump(legacy, f)
+
+    delta = refresh(FixturePageSource(FIXTURES), store, exchanges("NASDAQ"), letters=["A"], workers=1)
+
+    assert delta["migrated"] == 2
+    assert [record["ticker"] for record in delta["removed"]] == ["AXXX"]
+    assert len(delta["added"]) == 5
+    with open(store, encoding="utf-8") as f:
+        records = json.load(f)
+    assert {(record["exchange_code"], record["exchange_name"]) for record in records} == \
+        {("NASDAQ", "NASDAQ Stock Exchange")}
+    with open(store + ".pages.json", encoding="utf-8") as f:
+        assert f.read().count("last_modified") == 1
+
+    class CountingSource(FixturePageSource):
+        downloads = 0
+
+        def fetch_if_changed(self, exchange_code, first_letter, validators=None):
+            html, validators = super().fetch_if_changed(exchange_code, first_letter, validators)
+            CountingSource.downloads += html is not None
+            return html, validators
+
+    delta = refresh(CountingSource(FIXTURES), store, exchanges("NASDAQ"), letters=["A"], workers=1)
+
+    assert CountingSource.downloads == 0
+    assert delta["pages"] == {"fetched": 1, "changed": 0, "failed": 0} and delta["migrated"] == 0
+
+
+def test_refresh_without_manifest_keeps_digit_leading_tickers(tmp_path):
+    store = str(tmp_path / "tickers.json")
+    records = [{"ticker": ticker, "company_name": name, "exchange_name": "NASDAQ Stock Exchange",
+                "exchange_code": "NASDAQ"} for ticker, name in (("AAPL", "Apple Inc"), ("1COV", "One Cov Corp"))]
+    with open(store, "w", encoding="utf-8") as f:
+        json.dump(records, f)
+
+    class StaticSource:
+        def fetch_if_changed(self, exchange_code, first_letter, validators=None):
+            return "<html></html>", {"etag": '"v1"'}
+
+    rows = [("1COV", "One Cov Corp"), ("AAPL", "Apple Inc")]
+    delta = refresh(StaticSource(), store, exchanges("NASDAQ"), letters=["A"], workers=1, parser=lambda html: rows)
+
+    assert delta["added"] == [] and delta["removed"] == []
+
+
+def test_http_source_sends_stored_validators():
+    class Session:
+        def get(self, url, timeout, headers=None):
+            self.headers = headers
+            response = requests.Response()
+            response.status_code = 304 if headers and headers.get("If-None-Match") == '"v1"' else 200
+            response.headers["ETag"] = '"v1"'
+            response._content = b"" if response.status_code == 304 else b"<html></html>"
+            return response
+
+    source = HttpPageSource(Session(), HostLimiter())
+
+    assert source.fetch_if_changed("NYSE", "A") == ("<html></html>", {"etag": '"v1"'})
+    assert source.fetch_if_changed("NYSE", "A", {"etag": '"v1"'}) == (None, {"etag": '"v1"'})
+    assert source.session.headers == {"If-None-Match": '"v1"'}
+
+
+def test_output_is_written_in_exchange_and_letter_order(tmp_path):
+    class ReversedLatencySource(FixturePageSource):
+        # Later pages finish first
+        def fetch(self, exchange_code, first_letter):
+            time.sleep(0.01 * (ord("Z") - ord(first_letter)) / 25)
+            return super().fetch(exchange_code, first_letter)
+
+    output = str(tmp_path / "tickers.json")
+    rows = run(ReversedLatencySource(FIXTURES), exchanges("NASDAQ", "NYSE"), letters=["A", "B", "Z"], workers=6,
+               output=output)
+    expected = run(FixturePageSource(FIXTURES), exchanges("NASDAQ", "NYSE"), letters=["A", "B", "Z"], workers=1)
+
+    assert rows == expected
+    with open(output, encoding="utf-8") as f:
+        assert [record["ticker"] for record in json.load(f)] == [ticker for ticker, *_ in expected]
+    codes = [code for _, _, code, _ in rows]
+    assert codes == sorted(codes, key=["NASDAQ", "NYSE"].index)
+
+
+def test_host_limiter_retries_throttled_requests():
+    class Session:
+        def __init__(self):
+            self.statuses = [503, 429, 200]
+
+        def get(self, url, timeout, headers=None):
+            response = requests.Response()
+            response.status_code = self.statuses.pop(0)
+            response.headers["Retry-After"] = "0"
+            return response
+
+    session = Session()
+    response = HostLimiter(rate=100.0, backoff=0).get(session, "https://www.eoddata.com/stocklist/NYSE/A.htm")
+
+    assert response.status_code == 200 and session.statuses == []
+    assert HostLimiter(rate=100.0, retries=1, backoff=0).get(
+        Session(), "https://www.eoddata.com/stocklist/NYSE/A.htm").status_code == 429
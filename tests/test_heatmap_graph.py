@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from src.components.heatmap_graph import quantized_range, HeatmapGridCache, SPOT_QUANTUM, VOL_QUANTUM
+
+
+@pytest.mark.parametrize("low, high, num, quantum", [
+    (0.15, 0.25, 200, VOL_QUANTUM),
+    (0.1, 0.3, 150, VOL_QUANTUM),
+    (0.01, 0.05, 200, VOL_QUANTUM),
+    (3.2, 4.8, 200, SPOT_QUANTUM),
+    (80.0, 120.0, 10, SPOT_QUANTUM),
+    (95.123, 104.877, 50, SPOT_QUANTUM),
+])
+def test_quantized_range_stays_inside_bounds(low, high, num, quantum):
+    grid = quantized_range(low, high, num, quantum)
+
+    assert 1 < len(grid) <= num
+    assert np.all(np.diff(grid) > 0)
+    assert grid[0] >= low - 1e-12 and grid[0] - low < quantum
+    assert grid[-1] <= high + 1e-12 and high - grid[-1] < quantum
+    np.testing.assert_allclose(grid / quantum, np.rint(grid / quantum), atol=1e-9)
+
+
+def test_grid_cache_reuses_shared_lattice_points():
+    cache = HeatmapGridCache()
+    spot = quantized_range(80.0, 120.0, 41, SPOT_QUANTUM)
+    vol = quantized_range(0.1, 0.3, 21, VOL_QUANTUM)
+    call, put = cache.get_prices(1.0, 100.0, 0.03, spot, vol)
+
+    shifted_call, _ = cache.get_prices(1.0, 100.0, 0.03, spot + 5.0, vol)
+
+    assert cache.cells_reused == 21 * 36
+    np.testing.assert_allclose(shifted_call[:, :36], call[:, 5:])
+
+
+def test_cached_grids_are_read_only():
+    cache = HeatmapGridCache()
+    spot = quantized_range(80.0, 120.0, 11, SPOT_QUANTUM)
+    vol = quantized_range(0.1, 0.3, 5, VOL_QUANTUM)
+    call, _ = cache.get_prices(1.0, 100.0, 0.03, spot, vol)
+
+    with pytest.raises(ValueError):
+        call[0, 0] = -1.0
+    assert cache.get_prices(1.0, 100.0, 0.03, spot, vol)[0][0, 0] > 0
@@ -0,0 +1,27 @@
+import numpy as np
+from src.core.black_scholes_model import BlackScholesModel
+from src.core.implied_volatility import implied_volatility, MAX_VOLATILITY
+
+
+def test_recovers_volatility_of_model_prices():
+    rng = np.random.default_rng(0)
+    strike = rng.uniform(80, 120, 200)
+    maturity = rng.uniform(0.1, 2.0, 200)
+    volatility = rng.uniform(0.1, 0.8, 200)
+    is_call = rng.random(200) < 0.5
+    prices = BlackScholesModel(maturity, strike, 100.0, volatility, 0.03).calculate_all()
+    market_price = np.where(is_call, prices["call_price"], prices["put_price"])
+
+    implied, converged = implied_volatility(market_price, 100.0, strike, maturity, 0.03, is_call)
+
+    assert converged.all()
+    np.testing.assert_allclose(implied, volatility, atol=1e-6)
+
+
+def test_root_above_max_volatility_is_not_converged():
+    price = BlackScholesModel(1.0, 100.0, 100.0, MAX_VOLATILITY + 2.0, 0.0).calculate_all()["call_price"]
+
+    implied, converged = implied_volatility(price, 100.0, 100.0, 1.0, 0.0)
+
+    assert not converged
+    assert np.isnan(implied)
@@ -0,0 +1,40 @@
+from src.utils.bar_store import BarStore
+from src.utils.instrument_loader import InstrumentDataLoader
+from src.utils.single_flight import SingleFlight
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = []
+
+    def info(self, symbol):
+        self.calls.append(symbol)
+        return {"symbol": symbol}
+
+
+def test_info_cache_is_bounded_and_persisted(tmp_path):
+    provider = CountingProvider()
+    loader = InstrumentDataLoader(provider, BarStore(str(tmp_path)), SingleFlight(), max_workers=1,
+                                  max_info_entries=2)
+
+    for symbol in ("AAPL", "MSFT", "AAPL", "TSLA", "AAPL"):
+        assert loader.get_info(symbol) == {"symbol": symbol}
+
+    assert provider.calls == ["AAPL", "MSFT", "TSLA"]
+    assert list(loader._info_cache) == ["TSLA", "AAPL"]
+
+    restarted = InstrumentDataLoader(provider, BarStore(str(tmp_path)), SingleFlight(), max_workers=1)
+    assert restarted.get_info("MSFT") == {"symbol": "MSFT"}
+    assert provider.calls == ["AAPL", "MSFT", "TSLA"]
+
+
+def test_info_from_disk_keeps_its_fetch_time(tmp_path):
+    store = BarStore(str(tmp_path))
+    store.write_info("AAPL", {"symbol": "AAPL"})
+    refreshed_at = store.read_info_record("AAPL")["refreshed_at"]
+    provider = CountingProvider()
+    loader = InstrumentDataLoader(provider, store, SingleFlight(), max_workers=1)
+
+    assert loader.get_info("AAPL") == {"symbol": "AAPL"}
+    assert loader._info_cache["AAPL"][0] == refreshed_at
+    assert provider.calls == []
@@ -0,0 +1,54 @@
+import os
+import pandas as pd
+import pytest
+from src.utils.market_data import RecordReplayProvider, MarketDataProvider
+
+
+class StaticProvider(MarketDataProvider):
+    def __init__(self, bars):
+        self.bars = bars
+
+    def history(self, symbol, period="max", start=None):
+        return self.bars if start is None else self.bars[self.bars.index >= pd.Timestamp(start, tz="UTC")]
+
+    def info(self, symbol):
+        return {"symbol": symbol}
+
+    def screen(self, query, **kwargs):
+        return {"quotes": []}
+
+    def option_expirations(self, symbol):
+        return []
+
+    def option_chain(self, symbol, expiration):
+        return pd.DataFrame(), pd.DataFrame()
+
+
+def test_replay_serves_incremental_history_from_full_recording(tmp_path):
+    bars = pd.DataFrame({"Close": range(10)}, index=pd.date_range("2024-01-01", periods=10, tz="UTC"))
+    RecordReplayProvider(str(tmp_path), upstream=StaticProvider(bars)).history("AAPL", period="max")
+    replay = RecordReplayProvider(str(tmp_path))
+
+    incremental = replay.history("AAPL", start="2024-01-08")
+
+    assert incremental["Close"].tolist() == [7, 8, 9]
+    with pytest.raises(KeyError):
+        replay.history("MSFT", start="2024-01-08")
+
+
+def test_recordings_round_trip_as_json(tmp_path):
+    calls = pd.DataFrame({"strike": [95.0, 100.0], "inTheMoney": [True, False], "contractSymbol": ["C95", "C100"],
+                          "lastTradeDate": pd.to_datetime(["2024-01-02", "2024-01-03"], utc=True)})
+    puts = calls.assign(inTheMoney=[False, True])
+
+    class ChainProvider(StaticProvider):
+        def option_chain(self, symbol, expiration):
+            return calls, puts
+
+    RecordReplayProvider(str(tmp_path), upstream=ChainProvider(None)).option_chain("AAPL", "2024-02-16")
+    replayed = RecordReplayProvider(str(tmp_path)).option_chain("AAPL", "2024-02-16")
+
+    assert all(name.endswith(".json") for name in os.listdir(tmp_path))
+    for recorded, original in zip(replayed, (calls, puts)):
+        pd.testing.assert_frame_equal(recorded, original, check_dtype=False)
+    assert str(replayed[0]["lastTradeDate"].dt.tz) == "UTC"
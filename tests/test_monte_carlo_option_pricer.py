@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from src.core.monte_carlo_option_pricer import MonteCarloOptionPricer
+
+
+def pricer(**kwargs):
+    return MonteCarloOptionPricer(time_to_maturity=1.0, strike=100, current_price=100, volatility=0.2,
+                                  interest_rate=0.05, num_paths=20_000, num_steps=50, seed=0, **kwargs)
+
+
+@pytest.mark.parametrize("style, kwargs", [("asian", {}), ("lookback", {}),
+                                           ("barrier", {"barrier": 120, "barrier_type": "up-and-out"})])
+def test_chunked_pricing_matches_single_chunk(style, kwargs):
+    whole = pricer(antithetic=False, chunk_size=20_000).price(style, **kwargs)
+    chunked = pricer(antithetic=False, chunk_size=1_500).price(style, **kwargs)
+
+    for key in whole:
+        assert chunked[key] == pytest.approx(whole[key], rel=1e-9)
+
+
+def test_knock_in_and_knock_out_add_up_to_european():
+    prices = [pricer(chunk_size=3_000).price("barrier", "put", barrier=85, barrier_type=barrier_type)
+              for barrier_type in ("down-and-in", "down-and-out")]
+    plain_sum = prices[0]["plain_price"] + prices[1]["plain_price"]
+
+    # A barrier that is never touched leaves the European put, which the control variate prices exactly
+    european = pricer(chunk_size=3_000).price("barrier", "put", barrier=0.0, barrier_type="down-and-out")
+    assert plain_sum == pytest.approx(european["plain_price"], rel=1e-12)
+    assert european["standard_error"] < 1e-9
+    assert np.isclose(european["price"], 5.5735, atol=1e-3)
@@ -0,0 +1,33 @@
+import os
+import orjson
+import numpy as np
+from src.core.option_chain import load_option_chain_fixture, price_option_chain, build_volatility_surface
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "synthetic_option_chain.json")
+
+
+def test_priced_fixture_recovers_generating_volatility():
+    with open(FIXTURE, "rb") as f:
+        fixture = orjson.loads(f.read())
+    chain, current_price, snapshot = load_option_chain_fixture(FIXTURE)
+
+    priced = price_option_chain(chain, current_price, fixture["interest_rate"], 0.2, snapshot)
+
+    expected = np.array([contract["impliedVolatility"] for contract in fixture["contracts"]])
+    np.testing.assert_allclose(priced["implied_volatility"].to_numpy(), expected, atol=1e-6)
+
+
+def test_volatility_surface_uses_out_of_the_money_quotes():
+    with open(FIXTURE, "rb") as f:
+        fixture = orjson.loads(f.read())
+    chain, current_price, snapshot = load_option_chain_fixture(FIXTURE)
+
+    surface = build_volatility_surface(price_option_chain(chain, current_price, fixture["interest_rate"], 0.2,
+                                                          snapshot), current_price)
+
+    expected = {(contract["strike"], contract["expiration"]): contract["impliedVolatility"]
+                for contract in fixture["contracts"]}
+    assert list(surface.columns) == sorted({contract["expiration"] for contract in fixture["contracts"]})
+    for strike in surface.index:
+        for expiration in surface.columns:
+            assert abs(surface.loc[strike, expiration] - expected[strike, expiration]) < 1e-6
@@ -0,0 +1,55 @@
+import warnings
+import numpy as np
+import pytest
+from src.core.black_scholes_model import BlackScholesModel
+from src.core.option_portfolio import OptionPortfolio, PositionLeg, strategy_legs, SCENARIO_KEYS
+
+
+def test_single_leg_matches_black_scholes():
+    portfolio = OptionPortfolio([PositionLeg("call", 2, 105.0, 0.5, 0.25)], current_price=100.0, interest_rate=0.03)
+    scenarios = portfolio.evaluate_scenarios([-0.1, 0.0, 0.1], [0.0, 0.05], [0.0, 0.1])
+
+    for key in SCENARIO_KEYS:
+        assert scenarios[key].shape == (3, 2, 2)
+    call_price, _ = BlackScholesModel(0.4, 105.0, 110.0, 0.3, 0.03).calculate_prices()
+    assert scenarios["value"][2, 1, 1] == pytest.approx(2 * call_price)
+    assert scenarios["pnl"][1, 0, 0] == pytest.approx(0.0)
+
+
+def test_expired_legs_use_intrinsic_value_without_warnings():
+    legs = [PositionLeg("call", 1, 100.0, 0.1, 0.2), PositionLeg("put", 1, 100.0, 0.1, 0.2)]
+    portfolio = OptionPortfolio(legs, current_price=100.0, interest_rate=0.05)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        scenarios = portfolio.evaluate_scenarios([-0.2, 0.0, 0.2], [-0.5, 0.0], [0.1, 0.5])
+
+    # A straddle at expiry is worth |S - K| and has no Greeks
+    assert np.allclose(scenarios["value"][:, :, 1], [[20.0, 20.0], [0.0, 0.0], [20.0, 20.0]])
+    for key in ("delta", "gamma", "vega", "theta"):
+        assert np.all(scenarios[key][:, :, 1] == 0.0)
+
+
+def test_covered_call_is_long_stock_short_call():
+    legs = strategy_legs("Covered Call", 100.0, 0.25, 0.2)
+    assert [(leg.leg_type, leg.quantity, leg.strike) for leg in legs] == [("stock", 100, 0.0), ("call", -100, 105.0)]
+
+    scenarios = OptionPortfolio(legs, current_price=100.0, interest_rate=0.05).evaluate_scenarios([0.0], [0.0], [0.0])
+    call_delta = BlackScholesModel(0.25, 105.0, 100.0, 0.2, 0.05).calculate_greeks()["call_delta"]
+    assert scenarios["delta"][0, 0, 0] == pytest.approx(100 * (1 - call_delta))
+
+
+@pytest.mark.parametrize("strategy, legs", [
+    ("Bull Call Spread", [("call", 1, 100.0), ("call", -1, 105.0)]),
+    ("Bear Put Spread", [("put", 1, 100.0), ("put", -1, 95.0)]),
+    ("Long Straddle", [("call", 1, 100.0), ("put", 1, 100.0)]),
+    ("Iron Condor", [("put", 1, 90.0), ("put", -1, 95.0), ("call", -1, 105.0), ("call", 1, 110.0)]),
+])
+def test_strategy_legs(strategy, legs):
+    built = strategy_legs(strategy, 100.0, 0.25, 0.2)
+    assert [(leg.leg_type, leg.quantity, leg.strike) for leg in built] == legs
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        strategy_legs("Butterfly", 100.0, 0.25, 0.2)
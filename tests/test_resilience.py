@@ -0,0 +1,57 @@
+import pytest
+from src.utils.resilience import CircuitBreaker, call_with_resilience
+
+
+def failing(error):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise error
+    return fn, calls
+
+
+def test_breaker_counts_one_failure_per_call():
+    breaker = CircuitBreaker(failure_threshold=2)
+    fn, calls = failing(ConnectionError("down"))
+
+    with pytest.raises(ConnectionError):
+        call_with_resilience(fn, breaker=breaker, retries=3, backoff=0)
+
+    assert len(calls) == 4
+    assert breaker.state == "closed"
+    with pytest.raises(ConnectionError):
+        call_with_resilience(fn, breaker=breaker, retries=3, backoff=0)
+    assert breaker.state == "open"
+
+
+def test_not_found_is_neither_retried_nor_counted():
+    breaker = CircuitBreaker(failure_threshold=1)
+    fn, calls = failing(KeyError("no such symbol"))
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            call_with_resilience(fn, breaker=breaker, retries=3, backoff=0)
+
+    assert len(calls) == 3
+    assert breaker.state == "closed"
+
+
+def test_not_found_leaves_the_breaker_state_unchanged():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0)
+    down, _ = failing(ConnectionError("down"))
+    not_found, _ = failing(KeyError("no such symbol"))
+
+    with pytest.raises(ConnectionError):
+        call_with_resilience(down, breaker=breaker, retries=0, backoff=0)
+    with pytest.raises(KeyError):
+        call_with_resilience(not_found, breaker=breaker, retries=0, backoff=0)
+    with pytest.raises(ConnectionError):
+        call_with_resilience(down, breaker=breaker, retries=0, backoff=0)
+    assert breaker.state == "half-open"
+
+    # The half-open trial is released, so the next call may probe again
+    with pytest.raises(KeyError):
+        call_with_resilience(not_found, breaker=breaker, retries=0, backoff=0)
+    assert call_with_resilience(lambda: "ok", breaker=breaker) == "ok"
+    assert breaker.state == "closed"
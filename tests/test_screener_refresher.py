@@ -0,0 +1,65 @@
+import pytest
+import pandas as pd
+from src.utils.screener_refresher import ScreenerRefresher
+
+INDICES = [{"symbol": "^GSPC", "longName": "S&P 500"}, {"symbol": "^FTSE", "longName": "FTSE 100"},
+           {"symbol": "^N225", "longName": "Nikkei 225"}]
+
+
+class StubProvider:
+    def __init__(self):
+        self.closes = {"^GSPC": [100.0, 101.0], "^FTSE": [50.0, 49.0], "^N225": [10.0, 11.0]}
+        self.failing = set()
+        self.screen_error = None
+
+    def history(self, symbol, period="max", start=None):
+        if symbol in self.failing:
+            raise ConnectionError(f"{symbol} unavailable")
+        return pd.DataFrame({"Close": self.closes[symbol]})
+
+    def screen(self, query, **kwargs):
+        if self.screen_error is not None:
+            raise self.screen_error
+        return {"quotes": [{"symbol": query}]}
+
+
+def test_refresh_publishes_screeners_and_indices():
+    refresher = ScreenerRefresher(StubProvider(), indices=INDICES)
+    refresher.refresh()
+
+    snapshot = refresher.wait_for_snapshot(0)
+    assert snapshot.gainers == ({"symbol": "day_gainers"},)
+    assert snapshot.losers == ({"symbol": "day_losers"},)
+    assert [quote["symbol"] for quote in snapshot.indices] == ["^GSPC", "^FTSE", "^N225"]
+    assert snapshot.indices[1]["regularMarketChangePercent"] == pytest.approx(-2.0)
+
+
+def test_failing_or_empty_index_keeps_its_previous_quote():
+    provider = StubProvider()
+    refresher = ScreenerRefresher(provider, indices=INDICES)
+    refresher.refresh()
+    first = refresher.snapshot
+
+    provider.failing.add("^GSPC")
+    provider.closes["^FTSE"] = []
+    provider.closes["^N225"] = [10.0, 12.0]
+    refresher.refresh()
+
+    indices = refresher.snapshot.indices
+    assert indices[0] == first.indices[0] and indices[1] == first.indices[1]
+    assert indices[2]["regularMarketPrice"] == 12.0
+    assert refresher.last_error is None
+
+
+def test_failed_screen_keeps_the_previous_snapshot():
+    provider = StubProvider()
+    refresher = ScreenerRefresher(provider, indices=INDICES)
+    refresher.refresh()
+    first = refresher.snapshot
+
+    provider.screen_error = ConnectionError("rate limited")
+    refresher.refresh(include_indices=False)
+
+    assert refresher.snapshot.gainers == first.gainers
+    assert refresher.snapshot.indices == first.indices
+    assert isinstance(refresher.last_error, ConnectionError)
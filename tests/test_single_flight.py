@@ -0,0 +1,68 @@
+import time
+import threading
+from src.utils.single_flight import SingleFlight
+
+
+def run_concurrently(flights, num_threads, fn):
+    results, errors = [], []
+    started = threading.Barrier(num_threads)
+
+    def caller():
+        started.wait()
+        try:
+            results.append(flights.do("key", fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def release_after_calls(flights, calls, release, timeout=5.0):
+    def watch():
+        deadline = time.monotonic() + timeout
+        while flights.stats()["calls"] < calls and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def test_concurrent_callers_share_one_execution():
+    flights = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def loader():
+        executions.append(1)
+        release.wait(5)
+        return {"symbol": "AAPL"}
+
+    # Hold the leader until every other caller has joined its flight
+    release_after_calls(flights, 8, release)
+    results, errors = run_concurrently(flights, 8, loader)
+
+    assert errors == []
+    assert results == [{"symbol": "AAPL"}] * 8
+    assert len(executions) == 1
+    assert flights.stats() == {"calls": 8, "executions": 1, "coalesced": 7, "in_flight": 0}
+
+
+def test_errors_propagate_to_every_caller_and_are_not_cached():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ConnectionError("upstream down")
+
+    release_after_calls(flights, 4, release)
+    results, errors = run_concurrently(flights, 4, failing)
+
+    assert results == []
+    assert len(errors) == 4 and all(isinstance(e, ConnectionError) for e in errors)
+    assert flights.do("key", lambda: "recovered") == "recovered"
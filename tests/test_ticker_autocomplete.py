@@ -0,0 +1,43 @@
+import pandas as pd
+from src.utils.ticker_autocomplete import TickerAutocomplete
+from src.utils.ticker_search import TickerSearchIndex
+
+
+def autocomplete():
+    df = pd.DataFrame({
+        "Ticker": ["AAP", "AAPL", "AAPB", "APLE", "MSFT"],
+        "Company Name": ["Advance Auto Parts", "Apple Inc.", "Apple Leveraged ETF", "Apple Hospitality REIT",
+                         "Microsoft Corporation"],
+        "Exchange Name": "New York Stock Exchange",
+        "Exchange Symbol": "NYSE",
+    })
+    return TickerAutocomplete(df, TickerSearchIndex(df))
+
+
+def test_tiers_rank_before_popularity():
+    popularity = {"AAPL": 10_000, "APLE": 10_000}
+
+    suggestions = autocomplete().suggest("AAP", popularity=popularity)
+
+    assert [(item["ticker"], item["match"]) for item in suggestions[:3]] == \
+        [("AAP", "exact"), ("AAPL", "prefix"), ("AAPB", "prefix")]
+    assert all(item["match"] == "name" for item in suggestions[3:])
+
+
+def test_popularity_breaks_ties_within_a_tier():
+    assert [item["ticker"] for item in autocomplete().suggest("AAP")[1:3]] == ["AAPB", "AAPL"]
+    assert [item["ticker"] for item in autocomplete().suggest("AAP", popularity={"AAPL": 5})[1:3]] == ["AAPL", "AAPB"]
+
+
+def test_popularity_outweighs_a_slightly_closer_name_match():
+    df = pd.DataFrame({
+        "Ticker": ["BOFA", "BOAM"],
+        "Company Name": ["Bank of America", "Bank of Amerika Holdings"],
+        "Exchange Name": "New York Stock Exchange",
+        "Exchange Symbol": "NYSE",
+    })
+    search = TickerAutocomplete(df, TickerSearchIndex(df))
+
+    assert [item["ticker"] for item in search.suggest("bank of amerika")] == ["BOAM", "BOFA"]
+    assert [item["ticker"] for item in search.suggest("bank of amerika", popularity={"BOFA": 500})] == \
+        ["BOFA", "BOAM"]
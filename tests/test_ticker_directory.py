@@ -0,0 +1,64 @@
+import os
+import time
+import orjson
+import pytest
+from src.utils.ticker_directory import STALE_STAGING_SECONDS, load_ticker_directory, read_ticker_version, \
+    write_ticker_directory
+
+
+def records(*tickers):
+    return [{"ticker": ticker, "company_name": f"{ticker} Inc", "exchange_code": "NYSE",
+             "exchange_name": "New York Stock Exchange"} for ticker in tickers]
+
+
+def test_versions_are_published_through_the_root_pointer(tmp_path):
+    root = str(tmp_path)
+    first = write_ticker_directory(records("A", "B"), root)
+    old_view = load_ticker_directory(root)
+    second = write_ticker_directory(records("A", "B", "C"), root)
+    third = write_ticker_directory(records("D"), root)
+
+    assert first != second != third
+    assert read_ticker_version(root) == third
+    assert load_ticker_directory(root).tickers == ["D"]
+    assert old_view.tickers == ["A", "B"] and list(old_view.exchange) == [0, 0]
+    assert load_ticker_directory(root, second).tickers == ["A", "B", "C"]
+    assert sorted(name for name in os.listdir(root) if os.path.isdir(os.path.join(root, name))) == \
+        sorted([second, third])
+
+
+def test_reads_and_replaces_unversioned_layout(tmp_path):
+    root = str(tmp_path)
+    version = write_ticker_directory(records("A", "B"), root)
+    for name in os.listdir(os.path.join(root, version)):
+        os.replace(os.path.join(root, version, name), os.path.join(root, name))
+    os.rmdir(os.path.join(root, version))
+    with open(os.path.join(root, "meta.json"), "rb") as f:
+        meta = orjson.loads(f.read())
+    del meta["directory"]
+    with open(os.path.join(root, "meta.json"), "wb") as f:
+        f.write(orjson.dumps(meta))
+
+    assert load_ticker_directory(root).tickers == ["A", "B"]
+    assert load_ticker_directory(root, version).tickers == ["A", "B"]
+
+    write_ticker_directory(records("C"), root)
+    assert load_ticker_directory(root).tickers == ["C"]
+    assert sorted(os.listdir(root)) == sorted([read_ticker_version(root), "meta.json"])
+
+
+def test_missing_version_raises_and_stale_staging_is_swept(tmp_path):
+    root = str(tmp_path)
+    first = write_ticker_directory(records("A"), root)
+    write_ticker_directory(records("B"), root)
+    write_ticker_directory(records("C"), root)
+    with pytest.raises(FileNotFoundError):
+        load_ticker_directory(root, first)
+
+    stale, fresh = tmp_path / ".stale.1.tmp", tmp_path / ".fresh.2.tmp"
+    stale.mkdir()
+    fresh.mkdir()
+    os.utime(stale, (time.time() - STALE_STAGING_SECONDS - 1,) * 2)
+    write_ticker_directory(records("D"), root)
+
+    assert not stale.exists() and fresh.exists()
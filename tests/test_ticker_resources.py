@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils import ticker_resources
+from src.utils.ticker_resources import get_sort_orders, sort_rows
+
+DIRECTORY = pd.DataFrame({
+    "Ticker": ["msft", "AAPL", "bac", "Amzn"],
+    "Company Name": ["Microsoft", "apple", "Bank of America", "Amazon"],
+})
+
+
+@pytest.fixture
+def sort_orders(monkeypatch):
+    monkeypatch.setattr(ticker_resources, "load_clean_ticker_data", lambda version: DIRECTORY)
+    get_sort_orders.clear()
+    yield get_sort_orders("test-version")
+    get_sort_orders.clear()
+
+
+def test_sort_orders_are_case_insensitive(sort_orders):
+    assert set(sort_orders) == {"Ticker", "Company Name"}
+    assert DIRECTORY["Ticker"].iloc[sort_orders["Ticker"]].tolist() == ["AAPL", "Amzn", "bac", "msft"]
+    assert DIRECTORY["Company Name"].iloc[sort_orders["Company Name"]].tolist() == \
+        ["Amazon", "apple", "Bank of America", "Microsoft"]
+
+
+@pytest.mark.parametrize("rows, descending, expected", [
+    ([0, 1, 2, 3], False, ["AAPL", "Amzn", "bac", "msft"]),
+    ([0, 1, 2, 3], True, ["msft", "bac", "Amzn", "AAPL"]),
+    ([0, 2, 3], False, ["Amzn", "bac", "msft"]),
+    ([2, 0], True, ["msft", "bac"]),
+    ([], False, []),
+])
+def test_sort_rows_keeps_only_matching_rows(sort_orders, rows, descending, expected):
+    ordered = sort_rows(np.array(rows, dtype=int), sort_orders["Ticker"], len(DIRECTORY), descending)
+
+    assert DIRECTORY["Ticker"].iloc[ordered].tolist() == expected